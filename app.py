@@ -1,4 +1,4 @@
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_file
 from flask_cors import CORS
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
@@ -7,11 +7,21 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.colors import black, red, blue
 import os
-import tempfile
 import json
+import queue
+import time
 from datetime import datetime
 import logging
 
+from artifact_store import ArtifactStore
+from print_queue import PrintJobQueue, JOB_DONE
+from spool_backends import create_spool_backend
+from printer_registry import printer_registry
+from event_stream import EventBroadcaster, event_stream_response
+from idempotency import IdempotencyCache, idempotent, idempotent_stream
+from label_settings import load_label_settings
+from wsgi_server import serve, server_options
+
 app = Flask(__name__)
 CORS(app)
 
@@ -24,18 +34,45 @@ LABEL_WIDTH = 10 * cm
 LABEL_HEIGHT = 5 * cm
 BULK_SHEET_PAGE_SIZE = A4
 
+# 일괄 인쇄 작업 완료 대기 시간 (초)
+BATCH_JOB_TIMEOUT = 120
+# 스트리밍 일괄 인쇄에서 인쇄 작업 하나에 담는 라벨 수
+# 프린터는 작업 단위로만 완료를 알려주므로 1이면 라벨마다 결과가 바로 전달됨
+# (대신 라벨마다 PDF 생성/스풀이 따로 일어나므로 많은 라벨을 한 번에 인쇄할 때는 /api/print/batch가 빠름)
+BATCH_STREAM_CHUNK = 1
+
 class LabelPrinter:
-    def __init__(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def create_label_pdf(self, data):
-        """라벨 PDF 생성"""
-        # 임시 PDF 파일 생성
-        pdf_path = os.path.join(self.temp_dir, f"label_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
-        
-        # PDF 캔버스 생성
-        c = canvas.Canvas(pdf_path, pagesize=(LABEL_WIDTH, LABEL_HEIGHT))
+    def __init__(self, spool_backend=None, artifacts=None):
+        # 임시 PDF 저장소 (고유 파일 이름, 오래된 파일 자동 정리)
+        self.artifacts = artifacts or ArtifactStore()
+        self.temp_dir = self.artifacts.root
+        # 스풀 백엔드 (테스트에서는 FileSinkBackend로 교체 가능)
+        self.spool_backend = spool_backend or create_spool_backend()
+    
+    def close(self):
+        """종료 시 임시 PDF 정리"""
+        self.artifacts.close()
         
+    def create_label_pdf(self, data, reuse=False):
+        """라벨 PDF 생성 (reuse=True이면 방금 같은 내용으로 만든 파일 재사용 - 미리보기용)"""
+        def build(pdf_path):
+            c = canvas.Canvas(pdf_path, pagesize=(LABEL_WIDTH, LABEL_HEIGHT))
+            self.draw_label_page(c, data)
+            c.save()
+        return self.artifacts.create('label', build, data=data, reuse=reuse)
+    
+    def create_batch_label_pdf(self, labels):
+        """여러 라벨을 페이지로 담은 PDF 하나 생성 (라벨 1개 = 1페이지)"""
+        def build(pdf_path):
+            c = canvas.Canvas(pdf_path, pagesize=(LABEL_WIDTH, LABEL_HEIGHT))
+            for label_data in labels:
+                self.draw_label_page(c, label_data)
+                c.showPage()
+            c.save()
+        return self.artifacts.create('label_batch', build)
+    
+    def draw_label_page(self, c, data):
+        """캔버스의 현재 페이지에 라벨 하나 그리기"""
         # 폰트 설정 (한글 지원을 위해 기본 폰트 사용)
         c.setFont("Helvetica-Bold", 16)
         
@@ -105,15 +142,14 @@ class LabelPrinter:
         # 인쇄 시간 (우측 하단)
         c.setFont("Helvetica", 8)
         c.drawString(LABEL_WIDTH-3*cm, 0.5*cm, f"시간: {datetime.now().strftime('%H:%M:%S')}")
-        
-        c.save()
-        return pdf_path
     
-    def create_bulk_production_sheet_pdf(self, data=None):
-        """벌크 생산 시트 PDF 생성"""
+    def create_bulk_production_sheet_pdf(self, data=None, reuse=False):
+        """벌크 생산 시트 PDF 생성 (reuse=True이면 방금 같은 내용으로 만든 파일 재사용 - 미리보기용)"""
         data = data or {}
-        pdf_path = os.path.join(self.temp_dir, f"bulk_sheet_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
-        
+        return self.artifacts.create('bulk_sheet', lambda pdf_path: self._draw_bulk_sheet_pdf(pdf_path, data),
+                                     data=data, reuse=reuse)
+    
+    def _draw_bulk_sheet_pdf(self, pdf_path, data):
         c = canvas.Canvas(pdf_path, pagesize=BULK_SHEET_PAGE_SIZE)
         page_width, page_height = BULK_SHEET_PAGE_SIZE
         margin = 1.6 * cm
@@ -260,27 +296,15 @@ class LabelPrinter:
         c.save()
         return pdf_path
     
-    def print_label(self, pdf_path, printer_name=None):
-        """라벨 인쇄"""
+    def print_label(self, pdf_path, printer_name=None, copies=1):
+        """라벨 인쇄 (지정 프린터 스풀러로 직접 전송)"""
         try:
-            # CUPS를 통한 인쇄 (Linux/macOS)
-            if os.name == 'posix':
-                import subprocess
-                cmd = ['lp']
-                if printer_name:
-                    cmd.extend(['-d', printer_name])
-                cmd.append(pdf_path)
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0:
-                    logger.info(f"라벨이 성공적으로 인쇄되었습니다: {pdf_path}")
-                    return True
-                else:
-                    logger.error(f"인쇄 실패: {result.stderr}")
-                    return False
+            success = self.spool_backend.spool_file(pdf_path, printer_name, copies=copies)
+            if success:
+                logger.info(f"라벨이 성공적으로 인쇄되었습니다: {pdf_path}")
             else:
-                # Windows의 경우
-                os.startfile(pdf_path, "print")
-                return True
+                logger.error(f"인쇄 실패: {pdf_path}")
+            return success
         except Exception as e:
             logger.error(f"인쇄 중 오류 발생: {str(e)}")
             return False
@@ -288,6 +312,21 @@ class LabelPrinter:
 # 전역 프린터 인스턴스
 printer = LabelPrinter()
 
+# 전역 인쇄 작업 큐 (프린터별 워커)
+print_queue = PrintJobQueue(default_printer=printer.spool_backend.default_printer)
+
+# 서버 설정 (label_size.txt)
+server_settings = server_options(load_label_settings())
+
+# /api/events 구독자에게 작업 진행 상황과 프린터 목록 변경을 푸시
+# (스트림 하나가 서버 스레드 하나를 점유하므로 스레드의 절반까지만 허용)
+events = EventBroadcaster(max_subscribers=max(1, server_settings['threads'] // 2))
+print_queue.add_listener(lambda job: events.publish('job', job.to_dict()))
+
+# 멱등성 키 -> 응답 (모바일 재요청으로 같은 라벨이 두 번 인쇄되지 않도록)
+idempotency_cache = IdempotencyCache()
+printer_registry.add_listener(lambda printers: events.publish('printers', printer_registry.snapshot()))
+
 @app.route('/')
 def index():
     """메인 페이지"""
@@ -493,6 +532,7 @@ def index():
     """
 
 @app.route('/api/print', methods=['POST'])
+@idempotent(idempotency_cache)
 def print_label():
     """라벨 인쇄 API (모바일용)"""
     try:
@@ -538,30 +578,28 @@ def print_label():
         # 프린터 이름이 있으면 사용
         printer_name = data.get('printer')
         
-        # PDF 생성
-        pdf_path = printer.create_label_pdf(data)
-        
-        # 인쇄 실행
-        success = printer.print_label(pdf_path, printer_name=printer_name)
+        # 인쇄 작업 등록 (PDF 생성과 인쇄는 프린터별 워커에서 처리)
+        job = print_queue.submit(
+            printer_name,
+            render=lambda: printer.create_label_pdf(data),
+            spool=lambda pdf_path: printer.print_label(pdf_path, printer_name=printer_name),
+            data=data
+        )
         
-        if success:
-            return jsonify({
-                'success': True, 
-                'message': '라벨이 성공적으로 인쇄되었습니다.',
-                'data': {
-                    'net_weight': data['net_weight'],
-                    'total_weight': data['total_weight'],
-                    'pallet_weight': data['pallet_weight'],
-                    'extra_weight': data.get('extra_weight', '0'),
-                    'print_time': datetime.now().isoformat()
-                }
-            })
-        else:
-            return jsonify({
-                'success': False, 
-                'error': 'PRINT_FAILED',
-                'message': '인쇄에 실패했습니다. 프린터 설정을 확인해주세요.'
-            }), 500
+        return jsonify({
+            'success': True, 
+            'message': '라벨 인쇄 요청이 접수되었습니다.',
+            'job_id': job.job_id,
+            'status': job.status,
+            'data': {
+                'net_weight': data['net_weight'],
+                'total_weight': data['total_weight'],
+                'pallet_weight': data['pallet_weight'],
+                'extra_weight': data.get('extra_weight', '0'),
+                'job_id': job.job_id,
+                'print_time': datetime.now().isoformat()
+            }
+        }), 202
             
     except Exception as e:
         logger.error(f"라벨 인쇄 중 오류: {str(e)}")
@@ -615,7 +653,7 @@ def preview_bulk_sheet():
         if not data.get('date'):
             data['date'] = datetime.now().strftime('%Y-%m-%d')
         
-        pdf_path = printer.create_bulk_production_sheet_pdf(data)
+        pdf_path = printer.create_bulk_production_sheet_pdf(data, reuse=True)
         return send_file(pdf_path, as_attachment=False, download_name='bulk_sheet_preview.pdf')
     except Exception as e:
         logger.error(f"벌크 생산 시트 미리보기 생성 중 오류: {str(e)}")
@@ -625,7 +663,103 @@ def preview_bulk_sheet():
             'message': f'미리보기를 생성할 수 없습니다: {str(e)}'
         }), 500
 
+def validate_batch_label(index, label_data):
+    """일괄 인쇄 라벨 하나 검증 및 기본값 설정 - 오류가 있으면 결과 dict, 없으면 None"""
+    try:
+        # 필수 데이터 검증
+        if not label_data.get('total_weight') or not label_data.get('pallet_weight'):
+            return {
+                'index': index,
+                'success': False,
+                'error': 'WEIGHT_REQUIRED',
+                'message': '총무게와 팔렛무게 정보가 필요합니다.'
+            }
+        
+        # 기본값 설정
+        if not label_data.get('date'):
+            label_data['date'] = datetime.now().strftime('%Y-%m-%d')
+        if not label_data.get('extra_weight'):
+            label_data['extra_weight'] = '0'
+        
+        # 순수무게 계산
+        try:
+            total_weight = float(label_data['total_weight'])
+            pallet_weight = float(label_data['pallet_weight'])
+            extra_weight = float(label_data.get('extra_weight', 0))
+            net_weight = total_weight - pallet_weight - extra_weight
+            
+            if net_weight <= 0:
+                return {
+                    'index': index,
+                    'success': False,
+                    'error': 'INVALID_WEIGHT',
+                    'message': '순수무게가 0 이하입니다.'
+                }
+            
+            label_data['net_weight'] = f"{net_weight:.1f}"
+        except (ValueError, TypeError):
+            return {
+                'index': index,
+                'success': False,
+                'error': 'INVALID_WEIGHT_FORMAT',
+                'message': '무게 형식이 올바르지 않습니다.'
+            }
+        return None
+            
+    except Exception as e:
+        logger.error(f"라벨 {index} 인쇄 중 오류: {str(e)}")
+        return {
+            'index': index,
+            'success': False,
+            'error': str(e)
+        }
+
+def submit_batch_job(printer_name, batch, on_done=None):
+    """라벨 여러 개를 여러 페이지 PDF 하나로 만들어 인쇄 작업 하나로 등록"""
+    batch_labels = [label_data for _, label_data in batch]
+    return print_queue.submit(
+        printer_name,
+        render=lambda: printer.create_batch_label_pdf(batch_labels),
+        spool=lambda pdf_path: printer.print_label(pdf_path, printer_name=printer_name),
+        data={'labels': len(batch_labels)},
+        on_done=on_done
+    )
+
+def batch_label_results(batch, job):
+    """인쇄 작업에 포함된 라벨들의 결과 (같은 작업의 라벨은 성공/실패를 함께 가짐)"""
+    success = job.status == JOB_DONE
+    results = []
+    for i, label_data in batch:
+        result = {
+            'index': i,
+            'success': success,
+            'job_id': job.job_id,
+            'net_weight': label_data['net_weight'],
+            'total_weight': label_data['total_weight'],
+            'pallet_weight': label_data['pallet_weight']
+        }
+        if not success:
+            result['error'] = job.error or f'인쇄 작업이 완료되지 않았습니다. (상태: {job.status})'
+        results.append(result)
+    return results
+
+def ndjson_line(payload):
+    """NDJSON 한 줄 (스트리밍 응답용)"""
+    return json.dumps(payload, ensure_ascii=False) + '\n'
+
+def batch_summary(total, success_count):
+    return {
+        'success': success_count > 0,
+        'message': f'{success_count}/{total}개 라벨이 인쇄되었습니다.',
+        'summary': {
+            'total': total,
+            'success': success_count,
+            'failed': total - success_count
+        }
+    }
+
 @app.route('/api/print/batch', methods=['POST'])
+@idempotent(idempotency_cache)
 def print_batch_labels():
     """여러 라벨 일괄 인쇄 API"""
     try:
@@ -641,87 +775,36 @@ def print_batch_labels():
         
         results = []
         success_count = 0
+        batches = {}
         
         for i, label_data in enumerate(labels):
-            try:
-                # 필수 데이터 검증
-                if not label_data.get('total_weight') or not label_data.get('pallet_weight'):
-                    results.append({
-                        'index': i,
-                        'success': False,
-                        'error': 'WEIGHT_REQUIRED',
-                        'message': '총무게와 팔렛무게 정보가 필요합니다.'
-                    })
-                    continue
-                
-                # 기본값 설정
-                if not label_data.get('date'):
-                    label_data['date'] = datetime.now().strftime('%Y-%m-%d')
-                if not label_data.get('extra_weight'):
-                    label_data['extra_weight'] = '0'
-                
-                # 순수무게 계산
-                try:
-                    total_weight = float(label_data['total_weight'])
-                    pallet_weight = float(label_data['pallet_weight'])
-                    extra_weight = float(label_data.get('extra_weight', 0))
-                    net_weight = total_weight - pallet_weight - extra_weight
-                    
-                    if net_weight <= 0:
-                        results.append({
-                            'index': i,
-                            'success': False,
-                            'error': 'INVALID_WEIGHT',
-                            'message': '순수무게가 0 이하입니다.'
-                        })
-                        continue
-                    
-                    label_data['net_weight'] = f"{net_weight:.1f}"
-                except (ValueError, TypeError):
-                    results.append({
-                        'index': i,
-                        'success': False,
-                        'error': 'INVALID_WEIGHT_FORMAT',
-                        'message': '무게 형식이 올바르지 않습니다.'
-                    })
-                    continue
-                
-                # 프린터 이름이 있으면 사용
-                printer_name = label_data.get('printer')
-                
-                # PDF 생성 및 인쇄
-                pdf_path = printer.create_label_pdf(label_data)
-                success = printer.print_label(pdf_path, printer_name=printer_name)
-                
-                results.append({
-                    'index': i,
-                    'success': success,
-                    'net_weight': label_data['net_weight'],
-                    'total_weight': label_data['total_weight'],
-                    'pallet_weight': label_data['pallet_weight']
-                })
-                
-                if success:
-                    success_count += 1
-                    
-            except Exception as e:
-                logger.error(f"라벨 {i} 인쇄 중 오류: {str(e)}")
-                results.append({
-                    'index': i,
-                    'success': False,
-                    'error': str(e)
-                })
+            error = validate_batch_label(i, label_data)
+            if error:
+                results.append(error)
+                continue
+            # 프린터별로 모아서 한 문서로 인쇄 (프린터 이름이 없으면 기본 프린터)
+            batches.setdefault(label_data.get('printer'), []).append((i, label_data))
         
-        return jsonify({
-            'success': success_count > 0,
-            'message': f'{success_count}/{len(labels)}개 라벨이 인쇄되었습니다.',
-            'results': results,
-            'summary': {
-                'total': len(labels),
-                'success': success_count,
-                'failed': len(labels) - success_count
-            }
-        })
+        # 프린터마다 여러 페이지 PDF 하나를 만들어 인쇄 작업 하나로 전송
+        # 모든 프린터의 작업을 먼저 등록해 프린터별 작업자가 동시에 처리하도록 함
+        jobs = [(printer_name, batch, submit_batch_job(printer_name, batch))
+                for printer_name, batch in batches.items()]
+        # 전체 대기 시간은 BATCH_JOB_TIMEOUT 하나로 제한
+        deadline = time.monotonic() + BATCH_JOB_TIMEOUT
+        for printer_name, batch, job in jobs:
+            job.wait(max(0, deadline - time.monotonic()))
+            results.extend(batch_label_results(batch, job))
+            
+            if job.status == JOB_DONE:
+                success_count += len(batch)
+            else:
+                logger.error(f"일괄 인쇄 작업 실패 ({printer_name or '기본 프린터'}): {job.error}")
+        
+        results.sort(key=lambda result: result['index'])
+        
+        response = batch_summary(len(labels), success_count)
+        response['results'] = results
+        return jsonify(response)
         
     except Exception as e:
         logger.error(f"일괄 인쇄 중 오류: {str(e)}")
@@ -731,6 +814,68 @@ def print_batch_labels():
             'message': f'서버 오류가 발생했습니다: {str(e)}'
         }), 500
 
+@app.route('/api/print/batch/stream', methods=['POST'])
+@idempotent_stream(idempotency_cache)
+def print_batch_labels_stream():
+    """여러 라벨 일괄 인쇄 API (NDJSON 스트리밍)
+    
+    라벨 결과를 인쇄가 끝나는 대로 한 줄씩 보내고 마지막에 요약 한 줄을 보냅니다.
+    라벨마다 인쇄 작업 하나로 등록하므로(BATCH_STREAM_CHUNK) 라벨이 끝날 때마다 결과가 전달됩니다.
+    같은 멱등성 키로 다시 요청하면 인쇄하지 않고 처음 결과 전체를 한 번에 돌려줍니다.
+    """
+    data = request.get_json(silent=True) or {}
+    labels = data.get('labels', [])
+    
+    if not labels:
+        return jsonify({
+            'success': False,
+            'error': 'NO_LABELS',
+            'message': '인쇄할 라벨이 없습니다.'
+        }), 400
+    
+    def generate():
+        success_count = 0
+        batches = {}
+        
+        # 검증 실패 라벨은 바로 전송
+        for i, label_data in enumerate(labels):
+            error = validate_batch_label(i, label_data)
+            if error:
+                yield ndjson_line({'type': 'label', **error})
+                continue
+            batches.setdefault(label_data.get('printer'), []).append((i, label_data))
+        
+        # 프린터마다 청크 단위 작업을 모두 등록 (같은 프린터의 작업은 순서대로 처리됨)
+        finished = queue.Queue()
+        pending = {}
+        for printer_name, batch in batches.items():
+            for start in range(0, len(batch), BATCH_STREAM_CHUNK):
+                chunk = batch[start:start + BATCH_STREAM_CHUNK]
+                job = submit_batch_job(printer_name, chunk, on_done=finished.put)
+                pending[job.job_id] = (job, chunk)
+        
+        # 끝난 작업부터 라벨 결과 전송
+        while pending:
+            try:
+                job = finished.get(timeout=BATCH_JOB_TIMEOUT)
+            except queue.Empty:
+                break
+            job, chunk = pending.pop(job.job_id)
+            if job.status == JOB_DONE:
+                success_count += len(chunk)
+            for result in batch_label_results(chunk, job):
+                yield ndjson_line({'type': 'label', **result})
+        
+        # 제한 시간 안에 끝나지 않은 작업
+        for job, chunk in pending.values():
+            for result in batch_label_results(chunk, job):
+                yield ndjson_line({'type': 'label', **result})
+        
+        yield ndjson_line({'type': 'summary', **batch_summary(len(labels), success_count)})
+    
+    return Response(generate(), mimetype='application/x-ndjson',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/preview', methods=['POST'])
 def preview_label():
     """라벨 미리보기"""
@@ -743,8 +888,8 @@ def preview_label():
         if not data.get('product_name'):
             data['product_name'] = '제품'
         
-        # PDF 생성
-        pdf_path = printer.create_label_pdf(data)
+        # PDF 생성 (같은 내용을 연달아 미리보기하면 방금 만든 파일 재사용)
+        pdf_path = printer.create_label_pdf(data, reuse=True)
         
         return send_file(pdf_path, as_attachment=False, download_name='label_preview.pdf')
         
@@ -754,44 +899,27 @@ def preview_label():
 
 @app.route('/api/printers', methods=['GET'])
 def list_printers():
-    """사용 가능한 프린터 목록 조회 (모바일용)"""
+    """사용 가능한 프린터 목록 조회 (모바일용)
+    
+    프린터 레지스트리의 메모리 목록을 반환합니다. ?refresh=true이면 즉시 다시 조회합니다.
+    """
     try:
-        if os.name == 'posix':
-            import subprocess
-            result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True)
-            if result.returncode == 0:
-                printers = []
-                for line in result.stdout.split('\n'):
-                    if line.startswith('printer'):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            printer_name = parts[1]
-                            # 프린터 상태 확인
-                            status = 'available' if 'idle' in line else 'busy'
-                            printers.append({
-                                'name': printer_name,
-                                'status': status,
-                                'description': f'프린터 {printer_name}'
-                            })
-                return jsonify({
-                    'success': True,
-                    'printers': printers
-                })
-            else:
-                return jsonify({
-                    'success': True,
-                    'printers': []
-                })
-        else:
-            # Windows의 경우 기본 프린터만 반환
-            return jsonify({
-                'success': True,
-                'printers': [{
-                    'name': 'default',
-                    'status': 'available',
-                    'description': '기본 프린터'
-                }]
-            })
+        refresh = request.args.get('refresh', 'false').lower() == 'true'
+        snapshot = printer_registry.snapshot(refresh=refresh)
+        printers = snapshot['printers']
+        if not printers and os.name != 'posix':
+            # Windows에서 프린터를 찾지 못하면 기본 프린터 반환
+            printers = [{
+                'name': 'default',
+                'status': 'available',
+                'description': '기본 프린터'
+            }]
+        return jsonify({
+            'success': True,
+            'printers': printers,
+            'refreshed_at': snapshot['refreshed_at'],
+            'age_seconds': snapshot['age_seconds']
+        })
     except Exception as e:
         logger.error(f"프린터 목록 조회 중 오류: {str(e)}")
         return jsonify({
@@ -800,17 +928,21 @@ def list_printers():
             'message': f'프린터 목록 조회 실패: {str(e)}'
         }), 500
 
+def status_info():
+    """서버 상태 (/api/status 응답과 status 이벤트 공용)"""
+    return {
+        'status': 'running',
+        'server_time': datetime.now().isoformat(),
+        'version': '1.0.0',
+        'label_size': '10cm x 5cm',
+        'pending_jobs': print_queue.pending_count(),
+    }
+
 @app.route('/api/status', methods=['GET'])
 def server_status():
     """서버 상태 확인 (모바일용)"""
     try:
-        return jsonify({
-            'success': True,
-            'status': 'running',
-            'server_time': datetime.now().isoformat(),
-            'version': '1.0.0',
-            'label_size': '10cm x 5cm'
-        })
+        return jsonify({'success': True, **status_info()})
     except Exception as e:
         return jsonify({
             'success': False,
@@ -818,6 +950,14 @@ def server_status():
             'message': str(e)
         }), 500
 
+@app.route('/api/events', methods=['GET'])
+def event_stream():
+    """서버 상태/프린터 목록/인쇄 작업 진행 상황 SSE 스트림"""
+    return event_stream_response(events, [
+        ('status', status_info()),
+        ('printers', printer_registry.snapshot()),
+    ])
+
 @app.route('/api/status', methods=['GET'])
 def get_server_status():
     """서버 상태 확인"""
@@ -858,15 +998,24 @@ def get_printers():
 
 @app.route('/api/print/status/<label_id>', methods=['GET'])
 def get_print_status(label_id):
-    """특정 라벨의 인쇄 상태 조회"""
+    """특정 라벨의 인쇄 상태 조회 (label_id = 인쇄 작업 ID)"""
     try:
-        # 실제 구현에서는 데이터베이스에서 상태를 조회
-        # 여기서는 간단한 예제만 제공
+        job = print_queue.get(label_id)
+        if job is None:
+            return jsonify({
+                'success': False,
+                'error': 'JOB_NOT_FOUND',
+                'message': '인쇄 작업을 찾을 수 없습니다.'
+            }), 404
+        
+        job_info = job.to_dict()
         return jsonify({
             'success': True,
             'label_id': label_id,
-            'status': 'printed',
-            'print_time': datetime.now().isoformat()
+            'status': job_info['status'],
+            'error': job_info['error'],
+            'job': job_info,
+            'print_time': job_info['updated_at']
         })
     except Exception as e:
         return jsonify({
@@ -880,4 +1029,12 @@ if __name__ == '__main__':
     print("웹 브라우저에서 http://localhost:8080 을 열어주세요")
     print("모바일에서도 같은 네트워크의 IP 주소로 접속 가능합니다")
     
-    app.run(host='0.0.0.0', port=8080, debug=True)
+    # 프린터 목록은 시작 시 한 번 조회하고 백그라운드에서 갱신
+    printer_registry.start()
+    
+    # label_size.txt의 server_mode 설정에 따라 waitress 또는 Flask 개발 서버로 실행
+    try:
+        serve(app, '0.0.0.0', 8080, debug=True, **server_settings)
+    finally:
+        events.close()
+        printer.close()
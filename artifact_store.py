@@ -0,0 +1,142 @@
+"""
+인쇄용 임시 파일(PDF) 저장소
+
+라벨/벌크 시트 PDF를 고유한 이름으로 한 폴더에 만들고, 오래되었거나 용량을 넘은 파일을 정리합니다.
+- 파일 이름에 임의 값을 붙여 같은 초에 만든 요청끼리 덮어쓰지 않음
+- 시작할 때와 주기적으로 나이/용량 기준 정리, 종료할 때 이 프로세스가 만든 파일 삭제
+- 같은 내용의 미리보기를 연달아 요청하면 방금 만든 파일을 재사용
+"""
+
+import os
+import json
+import uuid
+import hashlib
+import tempfile
+import threading
+import time
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# 기본 저장 폴더 (프로세스가 바뀌어도 같은 폴더를 써야 이전 실행의 파일을 정리할 수 있음)
+DEFAULT_ARTIFACT_DIR = os.path.join(tempfile.gettempdir(), 'label_printer_artifacts')
+# 정리 기준
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+DEFAULT_MAX_AGE = 24 * 60 * 60  # 초
+# 정리 주기 (초)
+EVICT_INTERVAL = 60
+# 같은 내용이면 기존 파일을 재사용하는 시간 (초)
+REUSE_SECONDS = 60
+# 용량 정리에서 보호하는 최근 파일 (스풀 중이거나 재사용될 수 있음)
+MIN_EVICT_AGE = 2 * REUSE_SECONDS
+
+
+def content_key(data):
+    """파일 재사용 키 - 데이터 내용의 해시"""
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class ArtifactStore:
+    """임시 파일 폴더 관리"""
+
+    def __init__(self, root=DEFAULT_ARTIFACT_DIR, max_bytes=DEFAULT_MAX_BYTES, max_age=DEFAULT_MAX_AGE):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._created = set()
+        self._recent = {}  # (prefix, 내용 키) -> (경로, 생성 시각)
+        self._lock = threading.Lock()
+        self._last_evict = 0
+        os.makedirs(self.root, exist_ok=True)
+        # 이전 실행에서 남은 파일 정리
+        self.evict()
+
+    def new_path(self, prefix, suffix='.pdf'):
+        """겹치지 않는 새 파일 경로"""
+        self._maybe_evict()
+        name = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}{suffix}"
+        path = os.path.join(self.root, name)
+        with self._lock:
+            self._created.add(path)
+        return path
+
+    def create(self, prefix, build, data=None, reuse=False, suffix='.pdf'):
+        """build(path)로 파일을 만들고 경로 반환
+
+        reuse=True이면 REUSE_SECONDS 안에 같은 prefix/data로 만든 파일이 있을 때 그 파일을 반환합니다.
+        """
+        key = (prefix, content_key(data)) if reuse else None
+        if key is not None:
+            with self._lock:
+                recent = self._recent.get(key)
+            if recent and time.time() - recent[1] < REUSE_SECONDS and os.path.exists(recent[0]):
+                print(f"♻️ 최근 생성한 파일 재사용: {recent[0]}")
+                return recent[0]
+
+        path = self.new_path(prefix, suffix)
+        build(path)
+        with self._lock:
+            if key is not None:
+                self._recent[key] = (path, time.time())
+            # 만료된 재사용 항목 정리
+            now = time.time()
+            for old_key in [k for k, (_, created) in self._recent.items() if now - created >= REUSE_SECONDS]:
+                del self._recent[old_key]
+        return path
+
+    def _maybe_evict(self):
+        if time.monotonic() - self._last_evict >= EVICT_INTERVAL:
+            self.evict()
+
+    def evict(self):
+        """max_age보다 오래된 파일 삭제, 전체 용량이 max_bytes를 넘으면 오래된 파일부터 삭제"""
+        self._last_evict = time.monotonic()
+        now = time.time()
+        files = []
+        try:
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as e:
+            logger.warning(f"임시 파일 폴더 조회 실패: {e}")
+            return 0
+
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for mtime, size, path in files:
+            age = now - mtime
+            if age <= self.max_age and (total <= self.max_bytes or age < MIN_EVICT_AGE):
+                continue
+            if self._remove(path):
+                total -= size
+                removed += 1
+        if removed:
+            print(f"🧹 임시 파일 {removed}개 정리 ({self.root})")
+        return removed
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            # 다른 프로그램이 사용 중 (Windows 인쇄 등) - 다음 정리 때 다시 시도
+            return False
+        with self._lock:
+            self._created.discard(path)
+        return True
+
+    def close(self):
+        """종료 시 이 프로세스가 만든 파일 삭제"""
+        with self._lock:
+            paths = list(self._created)
+            self._recent.clear()
+        for path in paths:
+            if os.path.exists(path):
+                self._remove(path)
+            else:
+                with self._lock:
+                    self._created.discard(path)
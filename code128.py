@@ -0,0 +1,128 @@
+"""
+Code128 바코드 인코더/래스터라이저
+
+python-barcode ImageWriter로 PNG를 만들고 다시 읽어 리사이즈하는 대신,
+목표 DPI에서 정수 픽셀 모듈 폭으로 막대를 바로 그립니다.
+리사이즈가 없으므로 감열 프린터에서도 막대 경계가 흐려지지 않습니다.
+"""
+
+from functools import lru_cache
+
+# Code128 심볼 패턴 (막대/공백 폭, 모듈 단위) - 인덱스가 심볼 값
+PATTERNS = [
+    "212222", "222122", "222221", "121223", "121322", "131222", "122213", "122312",
+    "132212", "221213", "221312", "231212", "112232", "122132", "122231", "113222",
+    "123122", "123221", "223211", "221132", "221231", "213212", "223112", "312131",
+    "311222", "321122", "321221", "312212", "322112", "322211", "212123", "212321",
+    "232121", "111323", "131123", "131321", "112313", "132113", "132311", "211313",
+    "231113", "231311", "112133", "112331", "132131", "113123", "113321", "133121",
+    "313121", "211331", "231131", "213113", "213311", "213131", "311123", "311321",
+    "331121", "312113", "312311", "332111", "314111", "221411", "431111", "111224",
+    "111422", "121124", "121421", "141122", "141221", "112214", "112412", "122114",
+    "122411", "142112", "142211", "241211", "221114", "413111", "241112", "134111",
+    "111242", "121142", "121241", "114212", "124112", "124211", "411212", "421112",
+    "421211", "212141", "214121", "412121", "111143", "111341", "131141", "114113",
+    "114311", "411113", "411311", "113141", "114131", "311141", "411131", "211412",
+    "211214", "211232", "2331112",
+]
+
+START_B = 104
+START_C = 105
+CODE_B = 100
+CODE_C = 99
+STOP = 106
+
+# 기본 모듈 폭 (mm) - 일반적인 스캐너 최소 기준(0.19mm) 이상
+DEFAULT_MODULE_MM = 0.25
+# 좌우 여백 (모듈 수)
+QUIET_ZONE_MODULES = 10
+
+
+def encode(value):
+    """문자열을 Code128 심볼 값 목록으로 인코딩 (체크섬, STOP 포함)
+
+    숫자만 4자리 이상이면 Code C(2자리씩)를 사용하고,
+    홀수 자릿수의 마지막 한 자리는 Code B로 전환해서 인코딩합니다.
+    """
+    value = str(value)
+    if not value:
+        raise ValueError("바코드 값이 비어 있습니다.")
+    for char in value:
+        if not 32 <= ord(char) <= 126:
+            raise ValueError(f"Code128 B로 인코딩할 수 없는 문자: {char!r}")
+
+    symbols = []
+    if value.isdigit() and len(value) >= 4:
+        symbols.append(START_C)
+        even_length = len(value) - len(value) % 2
+        for i in range(0, even_length, 2):
+            symbols.append(int(value[i:i + 2]))
+        if even_length < len(value):
+            symbols.append(CODE_B)
+            symbols.append(ord(value[-1]) - 32)
+    else:
+        symbols.append(START_B)
+        symbols.extend(ord(char) - 32 for char in value)
+
+    checksum = symbols[0]
+    for position, symbol in enumerate(symbols[1:], start=1):
+        checksum += position * symbol
+    symbols.append(checksum % 103)
+    symbols.append(STOP)
+    return symbols
+
+
+def module_widths(value):
+    """막대/공백 폭 목록 (모듈 단위, 막대부터 시작)"""
+    widths = []
+    for symbol in encode(value):
+        widths.extend(int(w) for w in PATTERNS[symbol])
+    return widths
+
+
+def module_pixels(dpi, module_mm=DEFAULT_MODULE_MM):
+    """목표 DPI에서 모듈 한 개의 정수 픽셀 폭"""
+    return max(1, round(module_mm * dpi / 25.4))
+
+
+@lru_cache(maxsize=256)
+def code128_image(value, height, dpi, with_text=True):
+    """Code128 바코드 이미지 생성 (value, height, dpi 기준으로 메모이즈)
+
+    반환된 이미지는 캐시에 공유되므로 붙여넣기(paste)용으로만 사용합니다.
+
+    Args:
+        value: 바코드 문자열
+        height: 전체 이미지 높이 (픽셀, 하단 숫자 포함)
+        dpi: 출력 해상도 - 모듈 폭을 정수 픽셀로 맞추는 기준
+        with_text: 막대 아래에 숫자 표시 여부
+    """
+    from PIL import Image, ImageDraw
+
+    module_px = module_pixels(dpi)
+    widths = module_widths(value)
+    quiet_px = QUIET_ZONE_MODULES * module_px
+    width = sum(widths) * module_px + 2 * quiet_px
+
+    text_height = int(height * 0.2) if with_text else 0
+    bar_height = max(1, height - text_height)
+
+    img = Image.new('L', (width, height), 255)
+    draw = ImageDraw.Draw(img)
+
+    x = quiet_px
+    for index, modules in enumerate(widths):
+        run = modules * module_px
+        if index % 2 == 0:  # 짝수 인덱스 = 막대
+            draw.rectangle([x, 0, x + run - 1, bar_height - 1], fill=0)
+        x += run
+
+    if with_text and text_height > 2:
+        from label_render import font_registry
+        font = font_registry.get("Arial", max(1, int(text_height * 0.9)), bold=False)
+        left, top, right, bottom = draw.textbbox((0, 0), value, font=font)
+        text_x = (width - (right - left)) / 2 - left
+        text_y = bar_height + (text_height - (bottom - top)) / 2 - top
+        draw.text((text_x, text_y), value, fill=0, font=font)
+
+    return img
@@ -0,0 +1,166 @@
+"""
+Server-Sent Events 브로드캐스터
+
+서버 상태, 프린터 목록, 인쇄 작업 진행 상황을 /api/events로 푸시합니다.
+웹 페이지는 /api/status를 주기적으로 조회하는 대신 EventSource로 이 스트림을 구독합니다.
+
+스트림 하나가 WSGI 스레드 하나를 점유하므로 동시 구독 수를 제한하고,
+일정 시간이 지나면 스트림을 닫아 브라우저가 재연결하도록 합니다.
+"""
+
+import json
+import queue
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 연결 유지용 주석을 보내는 간격 (초)
+HEARTBEAT_INTERVAL = 15
+# 스트림 최대 유지 시간 (초) - 이후 브라우저가 retry 간격 뒤 재연결
+MAX_STREAM_SECONDS = 300
+# 브라우저 재연결 대기 시간 (밀리초)
+RETRY_MILLISECONDS = 3000
+# 구독자별 대기 이벤트 최대 수 (느린 클라이언트는 오래된 이벤트를 버림)
+SUBSCRIBER_QUEUE_SIZE = 100
+
+_CLOSE = object()
+
+
+def format_sse(event, data):
+    """SSE 메시지 한 개를 텍스트로 변환"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def read_sse(lines):
+    """SSE 텍스트 줄을 (event, data) 로 변환하는 제너레이터 (원격 서버 구독용)
+
+    Args:
+        lines: 줄 단위 문자열 iterable (예: requests의 response.iter_lines(decode_unicode=True))
+    """
+    event, data_lines = 'message', []
+    for line in lines:
+        if line is None:
+            continue
+        line = line.rstrip('\r')
+        if not line:
+            if data_lines:
+                try:
+                    yield event, json.loads('\n'.join(data_lines))
+                except ValueError:
+                    logger.warning(f"SSE 데이터 해석 실패: {event}")
+            event, data_lines = 'message', []
+        elif line.startswith(':'):
+            continue
+        elif line.startswith('event:'):
+            event = line[len('event:'):].strip()
+        elif line.startswith('data:'):
+            data_lines.append(line[len('data:'):].lstrip())
+
+
+class EventBroadcaster:
+    """이벤트를 모든 구독자의 큐에 전달"""
+
+    def __init__(self, max_subscribers=4):
+        self.max_subscribers = max_subscribers
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def subscribe(self):
+        """구독 큐 반환 (구독자가 가득 찼거나 종료되었으면 None)"""
+        with self._lock:
+            if self._closed or len(self._subscribers) >= self.max_subscribers:
+                return None
+            subscriber = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+            self._subscribers.add(subscriber)
+            return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event, data):
+        """모든 구독자에게 이벤트 전달 (구독자가 없으면 아무 일도 하지 않음)"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        if not subscribers:
+            return
+        message = format_sse(event, data)
+        for subscriber in subscribers:
+            self._put(subscriber, message)
+
+    @staticmethod
+    def _put(subscriber, message):
+        try:
+            subscriber.put_nowait(message)
+        except queue.Full:
+            # 가장 오래된 이벤트를 버리고 최신 이벤트를 넣음
+            try:
+                subscriber.get_nowait()
+                subscriber.put_nowait(message)
+            except (queue.Empty, queue.Full):
+                pass
+
+    def stream(self, subscriber, initial_events=(), heartbeat=HEARTBEAT_INTERVAL,
+               max_seconds=MAX_STREAM_SECONDS):
+        """구독 큐를 SSE 텍스트로 내보내는 제너레이터 (Flask Response에 전달)
+
+        Args:
+            subscriber: subscribe()로 받은 큐
+            initial_events: 연결 직후 보낼 (event, data) 목록 - 현재 상태
+        """
+        try:
+            yield f"retry: {RETRY_MILLISECONDS}\n\n"
+            for event, data in initial_events:
+                yield format_sse(event, data)
+
+            deadline = time.monotonic() + max_seconds
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    message = subscriber.get(timeout=min(heartbeat, remaining))
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is _CLOSE:
+                    break
+                yield message
+        finally:
+            self.unsubscribe(subscriber)
+
+    def close(self):
+        """서버 종료 시 모든 스트림 종료"""
+        with self._lock:
+            self._closed = True
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            self._put(subscriber, _CLOSE)
+
+
+def event_stream_response(broadcaster, initial_events=()):
+    """/api/events 응답 생성 (구독자가 가득 차면 503 - 클라이언트는 폴링으로 전환)"""
+    from flask import Response, jsonify
+
+    subscriber = broadcaster.subscribe()
+    if subscriber is None:
+        return jsonify({
+            'success': False,
+            'error': 'TOO_MANY_STREAMS',
+            'message': '이벤트 스트림 연결이 너무 많습니다. 상태 조회(/api/status)를 사용해주세요.'
+        }), 503
+
+    response = Response(broadcaster.stream(subscriber, initial_events), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    # 스트림이 시작되기 전에 연결이 끊겨도 구독 해제
+    response.call_on_close(lambda: broadcaster.unsubscribe(subscriber))
+    return response
@@ -0,0 +1,279 @@
+"""
+인쇄 요청 멱등성 키 캐시
+
+모바일 앱은 응답 대기 시간이 짧아서, 인쇄가 접수된 뒤에도 타임아웃으로 오류를 표시하고
+작업자가 다시 누르면 같은 라벨이 두 번 인쇄됩니다.
+요청에 Idempotency-Key 헤더(또는 JSON의 idempotency_key)가 있으면 최근 키의 응답을 보관했다가,
+같은 키로 다시 오면 인쇄하지 않고 처음 응답을 그대로 돌려줍니다.
+첫 요청이 아직 처리 중이면 잠시 기다리고, 그래도 끝나지 않으면 409(처리 중)로 응답합니다.
+"""
+
+import hashlib
+import threading
+import time
+import logging
+from collections import OrderedDict
+from functools import wraps
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+IDEMPOTENCY_FIELD = 'idempotency_key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+# 기본값 - 최근 키 1000개, 10분 보관
+DEFAULT_MAX_KEYS = 1000
+DEFAULT_KEY_TTL = 600
+# 같은 키의 첫 요청이 처리 중일 때 기다리는 시간 (초) - 모바일 앱 요청 제한 시간(10초)보다 짧게
+IN_FLIGHT_WAIT = 5
+
+
+class IdempotencyKeyReused(Exception):
+    """같은 키로 다른 내용의 요청이 들어옴"""
+
+
+class IdempotencyKeyInProgress(Exception):
+    """같은 키의 첫 요청이 IN_FLIGHT_WAIT 안에 끝나지 않음"""
+
+
+class _Entry:
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        self.response = None  # (body, status, mimetype)
+        self.created_at = time.monotonic()
+        self.ready = threading.Event()
+
+
+class IdempotencyCache:
+    """키 -> 응답 캐시 (개수 제한 + 만료 시간)"""
+
+    def __init__(self, max_keys=DEFAULT_MAX_KEYS, ttl=DEFAULT_KEY_TTL):
+        self.max_keys = max_keys
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _expire(self, now):
+        """만료되었거나 개수 제한을 넘은 키를 오래된 것부터 정리"""
+        for key in list(self._entries):
+            entry = self._entries[key]
+            if len(self._entries) <= self.max_keys and now - entry.created_at <= self.ttl:
+                break
+            if not entry.ready.is_set():
+                # 처리 중인 키는 남겨둠
+                continue
+            del self._entries[key]
+
+    def begin(self, key, fingerprint, wait=IN_FLIGHT_WAIT):
+        """키의 처리 권한 얻기
+
+        처음 들어온 키이면 새 항목을 만들어 (entry, True)를 반환하고, 호출한 쪽이 처리 후
+        finish() 또는 abort()를 호출해야 합니다. 보관된 응답이 있으면 (entry, False)를 반환합니다.
+        처리 중인 요청이 실패하면 기다리던 요청 중 하나만 새 처리자가 됩니다.
+
+        Raises:
+            IdempotencyKeyReused: 같은 키로 내용이 다른 요청이 들어온 경우
+            IdempotencyKeyInProgress: 처리 중인 요청이 wait초 안에 끝나지 않은 경우
+        """
+        deadline = time.monotonic() + wait
+        while True:
+            with self._lock:
+                self._expire(time.monotonic())
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = _Entry(fingerprint)
+                    self._entries[key] = entry
+                    return entry, True
+                if entry.fingerprint != fingerprint:
+                    raise IdempotencyKeyReused(key)
+
+            # 첫 요청이 아직 처리 중이면 끝날 때까지 대기
+            if not entry.ready.wait(max(0, deadline - time.monotonic())):
+                raise IdempotencyKeyInProgress(key)
+            if entry.response is not None:
+                logger.info(f"멱등성 키 재사용 - 이전 응답 반환: {key}")
+                return entry, False
+            # 처리하던 요청이 실패해 항목이 지워졌으면 잠금 안에서 다시 확인 (먼저 온 요청이 처리자가 됨)
+
+    def finish(self, key, entry, response):
+        """처리 결과 보관 (서버 오류는 보관하지 않고 다시 시도할 수 있게 지움)"""
+        body, status, mimetype = response
+        if status >= 500:
+            self._discard(key, entry)
+        else:
+            entry.response = response
+            entry.ready.set()
+
+    def abort(self, key, entry):
+        """처리 중 예외 - 항목을 지워 다음 요청이 다시 처리하도록 함"""
+        self._discard(key, entry)
+
+    def execute(self, key, fingerprint, handler):
+        """키의 첫 요청이면 handler()를 실행해 응답을 보관, 이미 있으면 보관된 응답 반환
+
+        Args:
+            handler: (body, status, mimetype)를 반환하는 함수
+        Returns:
+            ((body, status, mimetype), replayed)
+        Raises:
+            IdempotencyKeyReused: 같은 키로 내용이 다른 요청이 들어온 경우
+            IdempotencyKeyInProgress: 같은 키의 요청이 아직 처리 중인 경우
+        """
+        entry, owner = self.begin(key, fingerprint)
+        if not owner:
+            return entry.response, True
+
+        try:
+            response = handler()
+        except Exception:
+            self.abort(key, entry)
+            raise
+        self.finish(key, entry, response)
+        return response, False
+
+    def _discard(self, key, entry):
+        with self._lock:
+            if self._entries.get(key) is entry:
+                self._entries.pop(key)
+        entry.ready.set()
+
+
+def request_idempotency_key(request):
+    """요청의 멱등성 키 (헤더 우선, 없으면 JSON 필드)"""
+    key = request.headers.get(IDEMPOTENCY_HEADER)
+    if not key:
+        data = request.get_json(silent=True)
+        if isinstance(data, dict):
+            key = data.get(IDEMPOTENCY_FIELD)
+    return str(key).strip() if key else None
+
+
+def in_progress_response():
+    """같은 키의 요청이 아직 처리 중일 때의 409 응답 (같은 키로 잠시 후 다시 요청하면 결과를 받음)"""
+    from flask import jsonify
+
+    return jsonify({
+        'success': False,
+        'error': 'IDEMPOTENCY_KEY_IN_PROGRESS',
+        'message': '같은 요청을 아직 처리 중입니다. 잠시 후 다시 시도해주세요.'
+    }), 409
+
+
+def idempotent(cache):
+    """Flask 뷰 데코레이터 - 멱등성 키가 있는 요청의 응답을 cache에 보관하고 재요청에 재사용"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            from flask import request, jsonify, current_app, Response
+
+            key = request_idempotency_key(request)
+            if not key:
+                return view(*args, **kwargs)
+
+            # 키는 엔드포인트별로 구분, 요청 본문이 같아야 같은 요청으로 봄
+            scoped_key = f"{request.path}:{key}"
+            fingerprint = hashlib.sha256(request.get_data()).hexdigest()
+
+            def handle():
+                response = current_app.make_response(view(*args, **kwargs))
+                return response.get_data(), response.status_code, response.mimetype
+
+            try:
+                (body, status, mimetype), replayed = cache.execute(scoped_key, fingerprint, handle)
+            except IdempotencyKeyReused:
+                return jsonify({
+                    'success': False,
+                    'error': 'IDEMPOTENCY_KEY_REUSED',
+                    'message': '같은 멱등성 키로 다른 요청이 들어왔습니다.'
+                }), 422
+            except IdempotencyKeyInProgress:
+                return in_progress_response()
+
+            response = Response(body, status=status, mimetype=mimetype)
+            if replayed:
+                response.headers[REPLAYED_HEADER] = 'true'
+            return response
+        return wrapper
+    return decorator
+
+
+def idempotent_stream(cache):
+    """스트리밍 응답용 멱등성 데코레이터
+
+    첫 요청은 그대로 스트리밍하면서 보낸 본문을 모아 두고, 같은 키의 재요청에는 모아 둔 본문 전체를
+    한 번에 돌려줍니다. 클라이언트 연결이 중간에 끊겨도 이미 등록된 작업이 다시 인쇄되지 않도록
+    나머지 본문은 백그라운드에서 끝까지 받아 보관합니다.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            from flask import request, jsonify, current_app, Response
+
+            key = request_idempotency_key(request)
+            if not key:
+                return view(*args, **kwargs)
+
+            scoped_key = f"{request.path}:{key}"
+            fingerprint = hashlib.sha256(request.get_data()).hexdigest()
+            try:
+                entry, owner = cache.begin(scoped_key, fingerprint)
+            except IdempotencyKeyReused:
+                return jsonify({
+                    'success': False,
+                    'error': 'IDEMPOTENCY_KEY_REUSED',
+                    'message': '같은 멱등성 키로 다른 요청이 들어왔습니다.'
+                }), 422
+            except IdempotencyKeyInProgress:
+                return in_progress_response()
+
+            if not owner:
+                body, status, mimetype = entry.response
+                response = Response(body, status=status, mimetype=mimetype)
+                response.headers[REPLAYED_HEADER] = 'true'
+                return response
+
+            try:
+                response = current_app.make_response(view(*args, **kwargs))
+            except Exception:
+                cache.abort(scoped_key, entry)
+                raise
+            if not response.is_streamed:
+                cache.finish(scoped_key, entry, (response.get_data(), response.status_code, response.mimetype))
+                return response
+
+            status, mimetype = response.status_code, response.mimetype
+            chunks = iter(response.response)
+            body = []
+
+            def drain():
+                # 연결이 끊긴 뒤 남은 본문 (작업 결과)을 끝까지 받아 보관
+                try:
+                    for chunk in chunks:
+                        body.append(chunk if isinstance(chunk, bytes) else chunk.encode('utf-8'))
+                except Exception as e:
+                    logger.error(f"스트리밍 응답 보관 실패: {e}")
+                    cache.abort(scoped_key, entry)
+                    return
+                cache.finish(scoped_key, entry, (b''.join(body), status, mimetype))
+
+            def record():
+                try:
+                    for chunk in chunks:
+                        body.append(chunk if isinstance(chunk, bytes) else chunk.encode('utf-8'))
+                        yield chunk
+                except GeneratorExit:
+                    threading.Thread(target=drain, name="idempotent-stream-drain", daemon=True).start()
+                    raise
+                except Exception:
+                    cache.abort(scoped_key, entry)
+                    raise
+                cache.finish(scoped_key, entry, (b''.join(body), status, mimetype))
+
+            response.response = record()
+            return response
+        return wrapper
+    return decorator
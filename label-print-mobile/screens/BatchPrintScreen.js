@@ -177,6 +177,8 @@ const BatchPrintScreen = () => {
     try {
       // 모든 라벨에 선택된 프린터 적용
       const labelsToPrint = labels.map((label) => ({
+        // 다시 인쇄해도 같은 라벨/프린터는 한 번만 인쇄됨
+        requestId: `${label.id}-${selectedPrinter}`,
         totalWeight: label.totalWeight,
         palletWeight: label.palletWeight,
         extraWeight: label.extraWeight || "0",
@@ -196,9 +198,11 @@ const BatchPrintScreen = () => {
         );
         setLabels([]);
       } else {
+        // 인쇄가 끝난 라벨만 목록에서 빼고, 실패/미완료 라벨은 다시 인쇄할 수 있게 남김
+        setLabels(labels.filter((label, i) => !results[i].result.success));
         Alert.alert(
           "부분 성공",
-          `성공: ${successCount}개, 실패: ${failCount}개\n실패한 항목을 확인해주세요.`
+          `성공: ${successCount}개, 실패/미완료: ${failCount}개\n남은 항목을 확인해주세요.`
         );
       }
     } catch (error) {
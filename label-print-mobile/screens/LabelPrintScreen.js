@@ -219,6 +219,7 @@ const LabelPrintScreen = () => {
 
     try {
       const labelsToPrint = labels.map((label) => ({
+        requestId: label.id, // 다시 인쇄해도 같은 라벨은 한 번만 인쇄됨
         totalWeight: label.totalWeight,
         palletWeight: label.palletWeight,
         extraWeight: label.extraWeight || "0",
@@ -237,9 +238,11 @@ const LabelPrintScreen = () => {
         );
         setLabels([]);
       } else {
+        // 인쇄가 끝난 라벨만 목록에서 빼고, 실패/미완료 라벨은 다시 인쇄할 수 있게 남김
+        setLabels(labels.filter((label, i) => !results[i].result.success));
         Alert.alert(
           "부분 성공",
-          `성공: ${successCount}개, 실패: ${failCount}개\n실패한 항목을 확인해주세요.`
+          `성공: ${successCount}개, 실패/미완료: ${failCount}개\n남은 항목을 확인해주세요.`
         );
       }
     } catch (error) {
@@ -1,8 +1,52 @@
+import AsyncStorage from "@react-native-async-storage/async-storage";
+
+// 멱등성 키 접두어를 보관하는 AsyncStorage 키
+const CLIENT_ID_STORAGE_KEY = "idempotencyClientId";
+
+// 인쇄 작업 상태 확인 간격과 최대 대기 시간 (ms)
+const JOB_POLL_INTERVAL = 1000;
+const JOB_WAIT_TIMEOUT = 60000;
+
 class LabelPrintService {
   constructor() {
     // 기본 서버 URL - IP 변경 기능으로 동적 설정 가능
     // 저장된 IP가 있으면 사용, 없으면 기본값 사용
     this.baseURL = "http://10.0.0.208:8080";
+
+    // 멱등성 키 - 응답 시간 초과 후 다시 눌러도 서버가 같은 라벨을 두 번 인쇄하지 않도록
+    // 기기마다 다른 접두어를 AsyncStorage에 보관해 앱을 다시 시작해도 같은 라벨은 같은 키가 됨
+    this.clientId = null; // loadClientId()에서 설정
+    this.pendingPrint = null; // 성공하지 못한 마지막 단일 인쇄 요청 { body, key }
+  }
+
+  // 기기별 멱등성 키 접두어 (처음 한 번 만들어 AsyncStorage에 저장)
+  async loadClientId() {
+    if (this.clientId) {
+      return this.clientId;
+    }
+    let clientId = null;
+    try {
+      clientId = await AsyncStorage.getItem(CLIENT_ID_STORAGE_KEY);
+    } catch (error) {
+      console.log("💥 멱등성 키 접두어 읽기 실패:", error);
+    }
+    if (!clientId) {
+      clientId = Date.now().toString(36) + Math.random().toString(36).slice(2, 8);
+      try {
+        await AsyncStorage.setItem(CLIENT_ID_STORAGE_KEY, clientId);
+      } catch (error) {
+        console.log("💥 멱등성 키 접두어 저장 실패:", error);
+      }
+    }
+    this.clientId = clientId;
+    return clientId;
+  }
+
+  // 새 멱등성 키 (loadClientId() 이후 호출)
+  newIdempotencyKey(requestId) {
+    const suffix =
+      requestId || Date.now().toString(36) + Math.random().toString(36).slice(2, 8);
+    return `${this.clientId}-${suffix}`;
   }
 
   // 서버 URL 설정
@@ -87,6 +131,8 @@ class LabelPrintService {
   }
 
   // 라벨 인쇄
+  // labelData.requestId가 있으면(일괄 인쇄 라벨 id) 그 값으로 멱등성 키를 만들고,
+  // 없으면 직전에 실패한 요청과 내용이 같을 때 같은 키를 다시 사용
   async printLabel(labelData) {
     try {
       console.log("🖨️ 인쇄 요청 데이터:", labelData);
@@ -100,12 +146,25 @@ class LabelPrintService {
 
       console.log("📤 API로 전송할 데이터:", requestData);
 
+      const body = JSON.stringify(requestData);
+      await this.loadClientId();
+      let idempotencyKey;
+      if (labelData.requestId) {
+        idempotencyKey = this.newIdempotencyKey(labelData.requestId);
+      } else {
+        if (!this.pendingPrint || this.pendingPrint.body !== body) {
+          this.pendingPrint = { body: body, key: this.newIdempotencyKey() };
+        }
+        idempotencyKey = this.pendingPrint.key;
+      }
+
       const response = await fetch(`${this.baseURL}/api/print`, {
         method: "POST",
         headers: {
           "Content-Type": "application/json",
+          "Idempotency-Key": idempotencyKey,
         },
-        body: JSON.stringify(requestData),
+        body: body,
         timeout: 10000,
       });
 
@@ -115,11 +174,38 @@ class LabelPrintService {
       console.log("📋 인쇄 API 응답 데이터:", result);
 
       if (result.success) {
+        // 202는 접수만 된 상태 - 작업이 끝날 때까지 상태 조회
+        const job = await this.waitForJob(result.job_id, result.status);
+        if (job.status === "failed") {
+          return {
+            success: false,
+            message: "인쇄 실패: " + (job.error || "프린터 설정을 확인해주세요."),
+          };
+        }
+        if (job.status !== "done") {
+          // 같은 멱등성 키를 유지하므로 다시 눌러도 같은 작업의 상태만 다시 확인함
+          return {
+            success: false,
+            queued: true,
+            message:
+              "인쇄 요청은 접수되었지만 아직 완료되지 않았습니다. 잠시 후 다시 확인해주세요.",
+          };
+        }
+        if (!labelData.requestId) {
+          this.pendingPrint = null;
+        }
         return {
           success: true,
           message: "라벨이 성공적으로 인쇄되었습니다!",
           data: result.data,
         };
+      } else if (response.status === 409) {
+        // 같은 키의 이전 요청을 서버가 아직 처리 중 - 키를 유지하므로 다시 누르면 그 결과를 받음
+        return {
+          success: false,
+          queued: true,
+          message: result.message || "이전 인쇄 요청을 아직 처리 중입니다.",
+        };
       } else {
         return {
           success: false,
@@ -135,7 +221,36 @@ class LabelPrintService {
     }
   }
 
-  // 일괄 라벨 인쇄
+  // 인쇄 작업이 done/failed가 될 때까지 상태 조회 - 마지막으로 확인한 { status, error } 반환
+  // (JOB_WAIT_TIMEOUT 안에 끝나지 않으면 그때의 상태 그대로 반환)
+  async waitForJob(jobId, status) {
+    let job = { status: status, error: null };
+    if (!jobId) {
+      return job;
+    }
+    const deadline = Date.now() + JOB_WAIT_TIMEOUT;
+    while (job.status !== "done" && job.status !== "failed" && Date.now() < deadline) {
+      await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL));
+      try {
+        const response = await fetch(`${this.baseURL}/api/print/status/${jobId}`, {
+          method: "GET",
+          timeout: 5000,
+        });
+        const result = await response.json();
+        if (result.success) {
+          job = { status: result.status, error: result.error };
+        } else if (response.status === 404) {
+          return { status: "failed", error: result.message };
+        }
+      } catch (error) {
+        // 일시적인 연결 오류는 다음 조회에서 다시 확인
+        console.log("💥 인쇄 상태 조회 오류:", error);
+      }
+    }
+    return job;
+  }
+
+  // 일괄 라벨 인쇄 (라벨마다 인쇄가 끝난 것을 확인한 뒤 다음 라벨 전송)
   async printBatchLabels(labels) {
     const results = [];
 
@@ -147,11 +262,6 @@ class LabelPrintService {
         label: label,
         result: result,
       });
-
-      // 각 인쇄 사이에 1초 대기 (프린터 부하 방지)
-      if (i < labels.length - 1) {
-        await new Promise((resolve) => setTimeout(resolve, 1000));
-      }
     }
 
     return results;
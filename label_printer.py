@@ -0,0 +1,892 @@
+"""
+라벨/벌크 생산 시트 PDF 생성 및 프린터 출력
+
+GUI와 헤드리스 서버가 함께 사용하므로 Tkinter에 의존하지 않습니다.
+"""
+
+import os
+import logging
+from datetime import datetime
+from itertools import islice
+
+from reportlab.pdfgen import canvas
+from reportlab.lib.units import cm
+from reportlab.lib.pagesizes import A4
+
+from artifact_store import ArtifactStore
+from spool_backends import create_spool_backend
+from printer_caps import printer_caps, caps_from_dc
+from label_render import PRINT_PX_PER_CM
+
+logger = logging.getLogger(__name__)
+
+# 라벨 설정 (10cm x 5cm)
+LABEL_WIDTH = 10 * cm
+LABEL_HEIGHT = 5 * cm
+BULK_SHEET_PAGE_SIZE = A4
+# 벌크 생산 시트 한 페이지의 표 행 수
+BULK_SHEET_ROWS_PER_PAGE = 15
+
+
+def paginate_rows(rows, page_size):
+    """rows를 page_size개씩 나눠 (페이지 번호, 행 목록, 마지막 페이지 여부)를 차례로 반환
+    
+    다음 페이지 하나만 미리 읽으므로 rows는 리스트가 아닌 이터러블이어도 됩니다.
+    행이 없어도 빈 페이지 하나는 반환합니다.
+    """
+    iterator = iter(rows)
+    page = list(islice(iterator, page_size))
+    page_number = 1
+    while True:
+        next_page = list(islice(iterator, page_size))
+        yield page_number, page, not next_page
+        if not next_page:
+            return
+        page = next_page
+        page_number += 1
+
+
+def _sheet_number(value):
+    """표 칸의 숫자 (쉼표/단위 허용, 숫자가 아니면 None)"""
+    text = str(value or "").replace(",", "").lower().replace("kg", "").strip()
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+class BulkSheetTotals:
+    """벌크 생산 시트 합계 - 팔렛 수(Total KG가 있는 행), Bag QTY 합, Total KG 합"""
+    
+    def __init__(self):
+        self.rows = 0
+        self.pallets = 0
+        self.bag_qty = 0.0
+        self.total_kg = 0.0
+    
+    def add(self, row_data):
+        row_data = row_data or {}
+        self.rows += 1
+        total_kg = _sheet_number(row_data.get("total_kg"))
+        if total_kg is not None:
+            self.pallets += 1
+            self.total_kg += total_kg
+        bag_qty = _sheet_number(row_data.get("bulk_bag_qty"))
+        if bag_qty is not None:
+            self.bag_qty += bag_qty
+    
+    def merge(self, other):
+        self.rows += other.rows
+        self.pallets += other.pallets
+        self.bag_qty += other.bag_qty
+        self.total_kg += other.total_kg
+    
+    def describe(self):
+        return f"Pallets: {self.pallets}   Bag QTY: {self.bag_qty:g}   Total KG: {self.total_kg:,.1f}"
+
+
+class LabelPrinter:
+    def __init__(self, spool_backend=None, artifacts=None):
+        # 임시 PDF 저장소 (고유 파일 이름, 오래된 파일 자동 정리)
+        self.artifacts = artifacts or ArtifactStore()
+        self.temp_dir = self.artifacts.root
+        # 스풀 백엔드 (테스트에서는 FileSinkBackend로 교체 가능)
+        self.spool_backend = spool_backend or create_spool_backend()
+    
+    def close(self):
+        """종료 시 임시 PDF 정리"""
+        self.artifacts.close()
+        
+    def create_label_pdf(self, data, reuse=False):
+        """라벨 PDF 생성 (reuse=True이면 방금 같은 내용으로 만든 파일 재사용 - 미리보기용)"""
+        return self.artifacts.create('label', lambda pdf_path: self._draw_label_pdf(pdf_path, data),
+                                     data=data, reuse=reuse)
+    
+    def _draw_label_pdf(self, pdf_path, data):
+        print("=== PDF 생성 디버깅 ===")
+        print(f"입력 데이터: {data}")
+        print(f"PDF 파일 경로: {pdf_path}")
+        
+        try:
+            # PDF 캔버스 생성
+            c = canvas.Canvas(pdf_path, pagesize=(LABEL_WIDTH, LABEL_HEIGHT))
+            print(f"PDF 캔버스 생성 성공: {LABEL_WIDTH}x{LABEL_HEIGHT}")
+        except Exception as e:
+            print(f"❌ PDF 캔버스 생성 실패: {e}")
+            raise
+        
+        # 폰트 설정
+        c.setFont("Helvetica-Bold", 16)
+        
+        # 배경 테두리 그리기
+        c.rect(0.2*cm, 0.2*cm, LABEL_WIDTH-0.4*cm, LABEL_HEIGHT-0.4*cm)
+        
+        # 제품명 (상단)
+        c.setFont("Helvetica-Bold", 14)
+        c.drawString(0.5*cm, LABEL_HEIGHT-1.2*cm, "제품 라벨")
+        
+        # 순수무게 (중앙, 가장 큰 글씨)
+        if 'net_weight' in data and data['net_weight']:
+            c.setFont("Helvetica-Bold", 28)
+            net_weight_text = f"{data['net_weight']} kg"
+            text_width = c.stringWidth(net_weight_text, "Helvetica-Bold", 28)
+            x_pos = (LABEL_WIDTH - text_width) / 2
+            c.drawString(x_pos, LABEL_HEIGHT/2 + 0.3*cm, net_weight_text)
+        
+        # 총무게와 팔렛무게 (중앙 하단)
+        c.setFont("Helvetica", 10)
+        if 'total_weight' in data and data['total_weight']:
+            total_text = f"총무게: {data['total_weight']} kg"
+            c.drawString(0.5*cm, LABEL_HEIGHT/2 - 0.5*cm, total_text)
+        
+        if 'pallet_weight' in data and data['pallet_weight']:
+            pallet_text = f"팔렛무게: {data['pallet_weight']} kg"
+            c.drawString(0.5*cm, LABEL_HEIGHT/2 - 0.8*cm, pallet_text)
+        
+        # 날짜 (하단 좌측)
+        if 'date' in data and data['date']:
+            c.setFont("Helvetica", 9)
+            c.drawString(0.5*cm, 0.8*cm, f"날짜: {data['date']}")
+        
+        # 인쇄 시간 (우측 하단)
+        c.setFont("Helvetica", 8)
+        c.drawString(LABEL_WIDTH-3*cm, 0.5*cm, f"시간: {datetime.now().strftime('%H:%M:%S')}")
+        
+        c.save()
+        print(f"✅ PDF 저장 완료: {pdf_path}")
+        
+        # 파일 존재 여부 확인
+        if os.path.exists(pdf_path):
+            file_size = os.path.getsize(pdf_path)
+            print(f"✅ PDF 파일 확인됨 - 크기: {file_size} bytes")
+        else:
+            print("❌ PDF 파일이 생성되지 않았습니다!")
+    
+    def create_bulk_production_sheet_pdf(self, data=None, reuse=False):
+        """벌크 생산 시트 PDF 생성 (reuse=True이면 방금 같은 내용으로 만든 파일 재사용 - 미리보기용)"""
+        data = data or {}
+        return self.artifacts.create('bulk_sheet', lambda pdf_path: self._draw_bulk_sheet_pdf(pdf_path, data),
+                                     data=data, reuse=reuse)
+    
+    def _draw_bulk_sheet_pdf(self, pdf_path, data):
+        """벌크 생산 시트 그리기 - production_table을 BULK_SHEET_ROWS_PER_PAGE행씩 여러 페이지로
+        
+        페이지마다 머리글/양식/표 머리/서명란을 반복하고 바닥에 페이지 합계를 적습니다.
+        행은 페이지 단위로만 꺼내서 그리고 바로 페이지를 넘기므로 행 수가 늘어도 행당 비용은 같습니다.
+        """
+        c = canvas.Canvas(pdf_path, pagesize=BULK_SHEET_PAGE_SIZE)
+        rows = data.get("production_table") or []
+        page_count = max(1, -(-len(rows) // BULK_SHEET_ROWS_PER_PAGE)) if hasattr(rows, '__len__') else None
+        sheet_totals = BulkSheetTotals()
+        for page_number, page_rows, is_last in paginate_rows(rows, BULK_SHEET_ROWS_PER_PAGE):
+            page_totals = BulkSheetTotals()
+            for row_data in page_rows:
+                page_totals.add(row_data)
+            sheet_totals.merge(page_totals)
+            show_sheet_totals = is_last and page_number > 1
+            self._draw_bulk_sheet_page(c, data, page_rows, page_number, page_count, page_totals,
+                                       sheet_totals if show_sheet_totals else None)
+            c.showPage()
+        c.save()
+        if page_number > 1:
+            print(f"📄 벌크 생산 시트 {page_number}페이지 ({sheet_totals.rows}행)")
+    
+    def _draw_bulk_sheet_page(self, c, data, page_rows, page_number, page_count, page_totals, sheet_totals=None):
+        """벌크 생산 시트 한 페이지 (page_rows: 이 페이지에 들어갈 표 행, 최대 BULK_SHEET_ROWS_PER_PAGE개)"""
+        page_width, page_height = BULK_SHEET_PAGE_SIZE
+        margin = 1.0 * cm
+        
+        # Header table - 3 columns (left: 20%, center: 45%, right: 35%)
+        header_height = 1.6 * cm
+        header_top = page_height - 0.8 * cm
+        header_bottom = header_top - header_height
+        header_width = page_width - 2 * margin
+        left_col_width = header_width * 0.25
+        center_col_width = header_width * 0.40
+        right_col_width = header_width * 0.35
+        
+        # Draw header table borders
+        c.rect(margin, header_bottom, header_width, header_height)
+        c.line(margin + left_col_width, header_bottom, margin + left_col_width, header_top)
+        c.line(margin + left_col_width + center_col_width, header_bottom, margin + left_col_width + center_col_width, header_top)
+        
+        # Left cell - innofoods INC
+        header_center_y = header_bottom + header_height / 2
+        c.setFont("Helvetica-Bold", 22)
+        c.setFillColorRGB(0.0, 0.4, 0.6)
+        logo_text = "innofoods"
+        logo_x = margin + 0.3 * cm  # 왼쪽으로 이동
+        c.drawString(logo_x, header_center_y - 0.3 * cm, logo_text)
+        c.setFont("Helvetica-Bold", 7)  # INC를 더 작게
+        inc_text = "INC"
+        logo_width = c.stringWidth(logo_text, "Helvetica-Bold", 22)
+        inc_x = logo_x + logo_width + 0.2 * cm
+        c.drawString(inc_x, header_center_y - 0.5 * cm, inc_text)  # 아래로 이동
+       
+        
+        # Center cell - Daily Bulk Production Sheet
+        c.setFillColorRGB(0, 0, 0)
+        c.setFont("Helvetica-Bold", 14)  # 폰트 크기 줄임
+        title_text = "Daily Bulk Production Sheet"
+        title_width = c.stringWidth(title_text, "Helvetica-Bold", 14)
+        center_start_x = margin + left_col_width
+        title_x = center_start_x + (center_col_width - title_width) / 2
+        c.drawString(title_x, header_center_y - 0.2 * cm, title_text)
+        
+        # Right cell - Document info
+        c.setFont("Helvetica", 9)
+        doc_info = [
+            ("Document No.:", data.get("document_no", "INNO-PROU-PUT-LUS")),
+            ("Issue No.:", data.get("issue_no", "014")),
+            ("Effective Date:", data.get("effective_date", "Sep 14, 2023")),
+            ("Issued By:", data.get("issued_by", "Jason Lee")),
+            ("Approved By:", data.get("approved_by", "Jeff Chen")),
+            ("Review Date:", data.get("review_date", "Sep 14, 2023")),
+        ]
+        right_start_x = margin + left_col_width + center_col_width
+        doc_start_x = right_start_x + 0.2 * cm
+        line_spacing = 0.25 * cm  # 줄 간격 증가
+        doc_start_y = header_top - 0.3 * cm
+        for idx, (label, value) in enumerate(doc_info):
+            y_pos = doc_start_y - idx * line_spacing
+            c.drawString(doc_start_x, y_pos, label)
+            c.drawString(doc_start_x + 2.2 * cm, y_pos, value)
+        
+        # Form table - each row is a separate cell with borders
+        form_top = header_bottom - 0.3 * cm
+        form_width = page_width - 2 * margin
+        row_height = 1.0 * cm
+        left_col_width = form_width * 0.5
+        right_col_width = form_width * 0.5
+        
+        c.setFont("Helvetica", 11)
+        
+        # Helper function to draw vertically centered text in cell
+        def draw_centered_text(x, y_bottom, height, text, font_size=11):
+            center_y = y_bottom + height / 2
+            c.setFont("Helvetica", font_size)
+            c.drawString(x, center_y - 0.2 * cm, text)
+        
+        # Row 1: DATE (left) and SHIFT (right)
+        row1_y = form_top
+        row1_bottom = row1_y - row_height
+        # Left cell - DATE
+        c.rect(margin, row1_bottom, left_col_width, row_height)
+        draw_centered_text(margin + 0.15 * cm, row1_bottom, row_height, "DATE:")
+        date_value = data.get("date", "")
+        if date_value:
+            draw_centered_text(margin + 1.8 * cm, row1_bottom, row_height, date_value)
+        # Right cell - SHIFT
+        c.rect(margin + left_col_width, row1_bottom, right_col_width, row_height)
+        draw_centered_text(margin + left_col_width + 0.15 * cm, row1_bottom, row_height, "SHIFT (circle one):")
+        c.setFont("Helvetica", 9)
+        shift_center_y = row1_bottom + row_height / 2
+        c.drawString(margin + left_col_width + 3.8 * cm, shift_center_y - 0.2 * cm, "AM / PM / Graveyard")
+        shift_value = data.get("shift", "").upper()
+        if shift_value:
+            # AM 위치를 기준으로 선택값에 따라 타원형 원 그리기
+            base_x = margin + left_col_width + 3.8 * cm  # 기준 위치
+            if shift_value == "AM":
+                ellipse_center_x = base_x + 0.2 * cm  # AM은 0.2cm 오른쪽
+            elif shift_value == "PM":
+                ellipse_center_x = base_x + 0.9 * cm  # PM은 0.7cm 오른쪽 (0.3cm 추가 이동)
+            elif shift_value == "GRAVEYARD" or shift_value.startswith("G"):
+                ellipse_center_x = base_x + 1.8 * cm  # GRAVEYARD는 4cm 오른쪽
+            else:
+                ellipse_center_x = base_x + 0.2 * cm
+            
+            # 타원형 원 그리기 (오른쪽으로 늘린 형태)
+            ellipse_width = 0.8 * cm  # 가로 너비
+            ellipse_height = 0.3 * cm  # 세로 높이
+            ellipse_x1 = ellipse_center_x - ellipse_width / 2
+            ellipse_y1 = shift_center_y - ellipse_height / 2
+            ellipse_x2 = ellipse_center_x + ellipse_width / 2
+            ellipse_y2 = shift_center_y + ellipse_height / 2
+            c.ellipse(ellipse_x1, ellipse_y1, ellipse_x2, ellipse_y2)
+        
+        # Row 2: Supervisor Name (left) and Employee Name (right)
+        row2_y = row1_y - row_height
+        row2_bottom = row2_y - row_height
+        c.setFont("Helvetica", 11)
+        # Left cell
+        c.rect(margin, row2_bottom, left_col_width, row_height)
+        supervisor_label = "Supervisor Name:"
+        supervisor_label_x = margin + 0.15 * cm
+        draw_centered_text(supervisor_label_x, row2_bottom, row_height, supervisor_label)
+        supervisor_value = data.get("supervisor_name", "")
+        if supervisor_value:
+            # 타이틀 끝에서 여백 추가
+            supervisor_label_width = c.stringWidth(supervisor_label, "Helvetica", 11)
+            supervisor_value_x = supervisor_label_x + supervisor_label_width + 0.3 * cm
+            draw_centered_text(supervisor_value_x, row2_bottom, row_height, supervisor_value)
+        # Right cell
+        c.rect(margin + left_col_width, row2_bottom, right_col_width, row_height)
+        employee_label = "Employee Name:"
+        employee_label_x = margin + left_col_width + 0.15 * cm
+        draw_centered_text(employee_label_x, row2_bottom, row_height, employee_label)
+        employee_value = data.get("employee_name", "")
+        if employee_value:
+            # 타이틀 끝에서 여백 추가
+            employee_label_width = c.stringWidth(employee_label, "Helvetica", 11)
+            employee_value_x = employee_label_x + employee_label_width + 0.3 * cm
+            draw_centered_text(employee_value_x, row2_bottom, row_height, employee_value)
+        
+        # Row 3: Product Name (left) and Bulk Lot Code (right)
+        row3_y = row2_y - row_height
+        row3_bottom = row3_y - row_height
+        # Left cell
+        c.rect(margin, row3_bottom, left_col_width, row_height)
+        draw_centered_text(margin + 0.15 * cm, row3_bottom, row_height, "Product Name:")
+        product_value = data.get("product_name", "")
+        if product_value:
+            draw_centered_text(margin + 2.8 * cm, row3_bottom, row_height, product_value)
+        # Right cell
+        c.rect(margin + left_col_width, row3_bottom, right_col_width, row_height)
+        draw_centered_text(margin + left_col_width + 0.15 * cm, row3_bottom, row_height, "Bulk Lot Code:")
+        bulk_lot_value = data.get("bulk_lot_code", "")
+        if bulk_lot_value:
+            draw_centered_text(margin + left_col_width + 2.8 * cm, row3_bottom, row_height, bulk_lot_value)
+        
+        # Row 4: Parchment Paper and Quantity (full width)
+        row4_y = row3_y - row_height
+        row4_bottom = row4_y - row_height
+        # Full width cell
+        c.rect(margin, row4_bottom, form_width, row_height)
+        row4_center_y = row4_bottom + row_height / 2 + 0.27 * cm  # 콘텐츠를 위로 이동
+        
+        # Parchment Paper: REUSE
+        c.drawString(margin + 0.15 * cm, row4_center_y - 0.2 * cm, "Parchment Paper: Reuse")
+        reuse_text_width = c.stringWidth("Parchment Paper: Reuse", "Helvetica", 11)
+        
+        # 두 개 겹친 네모박스 (중심 같고 크기만 다름)
+        checkbox_center_x = margin + reuse_text_width + 0.2 * cm + 0.2 * cm  # REUSE 텍스트 끝 + 여백 + 박스 중심
+        checkbox_center_y = row4_center_y
+        
+        # 첫 번째 네모박스 (큰 것)
+        checkbox_size1 = 0.4 * cm
+        checkbox1_x = checkbox_center_x - checkbox_size1 / 2
+        checkbox1_y = checkbox_center_y - checkbox_size1 / 2
+        c.rect(checkbox1_x, checkbox1_y, checkbox_size1, checkbox_size1)
+        
+        # 두 번째 네모박스 (작은 것, 같은 중심)
+        checkbox_size2 = 0.25 * cm
+        checkbox2_x = checkbox_center_x - checkbox_size2 / 2
+        checkbox2_y = checkbox_center_y - checkbox_size2 / 2
+        c.rect(checkbox2_x, checkbox2_y, checkbox_size2, checkbox_size2)
+        
+        if data.get("parchment_reuse"):
+            # 체크 표시 (큰 박스에만)
+            c.line(checkbox1_x, checkbox1_y, checkbox1_x + checkbox_size1, checkbox1_y + checkbox_size1)
+            c.line(checkbox1_x, checkbox1_y + checkbox_size1, checkbox1_x + checkbox_size1, checkbox1_y)
+        
+        # or Lot code: 밑줄 있는 입력 폼
+        lot_code_label = "or Lot code:"
+        lot_code_label_x = checkbox_center_x + checkbox_size1 / 2 + 0.3 * cm
+        c.drawString(lot_code_label_x, row4_center_y - 0.2 * cm, lot_code_label)
+        lot_code_label_width = c.stringWidth(lot_code_label, "Helvetica", 11)
+        lot_code_line_x = lot_code_label_x + lot_code_label_width + 0.2 * cm
+        lot_code_line_width = 4.0 * cm
+        lot_code_line_y = row4_center_y - 0.3 * cm
+        c.line(lot_code_line_x, lot_code_line_y, lot_code_line_x + lot_code_line_width, lot_code_line_y)
+        lot_code_value = data.get("parchment_lot_code", "")
+        if lot_code_value:
+            c.drawString(lot_code_line_x + 0.1 * cm, lot_code_line_y + 0.1 * cm, lot_code_value)
+        
+        # 체크되면 parchment 라인 위에 텍스트 표시 (3cm 오른쪽으로 이동)
+        if data.get("no_choco_coating"):
+            choco_text = "No need for choco coating"
+            choco_text_y = lot_code_line_y - 0.4 * cm  # 라인 위에 표기
+            choco_text_x = lot_code_line_x + 3.0 * cm  # 3cm 오른쪽으로 이동
+            c.drawString(choco_text_x, choco_text_y, choco_text)
+        
+        # Quantity: 오른쪽에 밑줄 있는 입력줄
+        quantity_label = "Quantity:"
+        quantity_label_width = c.stringWidth(quantity_label, "Helvetica", 11)
+        quantity_label_x = page_width - margin - 5.0 * cm - quantity_label_width
+        c.drawString(quantity_label_x, row4_center_y - 0.2 * cm, quantity_label)
+        quantity_line_x = quantity_label_x + quantity_label_width + 0.2 * cm
+        quantity_line_width = 4.0 * cm
+        quantity_line_y = row4_center_y - 0.3 * cm
+        c.line(quantity_line_x, quantity_line_y, quantity_line_x + quantity_line_width, quantity_line_y)
+        quantity_value = data.get("quantity", "")
+        if quantity_value:
+            c.drawString(quantity_line_x + 0.1 * cm, quantity_line_y + 0.1 * cm, quantity_value)
+        
+        # Row 5: Quality Checked (full width)
+        qc_y = row4_y - row_height
+        qc_bottom = qc_y - row_height
+        c.rect(margin, qc_bottom, form_width, row_height)
+        qc_center_y = qc_bottom + row_height / 2
+        c.drawString(margin + 0.15 * cm, qc_center_y - 0.2 * cm, "Quality Checked (e.g. color, texture, crumb, taste) - Supervisor Initial:")
+        quality_value = data.get("quality_checked", "")
+        if quality_value:
+            qc_initial_x = page_width - margin - c.stringWidth(quality_value, "Helvetica", 11) - 0.15 * cm
+            c.drawString(qc_initial_x, qc_center_y - 0.2 * cm, quality_value)
+        
+        # Thick line separator after Quality Checked
+        c.setLineWidth(2)
+        separator_y = qc_bottom - 0.2 * cm
+        c.line(margin, separator_y, page_width - margin, separator_y)
+        c.setLineWidth(1)
+        
+        # Main table
+        table_top = separator_y - 0.3 * cm
+        table_left = margin
+        table_width = page_width - 2 * margin
+        table_header_height = 1.1 * cm
+        body_row_height = 1.0 * cm
+        body_rows = BULK_SHEET_ROWS_PER_PAGE
+        table_height = table_header_height + body_rows * body_row_height
+        table_bottom = table_top - table_height
+        
+        c.rect(table_left, table_bottom, table_width, table_height)
+        
+        column_specs = [
+            ("Bulk Plastic Bag \nLot Codes", 0.28),
+            ("Bulk Bag \nQTY", 0.14),
+            ("Pallet #", 0.13),
+            ("Total KG", 0.13),
+            ("Notes", 0.24),
+            ("Initial", 0.08),
+        ]
+        
+        x_positions = [table_left]
+        for _, ratio in column_specs:
+            x_positions.append(x_positions[-1] + ratio * table_width)
+        for x in x_positions[1:-1]:
+            c.line(x, table_bottom, x, table_top)
+        c.line(table_left, table_top - table_header_height, table_left + table_width, table_top - table_header_height)
+        
+        # Header row - vertically centered
+        c.setFont("Helvetica-Bold", 11)
+        header_center_y = table_top - table_header_height / 2
+        for idx, (title, _) in enumerate(column_specs):
+            text_x = x_positions[idx] + 0.3 * cm
+            # 줄바꿈 처리
+            if '\n' in title:
+                lines = title.split('\n')
+                line_height = 0.4 * cm
+                total_height = len(lines) * line_height
+                start_y = header_center_y + total_height / 2 - line_height / 2
+                for line_idx, line in enumerate(lines):
+                    y_pos = start_y - line_idx * line_height
+                    c.drawString(text_x, y_pos - 0.1 * cm, line)
+            else:
+                c.drawString(text_x, header_center_y - 0.2 * cm, title)
+        
+        # Body rows - draw horizontal lines
+        c.setFont("Helvetica", 10)
+        for row in range(body_rows):
+            y = table_top - table_header_height - row * body_row_height
+            c.line(table_left, y, table_left + table_width, y)
+        
+        # Body data - vertically centered
+        wrap_columns = {"bulk_bag_qty", "notes"}
+        for row_idx, row_data in enumerate(page_rows):
+            row_data = row_data or {}
+            cell_top = table_top - table_header_height - row_idx * body_row_height
+            cell_bottom = cell_top - body_row_height
+            cell_center_y = cell_bottom + body_row_height / 2
+            
+            for col_idx, key in enumerate(["bulk_plastic_bag_lot_codes", "bulk_bag_qty", "pallet_num", "total_kg", "notes", "initial"]):
+                value = row_data.get(key, "")
+                if not value:
+                    continue
+                
+                text_x = x_positions[col_idx] + 0.2 * cm
+                
+                if key in wrap_columns:
+                    text_obj = c.beginText()
+                    text_obj.setFont("Helvetica", 10)
+                    text_obj.setLeading(11)
+                    
+                    max_width = column_specs[col_idx][1] * table_width - 0.4 * cm
+                    words = str(value).split()
+                    lines = []
+                    current_line = ""
+                    for word in words:
+                        candidate = f"{current_line} {word}".strip()
+                        if c.stringWidth(candidate, "Helvetica", 10) <= max_width:
+                            current_line = candidate
+                        else:
+                            if current_line:
+                                lines.append(current_line)
+                            current_line = word
+                    if current_line:
+                        lines.append(current_line)
+                    
+                    # Center wrapped text vertically
+                    total_text_height = len(lines) * 11
+                    text_start_y = cell_center_y + total_text_height / 2 - 5
+                    text_obj.setTextOrigin(text_x, text_start_y)
+                    for line in lines:
+                        text_obj.textLine(line)
+                    c.drawText(text_obj)
+                else:
+                    # Center single line text vertically
+                    c.drawString(text_x, cell_center_y - 0.2 * cm, str(value))
+        
+        # Production Notes와 Supervisor Name & Signature 행 (테이블 바로 아래)
+        notes_signature_row_height = body_row_height  # 테이블 행과 같은 높이
+        notes_signature_top = table_bottom
+        notes_signature_bottom = notes_signature_top - notes_signature_row_height
+        notes_signature_width = table_width / 2  # 반반으로 나누기
+        
+        # 테두리 그리기
+        c.rect(table_left, notes_signature_bottom, table_width, notes_signature_row_height)
+        # 중간 구분선
+        c.line(table_left + notes_signature_width, notes_signature_bottom, 
+               table_left + notes_signature_width, notes_signature_top)
+        
+        # Production Notes (왼쪽 반)
+        notes_label_x = table_left + 0.2 * cm
+        notes_label_y = notes_signature_bottom + notes_signature_row_height / 2
+        c.setFont("Helvetica-Bold", 11)
+        c.drawString(notes_label_x, notes_label_y - 0.2 * cm, "Production Notes:")
+        
+        notes_text = data.get("production_notes", "")
+        if notes_text:
+            c.setFont("Helvetica", 10)
+            text_object = c.beginText()
+            text_object.setTextOrigin(notes_label_x, notes_label_y - 0.5 * cm)
+            text_object.setLeading(11)
+            max_width = notes_signature_width - 0.4 * cm
+            words = str(notes_text).split()
+            lines = []
+            current_line = ""
+            for word in words:
+                candidate = f"{current_line} {word}".strip()
+                if c.stringWidth(candidate, "Helvetica", 10) <= max_width:
+                    current_line = candidate
+                else:
+                    if current_line:
+                        lines.append(current_line)
+                    current_line = word
+            if current_line:
+                lines.append(current_line)
+            for line in lines[:3]:  # 최대 3줄
+                text_object.textLine(line)
+            c.drawText(text_object)
+        
+        # Supervisor Name & Signature (오른쪽 반)
+        supervisor_label_x = table_left + notes_signature_width + 0.2 * cm
+        supervisor_label_y = notes_signature_bottom + notes_signature_row_height / 2
+        c.setFont("Helvetica-Bold", 11)
+        c.drawString(supervisor_label_x, supervisor_label_y - 0.2 * cm, "Supervisor Name & Signature:")
+        
+        supervisor_text = data.get("supervisor_signature", "")
+        if supervisor_text:
+            c.setFont("Helvetica", 10)
+            c.drawString(supervisor_label_x, supervisor_label_y - 0.5 * cm, supervisor_text)
+        
+        # Verification by QA와 Date 행 (Production Notes/Supervisor 아래)
+        verification_row_height = body_row_height  # 테이블 행과 같은 높이
+        verification_top = notes_signature_bottom - 0.1 * cm
+        verification_bottom = verification_top - verification_row_height
+        verification_width = table_width / 2  # 반반으로 나누기
+        
+        # Verification by QA (왼쪽 반)
+        verification_center_y = verification_bottom + verification_row_height / 2 - 0.2 * cm
+        verification_label_x = table_left + 0.2 * cm
+        c.setFont("Helvetica-Bold", 11)
+        c.drawString(verification_label_x, verification_center_y - 0.2 * cm, "Verification by QA:")
+        
+        # 밑줄 (텍스트와 같은 높이)
+        line_y = verification_center_y - 0.3 * cm
+        line_start = verification_label_x + 3.8 * cm
+        line_end = table_left + verification_width - 0.3 * cm
+        c.line(line_start, line_y, line_end, line_y)
+        
+        verification_text = data.get("verified_by_qa", "")
+        if verification_text:
+            c.setFont("Helvetica", 10)
+            c.drawString(line_start + 0.2 * cm, line_y - 0.1 * cm, verification_text)
+        
+        # Date (오른쪽 반)
+        date_center_y = verification_bottom + verification_row_height / 2 -0.2 * cm
+        date_label_x = table_left + verification_width + 0.2 * cm
+        c.setFont("Helvetica-Bold", 11)
+        c.drawString(date_label_x, date_center_y - 0.2 * cm, "Date:")
+        
+        # 밑줄 (Date 텍스트 아래)
+        date_line_y = date_center_y - 0.3 * cm
+        date_line_start = date_label_x + 1.0 * cm
+        date_line_end = table_left + table_width - 0.3 * cm
+        c.line(date_line_start, date_line_y, date_line_end, date_line_y)
+        
+        date_text = data.get("sign_date", "")
+        if date_text:
+            c.setFont("Helvetica", 10)
+            c.drawString(date_line_start + 0.2 * cm, date_line_y + 0.2 * cm, date_text)
+        
+        # 페이지 합계 (여러 페이지면 마지막 페이지에 시트 합계도)
+        c.setFont("Helvetica-Bold", 10)
+        c.drawString(margin, margin + 0.2 * cm, f"Page Total - {page_totals.describe()}")
+        if sheet_totals is not None:
+            c.drawString(margin, margin + 0.7 * cm, f"Sheet Total - {sheet_totals.describe()}")
+        
+        c.setFont("Helvetica", 9)
+        page_label = f"Page {page_number} of {page_count}" if page_count else f"Page {page_number}"
+        c.drawRightString(page_width - margin, margin - 0.4 * cm, page_label)
+        c.drawString(margin, margin - 0.4 * cm, "Inno Foods Inc.")
+    
+    @staticmethod
+    def _load_print_image(image):
+        """인쇄할 이미지를 PIL Image로 변환
+        
+        렌더러가 만든 PIL Image는 그대로 사용하고, 인코딩된 이미지 버퍼(bytes)는
+        메모리에서 바로 열며, 파일 경로는 기존 호출부 호환용으로만 지원합니다.
+        """
+        from PIL import Image
+        
+        if isinstance(image, Image.Image):
+            return image
+        if isinstance(image, (bytes, bytearray, memoryview)):
+            import io
+            return Image.open(io.BytesIO(bytes(image)))
+        return Image.open(image)
+    
+    @staticmethod
+    def _create_printer_dc(printer_name, copies=1):
+        """프린터 DC 생성 - 가능하면 DEVMODE에 매수를 설정해 프린터가 직접 복사하도록 함
+        
+        라벨/감열 프린터 드라이버 중에는 dmCopies를 조용히 무시하는 것이 많으므로,
+        드라이버가 보고하는 최대 매수(DC_COPIES)와 드라이버가 확정한 DEVMODE의 매수가
+        모두 copies 이상일 때만 드라이버에 매수를 맡깁니다.
+        
+        Returns:
+            (hdc, driver_copies): driver_copies가 True이면 프린터 드라이버가 매수를 처리
+        """
+        import win32ui
+        
+        if copies > 1:
+            try:
+                import win32con
+                import win32gui
+                import win32print
+                
+                target = printer_name or win32print.GetDefaultPrinter()
+                handle = win32print.OpenPrinter(target)
+                try:
+                    info = win32print.GetPrinter(handle, 2)
+                    devmode = info['pDevMode']
+                    max_copies = win32print.DeviceCapabilities(target, info['pPortName'], win32con.DC_COPIES)
+                    if devmode is not None and max_copies >= copies:
+                        devmode.Copies = copies
+                        devmode.Fields |= win32con.DM_COPIES
+                        # 드라이버가 받아들인 값으로 DEVMODE 확정 (지원하지 않으면 매수가 1로 돌아옴)
+                        win32print.DocumentProperties(0, handle, target, devmode, devmode,
+                                                      win32con.DM_IN_BUFFER | win32con.DM_OUT_BUFFER)
+                    else:
+                        devmode = None
+                finally:
+                    win32print.ClosePrinter(handle)
+                if devmode is not None and devmode.Copies >= copies:
+                    hdc = win32ui.CreateDCFromHandle(win32gui.CreateDC('WINSPOOL', target, devmode))
+                    return hdc, True
+                print(f"ℹ️ 프린터 드라이버가 {copies}매 인쇄를 지원하지 않아 한 문서에 여러 페이지로 인쇄합니다")
+            except Exception as e:
+                print(f"⚠️ 프린터 매수 설정(DEVMODE) 실패, 한 문서에 여러 페이지로 인쇄: {e}")
+        
+        hdc = win32ui.CreateDC()
+        hdc.CreatePrinterDC(printer_name)
+        return hdc, False
+    
+    def print_image(self, image, printer_name, label_width_cm=None, label_height_cm=None, copies=1):
+        """이미지를 지정된 프린터로 직접 인쇄 (Word/한글 방식)
+        
+        매수는 인쇄 작업 하나로 처리합니다. 드라이버가 DEVMODE 매수를 지원하면
+        비트맵을 한 번만 보내고, 아니면 같은 문서 안에 페이지를 반복합니다.
+        Windows가 아니면 라벨 PDF 하나와 매수를 스풀 백엔드에 넘깁니다 (CUPS는 lp -n 작업 하나).
+        
+        Args:
+            image: 인쇄할 이미지 - PIL Image, 인코딩된 이미지 버퍼(bytes) 또는 파일 경로
+            printer_name: 프린터 이름
+            label_width_cm: 라벨 너비 (cm) - None이면 이미지 크기 기반으로 계산
+            label_height_cm: 라벨 높이 (cm) - None이면 이미지 크기 기반으로 계산
+            copies: 인쇄 매수
+        """
+        if self.spool_backend.name != 'win32':
+            # Windows DC가 없는 환경(CUPS, 파일 백엔드)은 라벨 크기 PDF로 만들어 스풀러로 전송
+            return self._spool_image(image, printer_name, label_width_cm, label_height_cm, copies)
+        
+        try:
+            from PIL import Image, ImageWin
+            
+            print(f"이미지 인쇄 시작 - 프린터: {printer_name}")
+            
+            # 이미지 로드 (렌더 결과는 파일을 거치지 않고 메모리에서 바로 사용)
+            pil_image = self._load_print_image(image)
+            img_width, img_height = pil_image.size
+            
+            # RGB 모드로 변환
+            if pil_image.mode != 'RGB':
+                pil_image = pil_image.convert('RGB')
+            
+            # win32print를 사용하여 이미지를 프린터로 직접 전송
+            # DC(Device Context) 생성 (Word/한글이 하는 방식)
+            copies = max(1, int(copies or 1))
+            hdc, driver_copies = self._create_printer_dc(printer_name, copies)
+            
+            try:
+                # 인쇄 시작 (매수와 관계없이 문서 하나)
+                hdc.StartDoc("Label Print")
+                
+                # 프린터 해상도/인쇄 가능 영역 (열린 DC에서 읽어 캐시 갱신)
+                caps = caps_from_dc(printer_name, hdc)
+                printer_caps.update(caps)
+                printer_margin_x, printer_margin_y = caps.offset_x, caps.offset_y
+                
+                print(f"프린터 DPI: {caps.dpi_x} x {caps.dpi_y}")
+                print(f"프린터 인쇄 가능 영역: {caps.printable_width} x {caps.printable_height} 픽셀")
+                print(f"이미지 크기: {img_width} x {img_height} 픽셀")
+                
+                # 라벨용지 사이즈에 맞게 인쇄
+                # label_width_cm, label_height_cm가 없으면 이미지의 300 DPI 기준 물리적 크기 사용
+                if label_width_cm is None or label_height_cm is None:
+                    label_width_cm = img_width / PRINT_PX_PER_CM
+                    label_height_cm = img_height / PRINT_PX_PER_CM
+                (final_width, final_height), _ = caps.fit_label(label_width_cm, label_height_cm)
+                print(f"프린터 DPI 기준 출력 크기: {final_width} x {final_height} 픽셀")
+                
+                # render_for_printer로 프린터 해상도에 맞춰 그린 이미지는 리사이즈 없이 그대로 전송
+                if pil_image.size != (final_width, final_height):
+                    print(f"이미지 리사이즈: {img_width} x {img_height} → {final_width} x {final_height}")
+                    pil_image = pil_image.resize((final_width, final_height), Image.Resampling.LANCZOS)
+                else:
+                    print("✅ 프린터 해상도로 렌더링된 이미지 - 리사이즈 없음")
+                
+                dib = ImageWin.Dib(pil_image)
+                
+                # 프린터에 이미지 그리기
+                # 프린터 여백을 고려하여 이미지를 그릴 위치 결정
+                # 라벨 프린터는 보통 여백이 없어야 하므로, 여백을 무시하고 (0,0)부터 그리기
+                # 만약 프린터 여백이 있다면, 여백 위치에 맞춰서 그리기
+                
+                # 여백을 무시하고 (0, 0)부터 그리기 (라벨 프린터용)
+                print_offset_x = 0
+                print_offset_y = 0
+                
+                # 만약 프린터 여백을 고려하려면 아래 주석 해제:
+                # print_offset_x = printer_margin_x
+                # print_offset_y = printer_margin_y
+                
+                # 프린터의 실제 물리적 크기 그대로 출력
+                # 인쇄 가능 영역 내에 정확히 맞춤
+                target_rect = (print_offset_x, print_offset_y, 
+                              print_offset_x + final_width, 
+                              print_offset_y + final_height)
+                page_count = 1 if driver_copies else copies
+                for page_idx in range(page_count):
+                    hdc.StartPage()
+                    dib.draw(hdc.GetHandleOutput(), target_rect)
+                    hdc.EndPage()
+                
+                print(f"인쇄 시작 위치: ({print_offset_x}, {print_offset_y})")
+                print(f"프린터 여백 정보: ({printer_margin_x}, {printer_margin_y}) - 이미지는 여백 무시하고 (0,0)부터 그려집니다")
+                
+                print(f"최종 인쇄 크기: {final_width} x {final_height} 픽셀")
+                print(f"인쇄 매수: {copies} ({'프린터 매수 설정' if driver_copies else f'{page_count}페이지 문서'})")
+                
+                hdc.EndDoc()
+                
+                print(f"✅ 이미지를 프린터 '{printer_name}'로 직접 전송 성공")
+                logger.info(f"프린터 '{printer_name}'로 이미지 인쇄 성공")
+                return True
+                
+            finally:
+                hdc.DeleteDC()
+                
+        except ImportError:
+            print("❌ win32print 모듈이 없습니다. pip install pywin32 pillow로 설치해주세요.")
+            return False
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            logger.error(f"이미지 인쇄 실패: {e}")
+            print(f"❌ 이미지 인쇄 실패: {e}")
+            return False
+    
+    def _spool_image(self, image, printer_name, label_width_cm=None, label_height_cm=None, copies=1):
+        """이미지를 라벨 크기 PDF로 만들어 스풀 백엔드로 전송 (Windows DC를 쓸 수 없는 환경용)
+        
+        PDF 페이지 크기는 라벨 크기와 같게 맞추므로 프린터가 라벨 원래 크기로 출력합니다.
+        매수만큼 PDF를 반복하지 않고 copies를 백엔드에 그대로 넘겨 작업 하나로 인쇄합니다.
+        """
+        try:
+            pil_image = self._load_print_image(image)
+            if pil_image.mode != 'RGB':
+                pil_image = pil_image.convert('RGB')
+            
+            # 이미지 픽셀 수와 라벨 너비로 해상도를 정해 PDF 페이지 = 라벨 크기
+            if label_width_cm:
+                dpi = pil_image.width / (label_width_cm / 2.54)
+            else:
+                dpi = PRINT_PX_PER_CM * 2.54
+            pdf_path = self.artifacts.create(
+                'label_image', lambda path: pil_image.save(path, 'PDF', resolution=dpi)
+            )
+            print(f"이미지 인쇄 ({self.spool_backend.name}) - 프린터: {printer_name or '기본 프린터'}, "
+                  f"{pil_image.width} x {pil_image.height} 픽셀 ({dpi:.0f} DPI)")
+            
+            target_printer = self.spool_backend.resolve_printer(printer_name)
+            success = self.spool_backend.spool_file(
+                pdf_path,
+                target_printer,
+                copies=max(1, int(copies or 1)),
+                doc_name="Label Print"
+            )
+            if success:
+                print(f"✅ 이미지를 프린터 '{target_printer or '기본 프린터'}'로 전송 성공")
+                logger.info(f"프린터 '{target_printer or '기본 프린터'}'로 이미지 인쇄 성공 ({pdf_path})")
+            return success
+        except Exception as e:
+            logger.error(f"이미지 인쇄 실패: {e}")
+            print(f"❌ 이미지 인쇄 실패: {e}")
+            return False
+    
+    def print_label(self, pdf_path, printer_name=None, label_data=None, copies=1):
+        """라벨 인쇄"""
+        try:
+            try:
+                copies = int(copies)
+            except (ValueError, TypeError):
+                copies = 1
+            if copies < 1:
+                copies = 1
+            
+            return self.print_simple_pdf(pdf_path, printer_name, copies=copies)
+        except Exception as e:
+            logger.error(f"인쇄 중 오류 발생: {str(e)}")
+            return False
+    
+    def print_simple_pdf(self, pdf_path, printer_name, copies=1):
+        """선택된 프린터의 스풀러로 PDF 직접 전송
+        
+        시스템 기본 프린터를 바꾸지 않고, 고정 대기 시간 없이 스풀 백엔드에 맡깁니다.
+        """
+        try:
+            print(f"=== 프린터 인쇄 ({self.spool_backend.name}) ===")
+            print(f"요청된 프린터: {printer_name}")
+            print(f"PDF 파일 경로: {pdf_path}")
+            
+            target_printer = self.spool_backend.resolve_printer(printer_name)
+            success = self.spool_backend.spool_file(
+                pdf_path,
+                target_printer,
+                copies=max(1, copies),
+                doc_name="Label Print"
+            )
+            if success:
+                print(f"✅ 프린터 '{target_printer or '기본 프린터'}'로 PDF 전송 성공 (copies={copies})")
+                logger.info(f"프린터 '{target_printer or '기본 프린터'}'로 PDF 인쇄 성공")
+            return success
+            
+        except ImportError:
+            print("❌ win32print 모듈이 없습니다. pip install pywin32로 설치해주세요.")
+            return False
+            
+        except Exception as e:
+            logger.error(f"PDF 인쇄 실패: {e}")
+            print(f"❌ 인쇄 중 오류 발생: {e}")
+            return False
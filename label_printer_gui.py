@@ -1,934 +1,44 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
 import webbrowser
 from datetime import datetime
 import os
-import tempfile
-import subprocess
 import socket
-import json
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import cm
-from reportlab.lib.pagesizes import A4
-from flask import Flask, request, jsonify
-from flask_cors import CORS
 import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from label_server import LabelPrintService
+from print_queue import JOB_QUEUED, JOB_RENDERING, JOB_SPOOLING, JOB_DONE, JOB_FAILED
+from event_stream import read_sse
+from label_settings import DEFAULT_SETTINGS, load_label_settings, save_label_settings
+from printer_registry import printer_registry
+from production_store import ProductionStore, ProductionRecordIndex, ProductionWriter
+from production_table import ProductionTableModel
+from label_render import PREVIEW_PX_PER_CM, compute_net_weight
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# 라벨 설정 (10cm x 5cm)
-LABEL_WIDTH = 10 * cm
-LABEL_HEIGHT = 5 * cm
-BULK_SHEET_PAGE_SIZE = A4
-
-class LabelPrinter:
-    def __init__(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def create_label_pdf(self, data):
-        """라벨 PDF 생성"""
-        print(f"=== PDF 생성 디버깅 ===")
-        print(f"입력 데이터: {data}")
-        
-        # 임시 PDF 파일 생성
-        pdf_path = os.path.join(self.temp_dir, f"label_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
-        print(f"PDF 파일 경로: {pdf_path}")
-        
-        try:
-            # PDF 캔버스 생성
-            c = canvas.Canvas(pdf_path, pagesize=(LABEL_WIDTH, LABEL_HEIGHT))
-            print(f"PDF 캔버스 생성 성공: {LABEL_WIDTH}x{LABEL_HEIGHT}")
-        except Exception as e:
-            print(f"❌ PDF 캔버스 생성 실패: {e}")
-            raise
-        
-        # 폰트 설정
-        c.setFont("Helvetica-Bold", 16)
-        
-        # 배경 테두리 그리기
-        c.rect(0.2*cm, 0.2*cm, LABEL_WIDTH-0.4*cm, LABEL_HEIGHT-0.4*cm)
-        
-        # 제품명 (상단)
-        c.setFont("Helvetica-Bold", 14)
-        c.drawString(0.5*cm, LABEL_HEIGHT-1.2*cm, "제품 라벨")
-        
-        # 순수무게 (중앙, 가장 큰 글씨)
-        if 'net_weight' in data and data['net_weight']:
-            c.setFont("Helvetica-Bold", 28)
-            net_weight_text = f"{data['net_weight']} kg"
-            text_width = c.stringWidth(net_weight_text, "Helvetica-Bold", 28)
-            x_pos = (LABEL_WIDTH - text_width) / 2
-            c.drawString(x_pos, LABEL_HEIGHT/2 + 0.3*cm, net_weight_text)
-        
-        # 총무게와 팔렛무게 (중앙 하단)
-        c.setFont("Helvetica", 10)
-        if 'total_weight' in data and data['total_weight']:
-            total_text = f"총무게: {data['total_weight']} kg"
-            c.drawString(0.5*cm, LABEL_HEIGHT/2 - 0.5*cm, total_text)
-        
-        if 'pallet_weight' in data and data['pallet_weight']:
-            pallet_text = f"팔렛무게: {data['pallet_weight']} kg"
-            c.drawString(0.5*cm, LABEL_HEIGHT/2 - 0.8*cm, pallet_text)
-        
-        # 날짜 (하단 좌측)
-        if 'date' in data and data['date']:
-            c.setFont("Helvetica", 9)
-            c.drawString(0.5*cm, 0.8*cm, f"날짜: {data['date']}")
-        
-        # 인쇄 시간 (우측 하단)
-        c.setFont("Helvetica", 8)
-        c.drawString(LABEL_WIDTH-3*cm, 0.5*cm, f"시간: {datetime.now().strftime('%H:%M:%S')}")
-        
-        c.save()
-        print(f"✅ PDF 저장 완료: {pdf_path}")
-        
-        # 파일 존재 여부 확인
-        if os.path.exists(pdf_path):
-            file_size = os.path.getsize(pdf_path)
-            print(f"✅ PDF 파일 확인됨 - 크기: {file_size} bytes")
-        else:
-            print(f"❌ PDF 파일이 생성되지 않았습니다!")
-            
-        return pdf_path
-    
-    def create_bulk_production_sheet_pdf(self, data=None):
-        """벌크 생산 시트 PDF 생성"""
-        data = data or {}
-        pdf_path = os.path.join(self.temp_dir, f"bulk_sheet_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
-        
-        c = canvas.Canvas(pdf_path, pagesize=BULK_SHEET_PAGE_SIZE)
-        page_width, page_height = BULK_SHEET_PAGE_SIZE
-        margin = 1.0 * cm
-        
-        # Header table - 3 columns (left: 20%, center: 45%, right: 35%)
-        header_height = 1.6 * cm
-        header_top = page_height - 0.8 * cm
-        header_bottom = header_top - header_height
-        header_width = page_width - 2 * margin
-        left_col_width = header_width * 0.25
-        center_col_width = header_width * 0.40
-        right_col_width = header_width * 0.35
-        
-        # Draw header table borders
-        c.rect(margin, header_bottom, header_width, header_height)
-        c.line(margin + left_col_width, header_bottom, margin + left_col_width, header_top)
-        c.line(margin + left_col_width + center_col_width, header_bottom, margin + left_col_width + center_col_width, header_top)
-        
-        # Left cell - innofoods INC
-        header_center_y = header_bottom + header_height / 2
-        c.setFont("Helvetica-Bold", 22)
-        c.setFillColorRGB(0.0, 0.4, 0.6)
-        logo_text = "innofoods"
-        logo_x = margin + 0.3 * cm  # 왼쪽으로 이동
-        c.drawString(logo_x, header_center_y - 0.3 * cm, logo_text)
-        c.setFont("Helvetica-Bold", 7)  # INC를 더 작게
-        inc_text = "INC"
-        logo_width = c.stringWidth(logo_text, "Helvetica-Bold", 22)
-        inc_x = logo_x + logo_width + 0.2 * cm
-        c.drawString(inc_x, header_center_y - 0.5 * cm, inc_text)  # 아래로 이동
-       
-        
-        # Center cell - Daily Bulk Production Sheet
-        c.setFillColorRGB(0, 0, 0)
-        c.setFont("Helvetica-Bold", 14)  # 폰트 크기 줄임
-        title_text = "Daily Bulk Production Sheet"
-        title_width = c.stringWidth(title_text, "Helvetica-Bold", 14)
-        center_start_x = margin + left_col_width
-        title_x = center_start_x + (center_col_width - title_width) / 2
-        c.drawString(title_x, header_center_y - 0.2 * cm, title_text)
-        
-        # Right cell - Document info
-        c.setFont("Helvetica", 9)
-        doc_info = [
-            ("Document No.:", data.get("document_no", "INNO-PROU-PUT-LUS")),
-            ("Issue No.:", data.get("issue_no", "014")),
-            ("Effective Date:", data.get("effective_date", "Sep 14, 2023")),
-            ("Issued By:", data.get("issued_by", "Jason Lee")),
-            ("Approved By:", data.get("approved_by", "Jeff Chen")),
-            ("Review Date:", data.get("review_date", "Sep 14, 2023")),
-        ]
-        right_start_x = margin + left_col_width + center_col_width
-        doc_start_x = right_start_x + 0.2 * cm
-        line_spacing = 0.25 * cm  # 줄 간격 증가
-        doc_start_y = header_top - 0.3 * cm
-        for idx, (label, value) in enumerate(doc_info):
-            y_pos = doc_start_y - idx * line_spacing
-            c.drawString(doc_start_x, y_pos, label)
-            c.drawString(doc_start_x + 2.2 * cm, y_pos, value)
-        
-        # Form table - each row is a separate cell with borders
-        form_top = header_bottom - 0.3 * cm
-        form_width = page_width - 2 * margin
-        row_height = 1.0 * cm
-        left_col_width = form_width * 0.5
-        right_col_width = form_width * 0.5
-        
-        c.setFont("Helvetica", 11)
-        
-        # Helper function to draw vertically centered text in cell
-        def draw_centered_text(x, y_bottom, height, text, font_size=11):
-            center_y = y_bottom + height / 2
-            c.setFont("Helvetica", font_size)
-            c.drawString(x, center_y - 0.2 * cm, text)
-        
-        # Row 1: DATE (left) and SHIFT (right)
-        row1_y = form_top
-        row1_bottom = row1_y - row_height
-        # Left cell - DATE
-        c.rect(margin, row1_bottom, left_col_width, row_height)
-        draw_centered_text(margin + 0.15 * cm, row1_bottom, row_height, "DATE:")
-        date_value = data.get("date", "")
-        if date_value:
-            draw_centered_text(margin + 1.8 * cm, row1_bottom, row_height, date_value)
-        # Right cell - SHIFT
-        c.rect(margin + left_col_width, row1_bottom, right_col_width, row_height)
-        draw_centered_text(margin + left_col_width + 0.15 * cm, row1_bottom, row_height, "SHIFT (circle one):")
-        c.setFont("Helvetica", 9)
-        shift_center_y = row1_bottom + row_height / 2
-        c.drawString(margin + left_col_width + 3.8 * cm, shift_center_y - 0.2 * cm, "AM / PM / Graveyard")
-        shift_value = data.get("shift", "").upper()
-        if shift_value:
-            # AM 위치를 기준으로 선택값에 따라 타원형 원 그리기
-            base_x = margin + left_col_width + 3.8 * cm  # 기준 위치
-            if shift_value == "AM":
-                ellipse_center_x = base_x + 0.2 * cm  # AM은 0.2cm 오른쪽
-            elif shift_value == "PM":
-                ellipse_center_x = base_x + 0.9 * cm  # PM은 0.7cm 오른쪽 (0.3cm 추가 이동)
-            elif shift_value == "GRAVEYARD" or shift_value.startswith("G"):
-                ellipse_center_x = base_x + 1.8 * cm  # GRAVEYARD는 4cm 오른쪽
-            else:
-                ellipse_center_x = base_x + 0.2 * cm
-            
-            # 타원형 원 그리기 (오른쪽으로 늘린 형태)
-            ellipse_width = 0.8 * cm  # 가로 너비
-            ellipse_height = 0.3 * cm  # 세로 높이
-            ellipse_x1 = ellipse_center_x - ellipse_width / 2
-            ellipse_y1 = shift_center_y - ellipse_height / 2
-            ellipse_x2 = ellipse_center_x + ellipse_width / 2
-            ellipse_y2 = shift_center_y + ellipse_height / 2
-            c.ellipse(ellipse_x1, ellipse_y1, ellipse_x2, ellipse_y2)
-        
-        # Row 2: Supervisor Name (left) and Employee Name (right)
-        row2_y = row1_y - row_height
-        row2_bottom = row2_y - row_height
-        c.setFont("Helvetica", 11)
-        # Left cell
-        c.rect(margin, row2_bottom, left_col_width, row_height)
-        supervisor_label = "Supervisor Name:"
-        supervisor_label_x = margin + 0.15 * cm
-        draw_centered_text(supervisor_label_x, row2_bottom, row_height, supervisor_label)
-        supervisor_value = data.get("supervisor_name", "")
-        if supervisor_value:
-            # 타이틀 끝에서 여백 추가
-            supervisor_label_width = c.stringWidth(supervisor_label, "Helvetica", 11)
-            supervisor_value_x = supervisor_label_x + supervisor_label_width + 0.3 * cm
-            draw_centered_text(supervisor_value_x, row2_bottom, row_height, supervisor_value)
-        # Right cell
-        c.rect(margin + left_col_width, row2_bottom, right_col_width, row_height)
-        employee_label = "Employee Name:"
-        employee_label_x = margin + left_col_width + 0.15 * cm
-        draw_centered_text(employee_label_x, row2_bottom, row_height, employee_label)
-        employee_value = data.get("employee_name", "")
-        if employee_value:
-            # 타이틀 끝에서 여백 추가
-            employee_label_width = c.stringWidth(employee_label, "Helvetica", 11)
-            employee_value_x = employee_label_x + employee_label_width + 0.3 * cm
-            draw_centered_text(employee_value_x, row2_bottom, row_height, employee_value)
-        
-        # Row 3: Product Name (left) and Bulk Lot Code (right)
-        row3_y = row2_y - row_height
-        row3_bottom = row3_y - row_height
-        # Left cell
-        c.rect(margin, row3_bottom, left_col_width, row_height)
-        draw_centered_text(margin + 0.15 * cm, row3_bottom, row_height, "Product Name:")
-        product_value = data.get("product_name", "")
-        if product_value:
-            draw_centered_text(margin + 2.8 * cm, row3_bottom, row_height, product_value)
-        # Right cell
-        c.rect(margin + left_col_width, row3_bottom, right_col_width, row_height)
-        draw_centered_text(margin + left_col_width + 0.15 * cm, row3_bottom, row_height, "Bulk Lot Code:")
-        bulk_lot_value = data.get("bulk_lot_code", "")
-        if bulk_lot_value:
-            draw_centered_text(margin + left_col_width + 2.8 * cm, row3_bottom, row_height, bulk_lot_value)
-        
-        # Row 4: Parchment Paper and Quantity (full width)
-        row4_y = row3_y - row_height
-        row4_bottom = row4_y - row_height
-        # Full width cell
-        c.rect(margin, row4_bottom, form_width, row_height)
-        row4_center_y = row4_bottom + row_height / 2 + 0.27 * cm  # 콘텐츠를 위로 이동
-        
-        # Parchment Paper: REUSE
-        c.drawString(margin + 0.15 * cm, row4_center_y - 0.2 * cm, "Parchment Paper: Reuse")
-        reuse_text_width = c.stringWidth("Parchment Paper: Reuse", "Helvetica", 11)
-        
-        # 두 개 겹친 네모박스 (중심 같고 크기만 다름)
-        checkbox_center_x = margin + reuse_text_width + 0.2 * cm + 0.2 * cm  # REUSE 텍스트 끝 + 여백 + 박스 중심
-        checkbox_center_y = row4_center_y
-        
-        # 첫 번째 네모박스 (큰 것)
-        checkbox_size1 = 0.4 * cm
-        checkbox1_x = checkbox_center_x - checkbox_size1 / 2
-        checkbox1_y = checkbox_center_y - checkbox_size1 / 2
-        c.rect(checkbox1_x, checkbox1_y, checkbox_size1, checkbox_size1)
-        
-        # 두 번째 네모박스 (작은 것, 같은 중심)
-        checkbox_size2 = 0.25 * cm
-        checkbox2_x = checkbox_center_x - checkbox_size2 / 2
-        checkbox2_y = checkbox_center_y - checkbox_size2 / 2
-        c.rect(checkbox2_x, checkbox2_y, checkbox_size2, checkbox_size2)
-        
-        if data.get("parchment_reuse"):
-            # 체크 표시 (큰 박스에만)
-            c.line(checkbox1_x, checkbox1_y, checkbox1_x + checkbox_size1, checkbox1_y + checkbox_size1)
-            c.line(checkbox1_x, checkbox1_y + checkbox_size1, checkbox1_x + checkbox_size1, checkbox1_y)
-        
-        # or Lot code: 밑줄 있는 입력 폼
-        lot_code_label = "or Lot code:"
-        lot_code_label_x = checkbox_center_x + checkbox_size1 / 2 + 0.3 * cm
-        c.drawString(lot_code_label_x, row4_center_y - 0.2 * cm, lot_code_label)
-        lot_code_label_width = c.stringWidth(lot_code_label, "Helvetica", 11)
-        lot_code_line_x = lot_code_label_x + lot_code_label_width + 0.2 * cm
-        lot_code_line_width = 4.0 * cm
-        lot_code_line_y = row4_center_y - 0.3 * cm
-        c.line(lot_code_line_x, lot_code_line_y, lot_code_line_x + lot_code_line_width, lot_code_line_y)
-        lot_code_value = data.get("parchment_lot_code", "")
-        if lot_code_value:
-            c.drawString(lot_code_line_x + 0.1 * cm, lot_code_line_y + 0.1 * cm, lot_code_value)
-        
-        # 체크되면 parchment 라인 위에 텍스트 표시 (3cm 오른쪽으로 이동)
-        if data.get("no_choco_coating"):
-            choco_text = "No need for choco coating"
-            choco_text_y = lot_code_line_y - 0.4 * cm  # 라인 위에 표기
-            choco_text_x = lot_code_line_x + 3.0 * cm  # 3cm 오른쪽으로 이동
-            c.drawString(choco_text_x, choco_text_y, choco_text)
-        
-        # Quantity: 오른쪽에 밑줄 있는 입력줄
-        quantity_label = "Quantity:"
-        quantity_label_width = c.stringWidth(quantity_label, "Helvetica", 11)
-        quantity_label_x = page_width - margin - 5.0 * cm - quantity_label_width
-        c.drawString(quantity_label_x, row4_center_y - 0.2 * cm, quantity_label)
-        quantity_line_x = quantity_label_x + quantity_label_width + 0.2 * cm
-        quantity_line_width = 4.0 * cm
-        quantity_line_y = row4_center_y - 0.3 * cm
-        c.line(quantity_line_x, quantity_line_y, quantity_line_x + quantity_line_width, quantity_line_y)
-        quantity_value = data.get("quantity", "")
-        if quantity_value:
-            c.drawString(quantity_line_x + 0.1 * cm, quantity_line_y + 0.1 * cm, quantity_value)
-        
-        # Row 5: Quality Checked (full width)
-        qc_y = row4_y - row_height
-        qc_bottom = qc_y - row_height
-        c.rect(margin, qc_bottom, form_width, row_height)
-        qc_center_y = qc_bottom + row_height / 2
-        c.drawString(margin + 0.15 * cm, qc_center_y - 0.2 * cm, "Quality Checked (e.g. color, texture, crumb, taste) - Supervisor Initial:")
-        quality_value = data.get("quality_checked", "")
-        if quality_value:
-            qc_initial_x = page_width - margin - c.stringWidth(quality_value, "Helvetica", 11) - 0.15 * cm
-            c.drawString(qc_initial_x, qc_center_y - 0.2 * cm, quality_value)
-        
-        # Thick line separator after Quality Checked
-        c.setLineWidth(2)
-        separator_y = qc_bottom - 0.2 * cm
-        c.line(margin, separator_y, page_width - margin, separator_y)
-        c.setLineWidth(1)
-        
-        # Main table
-        table_top = separator_y - 0.3 * cm
-        table_left = margin
-        table_width = page_width - 2 * margin
-        table_header_height = 1.1 * cm
-        body_row_height = 1.0 * cm
-        body_rows = 15
-        table_height = table_header_height + body_rows * body_row_height
-        table_bottom = table_top - table_height
-        
-        c.rect(table_left, table_bottom, table_width, table_height)
-        
-        column_specs = [
-            ("Bulk Plastic Bag \nLot Codes", 0.28),
-            ("Bulk Bag \nQTY", 0.14),
-            ("Pallet #", 0.13),
-            ("Total KG", 0.13),
-            ("Notes", 0.24),
-            ("Initial", 0.08),
-        ]
-        
-        x_positions = [table_left]
-        for _, ratio in column_specs:
-            x_positions.append(x_positions[-1] + ratio * table_width)
-        for x in x_positions[1:-1]:
-            c.line(x, table_bottom, x, table_top)
-        c.line(table_left, table_top - table_header_height, table_left + table_width, table_top - table_header_height)
-        
-        # Header row - vertically centered
-        c.setFont("Helvetica-Bold", 11)
-        header_center_y = table_top - table_header_height / 2
-        for idx, (title, _) in enumerate(column_specs):
-            text_x = x_positions[idx] + 0.3 * cm
-            # 줄바꿈 처리
-            if '\n' in title:
-                lines = title.split('\n')
-                line_height = 0.4 * cm
-                total_height = len(lines) * line_height
-                start_y = header_center_y + total_height / 2 - line_height / 2
-                for line_idx, line in enumerate(lines):
-                    y_pos = start_y - line_idx * line_height
-                    c.drawString(text_x, y_pos - 0.1 * cm, line)
-            else:
-                c.drawString(text_x, header_center_y - 0.2 * cm, title)
-        
-        # Body rows - draw horizontal lines
-        c.setFont("Helvetica", 10)
-        for row in range(body_rows):
-            y = table_top - table_header_height - row * body_row_height
-            c.line(table_left, y, table_left + table_width, y)
-        
-        # Body data - vertically centered
-        table_data = data.get("production_table", [])
-        wrap_columns = {"bulk_bag_qty", "notes"}
-        for row_idx in range(min(body_rows, len(table_data))):
-            row_data = table_data[row_idx] or {}
-            cell_top = table_top - table_header_height - row_idx * body_row_height
-            cell_bottom = cell_top - body_row_height
-            cell_center_y = cell_bottom + body_row_height / 2
-            
-            for col_idx, key in enumerate(["bulk_plastic_bag_lot_codes", "bulk_bag_qty", "pallet_num", "total_kg", "notes", "initial"]):
-                value = row_data.get(key, "")
-                if not value:
-                    continue
-                
-                text_x = x_positions[col_idx] + 0.2 * cm
-                
-                if key in wrap_columns:
-                    text_obj = c.beginText()
-                    text_obj.setFont("Helvetica", 10)
-                    text_obj.setLeading(11)
-                    
-                    max_width = column_specs[col_idx][1] * table_width - 0.4 * cm
-                    words = str(value).split()
-                    lines = []
-                    current_line = ""
-                    for word in words:
-                        candidate = f"{current_line} {word}".strip()
-                        if c.stringWidth(candidate, "Helvetica", 10) <= max_width:
-                            current_line = candidate
-                        else:
-                            if current_line:
-                                lines.append(current_line)
-                            current_line = word
-                    if current_line:
-                        lines.append(current_line)
-                    
-                    # Center wrapped text vertically
-                    total_text_height = len(lines) * 11
-                    text_start_y = cell_center_y + total_text_height / 2 - 5
-                    text_obj.setTextOrigin(text_x, text_start_y)
-                    for line in lines:
-                        text_obj.textLine(line)
-                    c.drawText(text_obj)
-                else:
-                    # Center single line text vertically
-                    c.drawString(text_x, cell_center_y - 0.2 * cm, str(value))
-        
-        # Production Notes와 Supervisor Name & Signature 행 (테이블 바로 아래)
-        notes_signature_row_height = body_row_height  # 테이블 행과 같은 높이
-        notes_signature_top = table_bottom
-        notes_signature_bottom = notes_signature_top - notes_signature_row_height
-        notes_signature_width = table_width / 2  # 반반으로 나누기
-        
-        # 테두리 그리기
-        c.rect(table_left, notes_signature_bottom, table_width, notes_signature_row_height)
-        # 중간 구분선
-        c.line(table_left + notes_signature_width, notes_signature_bottom, 
-               table_left + notes_signature_width, notes_signature_top)
-        
-        # Production Notes (왼쪽 반)
-        notes_label_x = table_left + 0.2 * cm
-        notes_label_y = notes_signature_bottom + notes_signature_row_height / 2
-        c.setFont("Helvetica-Bold", 11)
-        c.drawString(notes_label_x, notes_label_y - 0.2 * cm, "Production Notes:")
-        
-        notes_text = data.get("production_notes", "")
-        if notes_text:
-            c.setFont("Helvetica", 10)
-            text_object = c.beginText()
-            text_object.setTextOrigin(notes_label_x, notes_label_y - 0.5 * cm)
-            text_object.setLeading(11)
-            max_width = notes_signature_width - 0.4 * cm
-            words = str(notes_text).split()
-            lines = []
-            current_line = ""
-            for word in words:
-                candidate = f"{current_line} {word}".strip()
-                if c.stringWidth(candidate, "Helvetica", 10) <= max_width:
-                    current_line = candidate
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = word
-            if current_line:
-                lines.append(current_line)
-            for line in lines[:3]:  # 최대 3줄
-                text_object.textLine(line)
-            c.drawText(text_object)
-        
-        # Supervisor Name & Signature (오른쪽 반)
-        supervisor_label_x = table_left + notes_signature_width + 0.2 * cm
-        supervisor_label_y = notes_signature_bottom + notes_signature_row_height / 2
-        c.setFont("Helvetica-Bold", 11)
-        c.drawString(supervisor_label_x, supervisor_label_y - 0.2 * cm, "Supervisor Name & Signature:")
-        
-        supervisor_text = data.get("supervisor_signature", "")
-        if supervisor_text:
-            c.setFont("Helvetica", 10)
-            c.drawString(supervisor_label_x, supervisor_label_y - 0.5 * cm, supervisor_text)
-        
-        # Verification by QA와 Date 행 (Production Notes/Supervisor 아래)
-        verification_row_height = body_row_height  # 테이블 행과 같은 높이
-        verification_top = notes_signature_bottom - 0.1 * cm
-        verification_bottom = verification_top - verification_row_height
-        verification_width = table_width / 2  # 반반으로 나누기
-        
-        # Verification by QA (왼쪽 반)
-        verification_center_y = verification_bottom + verification_row_height / 2 - 0.2 * cm
-        verification_label_x = table_left + 0.2 * cm
-        c.setFont("Helvetica-Bold", 11)
-        c.drawString(verification_label_x, verification_center_y - 0.2 * cm, "Verification by QA:")
-        
-        # 밑줄 (텍스트와 같은 높이)
-        line_y = verification_center_y - 0.3 * cm
-        line_start = verification_label_x + 3.8 * cm
-        line_end = table_left + verification_width - 0.3 * cm
-        c.line(line_start, line_y, line_end, line_y)
-        
-        verification_text = data.get("verified_by_qa", "")
-        if verification_text:
-            c.setFont("Helvetica", 10)
-            c.drawString(line_start + 0.2 * cm, line_y - 0.1 * cm, verification_text)
-        
-        # Date (오른쪽 반)
-        date_center_y = verification_bottom + verification_row_height / 2 -0.2 * cm
-        date_label_x = table_left + verification_width + 0.2 * cm
-        c.setFont("Helvetica-Bold", 11)
-        c.drawString(date_label_x, date_center_y - 0.2 * cm, "Date:")
-        
-        # 밑줄 (Date 텍스트 아래)
-        date_line_y = date_center_y - 0.3 * cm
-        date_line_start = date_label_x + 1.0 * cm
-        date_line_end = table_left + table_width - 0.3 * cm
-        c.line(date_line_start, date_line_y, date_line_end, date_line_y)
-        
-        date_text = data.get("sign_date", "")
-        if date_text:
-            c.setFont("Helvetica", 10)
-            c.drawString(date_line_start + 0.2 * cm, date_line_y + 0.2 * cm, date_text)
-        
-        c.setFont("Helvetica", 9)
-        c.drawRightString(page_width - margin, margin - 0.4 * cm, "Page 1")
-        c.drawString(margin, margin - 0.4 * cm, "Inno Foods Inc.")
-        
-        c.save()
-        return pdf_path
-    
-    def print_image(self, image_path, printer_name, label_width_cm=None, label_height_cm=None):
-        """이미지를 지정된 프린터로 직접 인쇄 (Word/한글 방식)
-        
-        Args:
-            image_path: 인쇄할 이미지 파일 경로
-            printer_name: 프린터 이름
-            label_width_cm: 라벨 너비 (cm) - None이면 이미지 크기 기반으로 계산
-            label_height_cm: 라벨 높이 (cm) - None이면 이미지 크기 기반으로 계산
-        """
-        try:
-            import win32print
-            import win32ui
-            from PIL import Image, ImageWin
-            
-            print(f"이미지 인쇄 시작 - 프린터: {printer_name}")
-            print(f"이미지 파일: {image_path}")
-            
-            # 이미지 로드
-            pil_image = Image.open(image_path)
-            img_width, img_height = pil_image.size
-            
-            # RGB 모드로 변환
-            if pil_image.mode != 'RGB':
-                pil_image = pil_image.convert('RGB')
-            
-            # win32print를 사용하여 이미지를 프린터로 직접 전송
-            # DC(Device Context) 생성 (Word/한글이 하는 방식)
-            hdc = win32ui.CreateDC()
-            hdc.CreatePrinterDC(printer_name)
-            
-            try:
-                # 인쇄 시작
-                hdc.StartDoc("Label Print")
-                hdc.StartPage()
-                
-                # 프린터 DPI 가져오기
-                printer_dpi_x = hdc.GetDeviceCaps(88)  # LOGPIXELSX
-                printer_dpi_y = hdc.GetDeviceCaps(90)  # LOGPIXELSY
-                
-                # GetDeviceCaps 상수 정의
-                HORZRES = 8        # 인쇄 가능 너비
-                VERTRES = 10      # 인쇄 가능 높이
-                PHYSICALWIDTH = 110   # 실제 페이지 너비
-                PHYSICALHEIGHT = 111  # 실제 페이지 높이
-                PHYSICALOFFSETX = 112  # 왼쪽 여백
-                PHYSICALOFFSETY = 113  # 위쪽 여백
-                
-                # 프린터의 실제 인쇄 가능 영역 가져오기
-                printable_width = hdc.GetDeviceCaps(HORZRES)
-                printable_height = hdc.GetDeviceCaps(VERTRES)
-                
-                # 프린터의 실제 페이지 크기 가져오기
-                page_width = hdc.GetDeviceCaps(PHYSICALWIDTH)
-                page_height = hdc.GetDeviceCaps(PHYSICALHEIGHT)
-                
-                # 프린터의 여백(오프셋) 가져오기
-                try:
-                    printer_margin_x = hdc.GetDeviceCaps(PHYSICALOFFSETX)
-                    printer_margin_y = hdc.GetDeviceCaps(PHYSICALOFFSETY)
-                    print(f"프린터 페이지 크기: {page_width} x {page_height} 픽셀")
-                    print(f"프린터 여백: ({printer_margin_x}, {printer_margin_y}) 픽셀")
-                except Exception as e:
-                    printer_margin_x = 0
-                    printer_margin_y = 0
-                    print(f"⚠️ 프린터 여백 정보를 가져올 수 없습니다: {e}")
-                    # 대안: 페이지 크기와 인쇄 가능 영역 차이로 여백 추정
-                    if page_width > printable_width:
-                        printer_margin_x = (page_width - printable_width) // 2
-                    if page_height > printable_height:
-                        printer_margin_y = (page_height - printable_height) // 2
-                    print(f"추정된 프린터 여백: ({printer_margin_x}, {printer_margin_y}) 픽셀")
-                
-                print(f"프린터 DPI: {printer_dpi_x} x {printer_dpi_y}")
-                print(f"프린터 인쇄 가능 영역: {printable_width} x {printable_height} 픽셀")
-                print(f"이미지 크기: {img_width} x {img_height} 픽셀 (300 DPI 기준)")
-                
-                # 라벨용지 사이즈에 맞게 인쇄
-                # label_width_cm, label_height_cm가 제공되면 그 값을 사용
-                # 없으면 이미지의 300 DPI 기준 물리적 크기 사용
-                if label_width_cm is not None and label_height_cm is not None:
-                    # 라벨용지 사이즈를 인치로 변환 (1cm = 0.393701 인치)
-                    physical_width_inch = label_width_cm * 0.393701
-                    physical_height_inch = label_height_cm * 0.393701
-                    print(f"라벨용지 사이즈 사용: {label_width_cm}cm x {label_height_cm}cm ({physical_width_inch:.2f}\" x {physical_height_inch:.2f}\")")
-                else:
-                    # 이미지는 300 DPI로 저장되었으므로, 물리적 크기 계산 (인치 단위)
-                    physical_width_inch = img_width / 300.0
-                    physical_height_inch = img_height / 300.0
-                    print(f"이미지 크기 기반 계산: {physical_width_inch:.2f}\" x {physical_height_inch:.2f}\"")
-                
-                # 프린터 DPI에서 라벨용지 사이즈에 맞는 픽셀 수 계산
-                scaled_width = int(physical_width_inch * printer_dpi_x)
-                scaled_height = int(physical_height_inch * printer_dpi_y)
-                
-                print(f"프린터 DPI 기준 출력 크기: {scaled_width} x {scaled_height} 픽셀")
-                print(f"프린터 인쇄 가능 영역: {printable_width} x {printable_height} 픽셀")
-                
-                # 라벨용지 사이즈에 맞게 정확히 출력
-                # 인쇄 가능 영역 내에서만 출력하도록 보장
-                # 비율을 유지하면서 인쇄 가능 영역에 맞게 조정
-                if scaled_width > printable_width or scaled_height > printable_height:
-                    # 인쇄 가능 영역보다 크면 비율을 유지하며 맞춤
-                    width_ratio = printable_width / scaled_width
-                    height_ratio = printable_height / scaled_height
-                    scale_ratio = min(width_ratio, height_ratio)
-                    
-                    scaled_width = int(scaled_width * scale_ratio)
-                    scaled_height = int(scaled_height * scale_ratio)
-                    
-                    print(f"⚠️ 이미지가 인쇄 가능 영역을 초과하여 비율 유지하며 축소: {scaled_width} x {scaled_height} 픽셀")
-                else:
-                    print(f"✅ 이미지 크기 OK: {scaled_width} x {scaled_height} 픽셀 (인쇄 가능 영역 내)")
-                
-                # PIL ImageWin을 사용하여 이미지를 프린터로 직접 그리기
-                # 이미지를 프린터 DPI에 맞게 리사이즈
-                # 원본 이미지를 프린터 크기에 맞게 조정
-                if pil_image.size[0] != scaled_width or pil_image.size[1] != scaled_height:
-                    print(f"이미지 리사이즈: {pil_image.size[0]} x {pil_image.size[1]} → {scaled_width} x {scaled_height}")
-                    pil_image = pil_image.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
-                
-                # 인쇄 가능 영역 내에 정확히 맞도록 보장
-                # 스케일된 크기가 인쇄 가능 영역을 초과하지 않도록 확인
-                final_width = min(scaled_width, printable_width)
-                final_height = min(scaled_height, printable_height)
-                
-                if final_width != scaled_width or final_height != scaled_height:
-                    print(f"⚠️ 인쇄 가능 영역에 맞게 조정: {scaled_width} x {scaled_height} → {final_width} x {final_height}")
-                    pil_image = pil_image.resize((final_width, final_height), Image.Resampling.LANCZOS)
-                
-                dib = ImageWin.Dib(pil_image)
-                
-                # 프린터에 이미지 그리기
-                # 프린터 여백을 고려하여 이미지를 그릴 위치 결정
-                # 라벨 프린터는 보통 여백이 없어야 하므로, 여백을 무시하고 (0,0)부터 그리기
-                # 만약 프린터 여백이 있다면, 여백 위치에 맞춰서 그리기
-                
-                # 여백을 무시하고 (0, 0)부터 그리기 (라벨 프린터용)
-                print_offset_x = 0
-                print_offset_y = 0
-                
-                # 만약 프린터 여백을 고려하려면 아래 주석 해제:
-                # print_offset_x = printer_margin_x
-                # print_offset_y = printer_margin_y
-                
-                # 프린터의 실제 물리적 크기 그대로 출력
-                # 인쇄 가능 영역 내에 정확히 맞춤
-                target_rect = (print_offset_x, print_offset_y, 
-                              print_offset_x + final_width, 
-                              print_offset_y + final_height)
-                dib.draw(hdc.GetHandleOutput(), target_rect)
-                
-                print(f"인쇄 시작 위치: ({print_offset_x}, {print_offset_y})")
-                print(f"프린터 여백 정보: ({printer_margin_x}, {printer_margin_y}) - 이미지는 여백 무시하고 (0,0)부터 그려집니다")
-                
-                print(f"최종 인쇄 크기: {final_width} x {final_height} 픽셀")
-                
-                hdc.EndPage()
-                hdc.EndDoc()
-                
-                print(f"✅ 이미지를 프린터 '{printer_name}'로 직접 전송 성공")
-                logger.info(f"프린터 '{printer_name}'로 이미지 인쇄 성공")
-                return True
-                
-            finally:
-                hdc.DeleteDC()
-                
-        except ImportError:
-            print("❌ win32print 모듈이 없습니다. pip install pywin32 pillow로 설치해주세요.")
-            return False
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            logger.error(f"이미지 인쇄 실패: {e}")
-            print(f"❌ 이미지 인쇄 실패: {e}")
-            return False
-    
-    def print_label(self, pdf_path, printer_name=None, label_data=None, copies=1):
-        """라벨 인쇄"""
-        try:
-            try:
-                copies = int(copies)
-            except (ValueError, TypeError):
-                copies = 1
-            if copies < 1:
-                copies = 1
-            
-            # CUPS를 통한 인쇄 (Linux/macOS)
-            if os.name == 'posix':
-                cmd = ['lp']
-                if printer_name:
-                    cmd.extend(['-d', printer_name])
-                if copies > 1:
-                    cmd.extend(['-n', str(copies)])
-                cmd.append(pdf_path)
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0:
-                    logger.info(f"라벨이 성공적으로 인쇄되었습니다: {pdf_path}")
-                    return True
-                else:
-                    logger.error(f"인쇄 실패: {result.stderr}")
-                    return False
-            else:
-                # Windows의 경우 - PDF로 인쇄
-                if printer_name:
-                    print(f"Windows 인쇄 시도 - 프린터: {printer_name}")
-                    success = True
-                    for i in range(copies):
-                        if not self.print_simple_pdf(pdf_path, printer_name):
-                            success = False
-                            break
-                    return success
-                else:
-                    # 기본 프린터로 인쇄
-                    for i in range(copies):
-                        os.startfile(pdf_path, "print")
-                    logger.info(f"라벨이 기본 프린터로 인쇄되었습니다: {pdf_path} (copies={copies})")
-                    return True
-        except Exception as e:
-            logger.error(f"인쇄 중 오류 발생: {str(e)}")
-            return False
-    
-    def print_simple_pdf(self, pdf_path, printer_name, copies=1):
-        """선택된 프린터로 PDF 인쇄"""
-        try:
-            import win32print
-            
-            print(f"=== 프린터 인쇄 디버깅 ===")
-            print(f"요청된 프린터: {printer_name}")
-            print(f"PDF 파일 경로: {pdf_path}")
-            
-            # 사용 가능한 프린터 목록 확인
-            printers = win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS)
-            printer_names = [printer[2] for printer in printers]
-            print(f"시스템에 설치된 프린터 목록: {printer_names}")
-            
-            # 현재 기본 프린터 저장
-            original_default = win32print.GetDefaultPrinter()
-            print(f"현재 기본 프린터: {original_default}")
-            
-            # 프린터 존재 여부 확인
-            if printer_name not in printer_names:
-                print(f"❌ 프린터 '{printer_name}'를 찾을 수 없습니다!")
-                print(f"사용 가능한 프린터: {printer_names}")
-                
-                # 가장 비슷한 프린터 찾기
-                similar_printers = [p for p in printer_names if printer_name.lower() in p.lower() or p.lower() in printer_name.lower()]
-                if similar_printers:
-                    print(f"비슷한 프린터 발견: {similar_printers}")
-                    printer_name = similar_printers[0]
-                    print(f"프린터를 '{printer_name}'로 변경하여 시도합니다.")
-                else:
-                    print("기본 프린터로 인쇄합니다.")
-                    for i in range(copies):
-                        for copy_idx in range(max(1, copies)):
-                            os.startfile(pdf_path, 'print')
-                    return True
-            
-            # PDF를 특정 프린터로 직접 인쇄 (PowerShell 사용)
-            print(f"PDF 인쇄 시작 - 프린터: {printer_name}")
-            
-            # 경로 이스케이프 처리
-            pdf_path_escaped = pdf_path.replace('\\', '\\\\').replace("'", "''")
-            printer_name_escaped = printer_name.replace("'", "''")
-            
-            try:
-                # 방법 1: Adobe Reader의 /t 옵션으로 직접 프린터 지정 (가장 확실한 방법)
-                print("Adobe Reader로 직접 프린터 지정 인쇄 시도...")
-                
-                ps_script = f'''
-$pdfPath = '{pdf_path_escaped}'
-$printerName = '{printer_name_escaped}'
-
-# Adobe Reader 경로 확인
-$acrord64Path = "C:\\Program Files (x86)\\Adobe\\Acrobat Reader DC\\Reader\\AcroRd32.exe"
-$acrord32Path = "C:\\Program Files\\Adobe\\Acrobat DC\\Acrobat\\Acrobat.exe"
-$acrord2024Path = "C:\\Program Files\\Adobe\\Acrobat Reader DC\\AcrobatReader.exe"
-
-if (Test-Path $acrord64Path) {{
-    # Adobe Reader의 /t 옵션: /t <파일경로> <프린터명>
-    Start-Process -FilePath $acrord64Path -ArgumentList "/t", $pdfPath, $printerName -WindowStyle Hidden
-    Write-Host "Adobe Reader로 프린터 $printerName 로 인쇄 시작"
-    exit 0
-}} elseif (Test-Path $acrord2024Path) {{
-    Start-Process -FilePath $acrord2024Path -ArgumentList "/t", $pdfPath, $printerName -WindowStyle Hidden
-    Write-Host "Adobe Reader로 프린터 $printerName 로 인쇄 시작"
-    exit 0
-}} elseif (Test-Path $acrord32Path) {{
-    Start-Process -FilePath $acrord32Path -ArgumentList "/t", $pdfPath, $printerName -WindowStyle Hidden
-    Write-Host "Adobe Reader로 프린터 $printerName 로 인쇄 시작"
-    exit 0
-}} else {{
-    Write-Host "Adobe Reader를 찾을 수 없습니다. 기본 프린터 변경 방법 사용"
-    exit 1
-}}
-'''
-                
-                success = True
-                for copy_idx in range(max(1, copies)):
-                    result = subprocess.run([
-                        'powershell', '-Command', ps_script
-                    ], capture_output=True, text=True, timeout=10)
-                    
-                    if result.returncode == 0:
-                        print(f"✅ Adobe Reader를 통해 프린터 '{printer_name}'로 PDF 인쇄 성공 (copy {copy_idx + 1}/{copies})")
-                        logger.info(f"프린터 '{printer_name}'로 PDF 인쇄 성공 (copy {copy_idx + 1}/{copies})")
-                        if copies > 1 and copy_idx < copies - 1:
-                            import time  # pylint: disable=import-outside-toplevel
-                            time.sleep(1)
-                    else:
-                        print(f"⚠️ Adobe Reader 방법 실패: {result.stderr}")
-                        print("대체 방법: 기본 프린터 임시 변경 후 인쇄...")
-                        success = False
-                        break
-                
-                if success:
-                    return True
-                raise Exception("Adobe Reader 방법 실패")
-                    
-            except Exception as e:
-                print(f"⚠️ Adobe Reader 방법 실패: {e}")
-                
-                # 방법 2: 기본 프린터 임시 변경 (폴백)
-                try:
-                    win32print.SetDefaultPrinter(printer_name)
-                    print(f"✅ 기본 프린터를 '{printer_name}'로 임시 변경 성공")
-                    
-                    # 변경 확인 및 충분한 대기
-                    import time
-                    time.sleep(2)  # 프린터 변경이 시스템에 완전히 반영되도록 대기
-                    
-                    current_printer = win32print.GetDefaultPrinter()
-                    print(f"⚠️ 인쇄 직전 기본 프린터 확인: {current_printer}")
-                    
-                    if current_printer != printer_name:
-                        print(f"❌ 경고: 기본 프린터가 '{current_printer}'로 되어 있습니다!")
-                        print(f"   예상된 프린터: '{printer_name}'")
-                        # 다시 시도
-                        win32print.SetDefaultPrinter(printer_name)
-                        time.sleep(1)
-                        current_printer = win32print.GetDefaultPrinter()
-                    
-                    if current_printer == printer_name:
-                        print(f"✅ 확인: 기본 프린터가 '{printer_name}'로 정확히 설정되어 있습니다.")
-                        for copy_idx in range(max(1, copies)):
-                            os.startfile(pdf_path, 'print')
-                            print(f"✅ PDF가 프린터로 전송되었습니다: {current_printer} (copy {copy_idx + 1}/{copies})")
-                            time.sleep(5)
-                        
-                        # 원래 기본 프린터로 복원
-                        try:
-                            win32print.SetDefaultPrinter(original_default)
-                            print(f"✅ 기본 프린터 복원 성공: {original_default}")
-                        except Exception as e2:
-                            print(f"⚠️ 기본 프린터 복원 실패: {e2}")
-                        
-                        logger.info(f"프린터 '{printer_name}'로 PDF 인쇄 성공")
-                        return True
-                    else:
-                        print(f"❌ 기본 프린터 변경 실패. 현재 프린터: {current_printer}")
-                        for copy_idx in range(max(1, copies)):
-                            os.startfile(pdf_path, 'print')
-                        return True
-                        
-                except Exception as e2:
-                    print(f"❌ 기본 프린터 변경 방법도 실패: {e2}")
-                    print("기본 프린터로 인쇄합니다.")
-                    for copy_idx in range(max(1, copies)):
-                        os.startfile(pdf_path, 'print')
-                    return True
-            
-        except ImportError:
-            print("❌ win32print 모듈이 없습니다. pip install pywin32로 설치해주세요.")
-            # win32print가 없으면 기본 방법으로 인쇄
-            for copy_idx in range(max(1, copies)):
-                os.startfile(pdf_path, "print")
-            logger.info(f"PDF가 기본 프린터로 인쇄됨: {pdf_path}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"PDF 인쇄 실패: {e}")
-            print(f"❌ 인쇄 중 오류 발생: {e}")
-            
-            # 오류 발생 시 기본 방법으로 인쇄
-            try:
-                print("기본 방법으로 인쇄 시도...")
-                for copy_idx in range(max(1, copies)):
-                    os.startfile(pdf_path, "print")
-                logger.info(f"PDF가 기본 프린터로 인쇄됨: {pdf_path}")
-                return True
-            except Exception as e2:
-                logger.error(f"기본 인쇄도 실패: {e2}")
-                return False
-    
-    
-    
+# 미리보기 갱신 지연 (입력이 멈춘 뒤 한 번만 그림)
+PREVIEW_DEBOUNCE_MS = 150
+# 다시 쓸 수 있도록 보관하는 미리보기 이미지 수
+PREVIEW_PHOTO_CACHE_SIZE = 16
+# Production Data Table에서 위젯을 만드는 행 수 (데이터 행은 제한 없이 늘어남)
+PRODUCTION_TABLE_VISIBLE_ROWS = 15
+# 마우스 휠 한 칸에 스크롤하는 행 수
+PRODUCTION_TABLE_WHEEL_ROWS = 3
+# 원격 인쇄 작업 상태 확인 간격과 최대 대기 시간 (초)
+REMOTE_JOB_POLL_INTERVAL = 0.5
+REMOTE_JOB_TIMEOUT = 120
+# 원격 서버 이벤트 스트림이 끊겼을 때 다시 연결하기까지 대기 시간 (초)
+REMOTE_EVENTS_RETRY = 5
+# 종료 시 남은 양식 저장을 기다리는 최대 시간 (초)과 완료 확인 간격 (밀리초)
+CLOSE_SAVE_TIMEOUT = 10
+CLOSE_POLL_MS = 100
 
 class LabelPrinterGUI:
     def __init__(self, root):
@@ -942,11 +52,7 @@ class LabelPrinterGUI:
         else:  # Linux/macOS
             self.root.attributes('-zoomed', True)
         
-        # 프린터 인스턴스
-        self.printer = LabelPrinter()
-        
         # Flask 서버 관련
-        self.flask_app = None
         self.server_thread = None
         self.server_running = False
         
@@ -954,151 +60,74 @@ class LabelPrinterGUI:
         self.print_history = []
         
         # 양식 데이터 저장
-        self.production_records = []
+        self.production_records = ProductionRecordIndex()
         self.load_production_records()
         
-        # 라벨 크기 설정 (TXT 파일에서 읽기)
-        self.label_width_cm = 10.0  # 기본값
-        self.label_height_cm = 5.0  # 기본값
-        self.font_name = "Arial"  # 기본값
-        self.font_size = 48  # 기본값
-        self.extra_weight = 3.0  # 기본 기타 무게
-        self.default_printer_name = None
-        self.default_label_copies = 2
-        self.default_bulk_copies = 2
-        self._font_loaded_from_settings = False
+        # 라벨 크기/폰트/기본값 설정 (TXT 파일에서 읽기)
+        for key, value in DEFAULT_SETTINGS.items():
+            setattr(self, key, value)
         self.load_label_size_from_txt()
         
-        # 폰트 설정 (TXT 파일에서 읽기)
-        self.load_font_from_txt()
+        # 인쇄 서비스 (API, 렌더 엔진, 프린터 백엔드, 인쇄 작업 큐 - GUI 없이도 동작)
+        # server_url이 설정되어 있으면 그 서버를 사용하고 내장 서버는 시작하지 않음
+        self.service = LabelPrintService(self.get_settings())
+        self.printer = self.service.printer
+        self.print_queue = self.service.print_queue
+        self.label_renderer = self.service.label_renderer
+        self.service.add_print_listener(self.on_api_print_done)
+        
+        # GUI에서 등록한 인쇄 작업 (작업 ID -> 설명) - 진행 상태 표시줄용
+        self.gui_print_jobs = {}
+        self.print_queue.add_listener(
+            lambda job: self.root.after(0, lambda info=job.to_dict(): self.update_print_status(info))
+        )
         
         # 서버 IP 자동 감지
         self.server_ip = self.get_local_ip()
         self.server_port = self.find_available_port()
         
+        # 원격 프린터 목록 조회 상태 (조회는 백그라운드 스레드에서, 조회 중 들어온 요청은 refresh 여부만 기억)
+        self.printer_names = {}
+        self._remote_printers_fetching = False
+        self._remote_printers_refetch = None
+        
+        # 원격 모드: 이 GUI가 보낸 인쇄 요청 구분용 ID, 이벤트 구독 종료 신호
+        self.client_id = uuid.uuid4().hex
+        self._remote_events_stop = threading.Event()
+        self._closing = False
+        
         # GUI 구성
         self.setup_gui()
         
+        # 프린터 목록 백그라운드 갱신 (목록이 바뀌면 GUI 스레드에서 콤보박스 갱신)
+        if not self.server_url:
+            printer_registry.add_listener(lambda printers: self.root.after(0, self.refresh_printers))
+            printer_registry.start()
+        
         # 서버 시작
         self.start_server()
     
     def load_label_size_from_txt(self):
-        """TXT 파일에서 라벨 크기 읽기"""
+        """TXT 파일에서 라벨 크기/폰트/기본값 설정 읽기"""
         try:
-            config_file = "label_size.txt"
-            if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    for raw_line in f:
-                        line = raw_line.strip()
-                        if not line or line.startswith('#'):
-                            continue
-                        
-                        key = None
-                        value = None
-                        
-                        if ',' in line:
-                            parts = [p.strip() for p in line.split(',')]
-                            if len(parts) == 2:
-                                try:
-                                    self.label_width_cm = float(parts[0])
-                                    self.label_height_cm = float(parts[1])
-                                except ValueError:
-                                    pass
-                                continue
-                        
-                        if ':' in line:
-                            key, value = [token.strip() for token in line.split(':', 1)]
-                            key_lower = key.lower()
-                            
-                            if key_lower in ('width', '너비'):
-                                try:
-                                    self.label_width_cm = float(value)
-                                except ValueError:
-                                    pass
-                            elif key_lower in ('height', '높이'):
-                                try:
-                                    self.label_height_cm = float(value)
-                                except ValueError:
-                                    pass
-                            elif key_lower == 'font':
-                                self.font_name = value
-                                self._font_loaded_from_settings = True
-                            elif key_lower in ('fontsize', 'font_size', '폰트크기'):
-                                try:
-                                    self.font_size = int(float(value))
-                                    self._font_loaded_from_settings = True
-                                except ValueError:
-                                    pass
-                            elif key_lower in ('extra_weight', 'extraweight', 'tare', '기타무게'):
-                                try:
-                                    self.extra_weight = float(value)
-                                except ValueError:
-                                    pass
-                            elif key_lower in ('default_printer', 'defaultprinter'):
-                                if value:
-                                    self.default_printer_name = value
-                            elif key_lower in ('default_label_copies', 'label_copies', '라벨매수'):
-                                try:
-                                    self.default_label_copies = int(float(value))
-                                except ValueError:
-                                    pass
-                            elif key_lower in ('default_bulk_copies', 'bulk_copies', '벌크매수'):
-                                try:
-                                    self.default_bulk_copies = int(float(value))
-                                except ValueError:
-                                    pass
-                print(f"라벨 크기 설정 로드: {self.label_width_cm}cm x {self.label_height_cm}cm")
+            for key, value in load_label_settings().items():
+                setattr(self, key, value)
+            print(f"라벨 크기 설정 로드: {self.label_width_cm}cm x {self.label_height_cm}cm")
+            print(f"폰트 설정 로드: {self.font_name} {self.font_size}pt")
         except Exception as e:
             print(f"라벨 크기 설정 파일 읽기 실패: {e}, 기본값 사용")
     
-    def load_font_from_txt(self):
-        """TXT 파일에서 폰트 설정 읽기"""
-        if getattr(self, '_font_loaded_from_settings', False):
-            return
-        try:
-            config_file = "label_size.txt"
-            if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        # fontsize를 먼저 체크 (더 구체적인 조건)
-                        if 'fontsize' in line.lower() or '폰트크기' in line or 'font_size' in line.lower():
-                            try:
-                                parts = line.split(':')
-                                if len(parts) == 2:
-                                    self.font_size = int(float(parts[1].strip()))
-                            except:
-                                pass
-                        # font: 로 시작하는 줄만 체크 (fontsize 제외)
-                        elif line.lower().startswith('font:') or line.startswith('폰트:'):
-                            try:
-                                parts = line.split(':')
-                                if len(parts) == 2:
-                                    self.font_name = parts[1].strip()
-                            except:
-                                pass
-                print(f"폰트 설정 로드: {self.font_name} {self.font_size}pt")
-        except Exception as e:
-            print(f"폰트 설정 파일 읽기 실패: {e}, 기본값 사용")
+    def get_settings(self):
+        """현재 설정값 dict (label_settings 키 기준)"""
+        return {key: getattr(self, key) for key in DEFAULT_SETTINGS}
     
     def save_settings(self):
-        """현재 설정을 label_size.txt에 저장"""
+        """현재 설정을 label_size.txt에 저장하고 인쇄 서비스에도 반영"""
         try:
-            config_file = "label_size.txt"
-            lines = [
-                f"{self.label_width_cm:g},{self.label_height_cm:g}",
-                f"font: {self.font_name}",
-                f"fontsize: {self.font_size}",
-                f"extra_weight: {self.extra_weight:g}",
-                f"default_label_copies: {self.default_label_copies}",
-                f"default_bulk_copies: {self.default_bulk_copies}",
-            ]
-            if self.default_printer_name:
-                lines.append(f"default_printer: {self.default_printer_name}")
-            
-            with open(config_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(str(line) for line in lines))
-                f.write('\n')
+            settings = self.get_settings()
+            if hasattr(self, 'service'):
+                self.service.configure(**settings)
+            save_label_settings(settings)
         except Exception as e:
             print(f"설정 저장 실패: {e}")
     
@@ -1107,6 +136,7 @@ class LabelPrinterGUI:
         try:
             self.font_name = self.font_name_var.get() or "Arial"
             self.font_size = int(float(self.font_size_var.get() or "48"))
+            self.label_renderer.configure(font_name=self.font_name, font_size=self.font_size)
             if hasattr(self, 'label_canvas'):
                 self.update_label_preview()
             self.save_settings()
@@ -1219,6 +249,30 @@ class LabelPrinterGUI:
         self.server_url_label = ttk.Label(status_frame, text="", font=("Arial", 9))
         self.server_url_label.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
         
+        # 양식 저장 대기 상태 (백그라운드 저장 작업자)
+        self.pending_writes_label = ttk.Label(status_frame, text="", font=("Arial", 9))
+        self.pending_writes_label.grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
+        self.update_pending_writes_status()
+        
+        # GUI 인쇄 진행 상태 (인쇄는 백그라운드 작업자에서 처리되므로 창이 멈추지 않음)
+        print_status_frame = ttk.Frame(status_frame)
+        print_status_frame.grid(row=3, column=0, sticky=tk.W, pady=(5, 0))
+        self.print_status_label = ttk.Label(print_status_frame, text="", font=("Arial", 9))
+        self.print_status_label.grid(row=0, column=0, sticky=tk.W)
+        self.print_progress = ttk.Progressbar(print_status_frame, mode='indeterminate', length=120)
+        self.print_progress.grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
+        self.print_progress.grid_remove()
+        
+        # 라벨 인쇄 후 양식 Total KG 자동 입력 (인쇄마다 묻지 않음)
+        self.auto_fill_var = tk.BooleanVar(value=bool(self.auto_fill_total_kg))
+        ttk.Checkbutton(status_frame, text="인쇄 후 양식 Total KG 자동 입력", variable=self.auto_fill_var,
+                        command=self.on_auto_fill_changed).grid(row=4, column=0, sticky=tk.W, pady=(5, 0))
+        
+    def on_auto_fill_changed(self):
+        """Total KG 자동 입력 설정 변경 시 저장"""
+        self.auto_fill_total_kg = bool(self.auto_fill_var.get())
+        self.save_settings()
+    
     def setup_label_form(self, parent):
         """라벨 입력 폼"""
         form_frame = ttk.LabelFrame(parent, text="라벨 정보 입력", padding="10")
@@ -1299,152 +353,92 @@ class LabelPrinterGUI:
         # 1cm = 37.8 pixels @ 96 DPI
         # 1.5배 미리보기: 1cm = 56.7 pixels
         # 라벨 용지 사이즈 기준으로 캔버스 크기 설정
-        canvas_width = int(self.label_width_cm * 1.5 * 37.8)
-        canvas_height = int(self.label_height_cm * 1.5 * 37.8)
+        canvas_width = int(self.label_width_cm * PREVIEW_PX_PER_CM)
+        canvas_height = int(self.label_height_cm * PREVIEW_PX_PER_CM)
         
         self.label_canvas = tk.Canvas(preview_frame, width=canvas_width, height=canvas_height, 
                                       bg="white", relief=tk.SUNKEN, borderwidth=2)
         self.label_canvas.pack()
         
-        # 데이터 변경 시 미리보기 업데이트
-        self.total_weight_var.trace_add('write', self.update_label_preview)
-        self.pallet_weight_var.trace_add('write', self.update_label_preview)
+        # 미리보기 상태 - 마지막으로 그린 입력, 캔버스 이미지 항목, 만든 PhotoImage 캐시
+        self._preview_after_id = None
+        self._preview_key = None
+        self._preview_item = None
+        self._preview_photos = OrderedDict()
+        
+        # 데이터 변경 시 미리보기 업데이트 (순수무게는 총무게/팔렛무게/기타무게가 바뀔 때마다 다시 계산됨)
+        self.net_weight_var.trace_add('write', self.schedule_label_preview)
         
         # 초기 미리보기 그리기
         self.update_label_preview()
     
+    def schedule_label_preview(self, *args):
+        """미리보기 갱신 예약 - 연속 입력 중에는 마지막 입력 후 한 번만 그림"""
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(PREVIEW_DEBOUNCE_MS, self.update_label_preview)
+    
     def update_label_preview(self, *args):
-        """라벨 미리보기 업데이트 - 테두리와 정가운데 무게만, 좌측 하단에 바코드"""
+        """라벨 미리보기 업데이트 - 인쇄와 같은 렌더 엔진으로 캔버스 크기에 맞춰 렌더링
+
+        순수무게, 캔버스 크기, 폰트가 마지막으로 그린 것과 같으면 다시 그리지 않습니다.
+        """
         if not hasattr(self, 'label_canvas'):
             return
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
             
         canvas = self.label_canvas
-        canvas.delete("all")
         
-        # Canvas 실제 크기 가져오기 (라벨 용지 사이즈 기준)
-        canvas.update_idletasks()
         # 라벨 용지 사이즈 기준 계산: 1.5배 미리보기
-        base_canvas_width = int(self.label_width_cm * 1.5 * 37.8)  # 1cm = 56.7 pixels (1.5배)
-        base_canvas_height = int(self.label_height_cm * 1.5 * 37.8)
+        base_canvas_width = int(self.label_width_cm * PREVIEW_PX_PER_CM)  # 1cm = 56.7 pixels (1.5배)
+        base_canvas_height = int(self.label_height_cm * PREVIEW_PX_PER_CM)
         
         width = canvas.winfo_width() if canvas.winfo_width() > 1 else base_canvas_width
         height = canvas.winfo_height() if canvas.winfo_height() > 1 else base_canvas_height
         
-        # 실제 인쇄 크기 (300 DPI 기준)와 미리보기 캔버스 크기 (96 DPI 기준)의 비율 계산
-        # 실제 인쇄: label_width_cm * 118.11 pixels (300 DPI에서 1cm = 118.11 pixels)
-        # 미리보기: label_width_cm * 1.5 * 37.8 pixels (96 DPI에서 1cm = 37.8 pixels, 1.5배)
-        # 미리보기 / 실제 인쇄 = (1.5 * 37.8) / 118.11 ≈ 0.48
-        # 따라서 폰트 크기도 이 비율로 조정해야 함
-        
-        # 실제 인쇄 시 사용할 크기 (300 DPI 기준)
-        actual_print_width = self.label_width_cm * 118.11
-        actual_print_height = self.label_height_cm * 118.11
-        
-        # 미리보기 캔버스 크기와 실제 인쇄 크기의 비율
-        width_ratio = width / actual_print_width
-        height_ratio = height / actual_print_height
-        # 폰트 크기는 작은 비율을 사용 (어느 쪽이든 넘치지 않도록)
-        scale = min(width_ratio, height_ratio)
-        
-        # Canvas 크기에 비례하여 폰트 크기 조정
-        base_font_size = self.font_size  # 설정된 폰트 크기 사용
-        
-        # 캔버스 시작 위치 오프셋 (테두리가 캔버스 가장자리에 바로 붙도록)
-        offset_x = 0
-        offset_y = 0
-        
-        # 배경 테두리 (캔버스 가장자리에 바로 그리기)
-        border_width = max(2, int(2 * scale))  # 스케일에 맞게 테두리 두께 조정
-        canvas.create_rectangle(0, 0, width, height, 
-                                outline="black", width=border_width)
-        
         try:
-            # 데이터 가져오기
-            total_weight = self.total_weight_var.get() or "0"
-            pallet_weight = self.pallet_weight_var.get() or "0"
-            extra_weight = self.extra_weight_var.get() or "0"
-            try:
-                total_val = float(total_weight)
-            except ValueError:
-                total_val = 0
-            try:
-                pallet_val = float(pallet_weight)
-            except ValueError:
-                pallet_val = 0
-            try:
-                extra_val = float(extra_weight)
-            except ValueError:
-                extra_val = 0
-            net_weight = total_val - pallet_val - extra_val
+            from PIL import ImageTk
             
-            # 순수무게만 정가운데 크게 표시
-            if net_weight > 0:
-                # 중앙에 숫자만 크게 표시
-                net_weight_number = f"{net_weight:.1f}"
-                font_size = max(20, int(base_font_size * scale))
-                
-                # 설정된 폰트 이름 사용
-                font_family = self.font_name if hasattr(self, 'font_name') else "Arial"
-                
-                # 중앙 위치 계산 (오프셋 고려)
-                center_x = width / 2
-                center_y = height / 2
-                
-                canvas.create_text(center_x, center_y, text=net_weight_number,
-                                 font=(font_family, font_size, "bold"), fill="black")
-                
-                # 우측 하단에 "kg" 작게 표시
-                kg_font_size = max(12, int(base_font_size * scale * 0.3))
-                canvas.create_text(width - 10, height - 10, text="kg",
-                                 font=(font_family, kg_font_size), fill="black", anchor="se")
-                
-                # 바코드: 순수무게를 바코드로 변환 (좌측 하단)
-                # 무게 값을 바코드 문자열로 변환 (소수점 제거)
-                barcode_value = f"{net_weight:.1f}".replace(".", "").zfill(6)  # 최소 6자리로 패딩
-                
-                # 실제 바코드 이미지 생성 시도
-                try:
-                    from barcode import Code128
-                    from barcode.writer import ImageWriter
-                    import io
-                    
-                    # 바코드 이미지 생성
-                    barcode_image = Code128(barcode_value, writer=ImageWriter())
-                    barcode_buffer = io.BytesIO()
-                    barcode_image.write(barcode_buffer)
-                    barcode_buffer.seek(0)
-                    
-                    # PIL Image로 변환
-                    from PIL import Image as PILImage
-                    barcode_pil = PILImage.open(barcode_buffer)
-                    
-                    # 바코드 크기 조정 (좌측 하단에 배치) - 사이즈 키움
-                    barcode_height = int(height * 0.25)  # 높이의 25% (15% → 25%로 증가)
-                    barcode_aspect = barcode_pil.width / barcode_pil.height
-                    barcode_width = int(barcode_height * barcode_aspect)
-                    barcode_resized = barcode_pil.resize((barcode_width, barcode_height), PILImage.Resampling.LANCZOS)
-                    
-                    # Canvas에 바코드 이미지 추가 (좌측 하단)
-                    from PIL import ImageTk
-                    barcode_tk = ImageTk.PhotoImage(barcode_resized)
-                    canvas.create_image(10, height - int(barcode_height/2) - 10, 
-                                       anchor="sw", image=barcode_tk)
-                    canvas.barcode_image = barcode_tk  # 참조 유지
-                    
-                except ImportError:
-                    # barcode 라이브러리가 없으면 텍스트로 표시
-                    barcode_font_size = max(10, int(12 * scale))
-                    canvas.create_text(10, height - 10, text=barcode_value,
-                                     anchor="w", font=("Arial", barcode_font_size), fill="black")
-                except Exception as e:
-                    # 바코드 생성 실패 시 텍스트로 표시
-                    print(f"바코드 생성 실패: {e}")
-                    barcode_font_size = max(10, int(12 * scale))
-                    canvas.create_text(10, height - 10, text=barcode_value,
-                                     anchor="w", font=("Arial", barcode_font_size), fill="black")
+            label_data = {
+                'total_weight': self.total_weight_var.get(),
+                'pallet_weight': self.pallet_weight_var.get(),
+                'extra_weight': self.extra_weight_var.get() or "0",
+            }
+            net_weight = compute_net_weight(label_data)
+            key = (f"{net_weight:.1f}" if net_weight > 0 else "", width, height,
+                   self.label_width_cm, self.font_name, self.font_size)
+            if key == self._preview_key:
+                return
+            
+            preview_tk = self._preview_photos.get(key)
+            if preview_tk is None:
+                # 캔버스 너비 기준 해상도로 렌더링 (인쇄물과 같은 비율, 렌더 캐시/바코드 캐시 사용)
+                px_per_cm = width / self.label_width_cm
+                preview_img = self.label_renderer.render(label_data, px_per_cm=px_per_cm, size=(width, height))
+                preview_tk = ImageTk.PhotoImage(preview_img)
+                self._preview_photos[key] = preview_tk
+                while len(self._preview_photos) > PREVIEW_PHOTO_CACHE_SIZE:
+                    self._preview_photos.popitem(last=False)
+            else:
+                self._preview_photos.move_to_end(key)
+            
+            # 캔버스를 지우지 않고 이미지 항목만 교체
+            if self._preview_item is None:
+                canvas.delete("all")
+                self._preview_item = canvas.create_image(0, 0, anchor="nw", image=preview_tk)
+            else:
+                canvas.itemconfig(self._preview_item, image=preview_tk)
+            canvas.preview_image = preview_tk  # 참조 유지
+            self._preview_key = key
         except Exception as e:
             print(f"미리보기 업데이트 오류: {e}")
-            pass  # 데이터가 없으면 그냥 빈 캔버스
+            # 렌더링 실패 시 테두리만 표시
+            canvas.delete("all")
+            self._preview_item = None
+            self._preview_key = None
+            canvas.create_rectangle(0, 0, width, height, outline="black", width=2)
     
     def setup_buttons(self, parent):
         """버튼들"""
@@ -1501,37 +495,17 @@ class LabelPrinterGUI:
                 'no_choco_coating': self.form_data_inline['no_choco_coating'].get(),
                 'quantity': self.form_data_inline['quantity'].get(),
                 'quality_checked': self.form_data_inline['quality_checked'].get(),
-                'production_table': [
-                    {
-                        'bulk_plastic_bag_lot_codes': row['bulk_plastic_bag_lot_codes'].get(),
-                        'bulk_bag_qty': row['bulk_bag_qty'].get(),
-                        'pallet_num': row['pallet_num'].get(),
-                        'total_kg': row['total_kg'].get(),
-                        'notes': row['notes'].get(),
-                        'initial': row['initial'].get()
-                    }
-                    for row in self.table_data_inline
-                ],
+                'production_table': self.production_table.rows(),
                 'production_notes': "",
                 'verified_by_qa': "",
                 'supervisor_signature': ""
             }
             
-            # date + shift로 중복 체크
-            existing_idx = None
-            for idx, existing_record in enumerate(self.production_records):
-                if existing_record.get('date') == date_value and existing_record.get('shift') == shift_value:
-                    existing_idx = idx
-                    break
+            # date + shift (+ product) 색인으로 중복 체크 - 있으면 덮어쓰기, 없으면 새로 추가
+            # (기존 기록이면 같은 저장소 ID로 바뀐 행만 갱신)
+            record, _ = self.production_records.upsert(record)
             
-            if existing_idx is not None:
-                # 중복이면 덮어쓰기
-                self.production_records[existing_idx] = record
-            else:
-                # 새로 추가
-                self.production_records.append(record)
-            
-            self.save_production_records()
+            self.save_production_record(record)
         
         def save_inline_form():
             """양식 데이터 저장 (수동 저장)"""
@@ -1547,10 +521,7 @@ class LabelPrinterGUI:
             
             if net_weight:
                 # 첫 번째 빈 행에 Total KG 입력 (순수무게)
-                for row_data in self.table_data_inline:
-                    if not row_data['total_kg'].get():
-                        row_data['total_kg'].set(net_weight)
-                        break
+                self.add_to_production_form(label_data)
         
         self.bulk_copies_var = tk.StringVar(value=str(self.default_bulk_copies))
         ttk.Label(button_frame, text="인쇄 매수:").pack(side=tk.LEFT, padx=5)
@@ -1559,9 +530,7 @@ class LabelPrinterGUI:
         def clear_production_table():
             """Production Data Table의 모든 데이터 초기화"""
             if messagebox.askyesno("확인", "Production Data Table의 모든 데이터를 초기화하시겠습니까?"):
-                for row_data in self.table_data_inline:
-                    for key, var in row_data.items():
-                        var.set("")
+                self.production_table.clear()
                 messagebox.showinfo("완료", "Production Data Table이 초기화되었습니다.")
         
         ttk.Button(button_frame, text="라벨 데이터 가져오기", command=fill_from_label_inline).pack(side=tk.LEFT, padx=5)
@@ -1717,16 +686,51 @@ class LabelPrinterGUI:
                          relief=tk.SOLID, borderwidth=1, padx=header_padx, pady=5)
             header_label.grid(row=0, column=col, sticky=(tk.W, tk.E, tk.N, tk.S), padx=1, ipadx=0)
         
-        # 테이블 행 (15개 행) - 헤더와 같은 프레임 구조 사용
-        self.table_data_inline = []
+        # 테이블 행 - 보이는 행(PRODUCTION_TABLE_VISIBLE_ROWS개)만 위젯을 만들고 스크롤하면 슬롯에 다른 행을 표시
+        # 행 데이터와 자동 입력 규칙은 production_table 모델이 관리하고, StringVar는 화면 표시용
+        self.production_table = ProductionTableModel(PRODUCTION_TABLE_VISIBLE_ROWS)
+        self.production_table_slots = []
+        self._table_entries = []
+        self._table_offset = 0
+        self._table_syncing = False
+        self._table_refresh_id = None
         header_keys = ['bulk_plastic_bag_lot_codes', 'bulk_bag_qty', 'pallet_num', 'total_kg', 'notes', 'initial']
-        for row in range(15):
-            row_frame = ttk.Frame(scrollable_frame)
-            row_frame.grid(row=13+row, column=0, columnspan=6, sticky=(tk.W, tk.E), padx=5, pady=1)
+        
+        table_body = ttk.Frame(scrollable_frame)
+        table_body.grid(row=13, column=0, columnspan=6, sticky=(tk.W, tk.E), padx=5, pady=1)
+        rows_frame = ttk.Frame(table_body)
+        rows_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        rows_frame.columnconfigure(0, weight=1)
+        self.production_table_scrollbar = ttk.Scrollbar(table_body, orient="vertical",
+                                                        command=self.scroll_production_table)
+        self.production_table_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        def on_table_var_changed(slot, key, var):
+            """사용자가 칸을 수정하면 모델에 반영 (모델 → 화면 동기화 중에는 무시)"""
+            if self._table_syncing:
+                return
+            self.production_table.set(self._table_offset + slot, key, var.get())
+        
+        def refresh_table_rows():
+            """모델 변경을 화면에 반영 - 변경 묶음당 한 번, 자동 저장도 한 번"""
+            self._table_refresh_id = None
+            self.render_production_table()
+            trigger_auto_save()
+        
+        def on_table_model_changed(indices):
+            if self._table_refresh_id is None:
+                self._table_refresh_id = self.root.after_idle(refresh_table_rows)
+        
+        self.production_table.add_listener(on_table_model_changed)
+        
+        for slot in range(PRODUCTION_TABLE_VISIBLE_ROWS):
+            row_frame = ttk.Frame(rows_frame)
+            row_frame.grid(row=slot, column=0, sticky=(tk.W, tk.E), pady=1)
             # 행 프레임의 컬럼 가중치 설정 (PDF 비율과 동일하게)
             for col in range(6):
                 row_frame.columnconfigure(col, weight=column_weights[col])
             row_data = {}
+            row_entries = []
             for col, key in enumerate(header_keys):
                 var = tk.StringVar()
                 # 컬럼별로 다른 width 설정 (문자 단위) - 직접 조절 가능
@@ -1745,26 +749,18 @@ class LabelPrinterGUI:
                 entry = tk.Entry(row_frame, textvariable=var, relief=tk.SOLID, borderwidth=1, 
                                font=("Arial", 9), width=entry_width)
                 entry.grid(row=0, column=col, sticky=(tk.W, tk.E, tk.N, tk.S), padx=1)
+                # 마우스 휠/화살표 키로 표 스크롤
+                for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                    entry.bind(sequence, self.on_production_table_wheel)
+                entry.bind("<Up>", lambda event, slot=slot, col=col: self.move_production_focus(slot, col, -1))
+                entry.bind("<Down>", lambda event, slot=slot, col=col: self.move_production_focus(slot, col, 1))
                 row_data[key] = var
-                
-                # 첫 번째 행의 Lot code와 Bag QTY 변경 시 다음 행들에 복사 (비어있을 때만)
-                if row == 0 and (key == 'bulk_plastic_bag_lot_codes' or key == 'bulk_bag_qty'):
-                    var.trace_add('write', lambda name, index, mode, var=var, key=key, row_idx=row: self.copy_to_next_rows(key, var, row_idx))
-                
-                # Total KG 입력 시 Pallet 번호 자동 증가 및 자동 저장
-                if key == 'total_kg':
-                    def on_total_kg_change(name, index, mode, var=var, row_idx=row):
-                        self.auto_increment_pallet(row_idx)
-                        # 자동 저장 (약간의 지연을 두어 연속 입력 시 과도한 저장 방지)
-                        trigger_auto_save()
-                    var.trace_add('write', on_total_kg_change)
-                
-                # 다른 필드 변경 시에도 자동 저장 (Total KG 제외)
-                if key != 'total_kg':
-                    var.trace_add('write', trigger_auto_save)
+                row_entries.append(entry)
+                var.trace_add('write', lambda name, index, mode, slot=slot, key=key, var=var: on_table_var_changed(slot, key, var))
             
-            self.table_data_inline.append(row_data)
-        self.form_data_inline['production_table'] = self.table_data_inline
+            self.production_table_slots.append(row_data)
+            self._table_entries.append(row_entries)
+        self.render_production_table()
         
         # 그리드 가중치 설정
         scrollable_frame.columnconfigure(1, weight=1)
@@ -1775,6 +771,66 @@ class LabelPrinterGUI:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
     
+    def render_production_table(self):
+        """보이는 행 슬롯에 모델의 현재 범위(_table_offset부터)를 표시하고 스크롤바 갱신"""
+        model = self.production_table
+        visible = len(self.production_table_slots)
+        total = len(model)
+        self._table_offset = max(0, min(self._table_offset, total - visible))
+        self._table_syncing = True
+        try:
+            for slot, row_vars in enumerate(self.production_table_slots):
+                values = model.row(self._table_offset + slot)
+                for key, var in row_vars.items():
+                    if var.get() != values[key]:
+                        var.set(values[key])
+        finally:
+            self._table_syncing = False
+        self.production_table_scrollbar.set(self._table_offset / total, (self._table_offset + visible) / total)
+    
+    def scroll_production_table(self, *args):
+        """표 스크롤 (Scrollbar command와 같은 인자: moveto 비율 / scroll n units|pages)"""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self._table_offset = int(round(float(args[1]) * len(self.production_table)))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= len(self.production_table_slots)
+            self._table_offset += step
+        else:
+            return
+        self.render_production_table()
+    
+    def on_production_table_wheel(self, event):
+        """마우스 휠로 표 스크롤 (Windows/macOS: delta, Linux: Button-4/5)"""
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll_production_table('scroll', -PRODUCTION_TABLE_WHEEL_ROWS, 'units')
+        else:
+            self.scroll_production_table('scroll', PRODUCTION_TABLE_WHEEL_ROWS, 'units')
+        return "break"
+    
+    def move_production_focus(self, slot, col, step):
+        """위/아래 화살표로 같은 컬럼의 이전/다음 행으로 이동 (끝 슬롯이면 표를 스크롤)"""
+        target = slot + step
+        if 0 <= target < len(self._table_entries):
+            self._table_entries[target][col].focus_set()
+        else:
+            self.scroll_production_table('scroll', step, 'units')
+        return "break"
+    
+    def show_production_row(self, index):
+        """행 index가 보이도록 표 스크롤"""
+        visible = len(self.production_table_slots)
+        if index < self._table_offset:
+            self._table_offset = index
+        elif index >= self._table_offset + visible:
+            self._table_offset = index - visible + 1
+        else:
+            return
+        self.render_production_table()
+    
     def collect_bulk_sheet_data_inline(self):
         """오른쪽 인라인 양식에서 벌크 생산 시트 데이터를 수집"""
         if not hasattr(self, 'form_data_inline'):
@@ -1800,18 +856,7 @@ class LabelPrinterGUI:
             'production_notes': ""
         }
         
-        table_entries = []
-        for row_vars in self.table_data_inline:
-            row_data = {}
-            empty = True
-            for key, var in row_vars.items():
-                value = var.get()
-                if value:
-                    empty = False
-                row_data[key] = value
-            if not empty:
-                table_entries.append(row_data)
-        data['production_table'] = table_entries
+        data['production_table'] = self.production_table.filled_rows()
         return data
     
     def preview_bulk_sheet_inline(self):
@@ -1821,7 +866,7 @@ class LabelPrinterGUI:
             return
         
         try:
-            pdf_path = self.printer.create_bulk_production_sheet_pdf(data)
+            pdf_path = self.printer.create_bulk_production_sheet_pdf(data, reuse=True)
             if os.name == 'nt':
                 os.startfile(pdf_path)
             else:
@@ -1845,119 +890,34 @@ class LabelPrinterGUI:
                 messagebox.showerror("오류", "인쇄 매수는 1 이상의 정수여야 합니다.")
                 return
             data['copies'] = str(copies)
-            pdf_path = self.printer.create_bulk_production_sheet_pdf(data)
-            success = self.printer.print_label(pdf_path, copies=copies)
-            if success:
-                messagebox.showinfo("성공", "벌크 생산 시트가 기본 프린터로 인쇄되었습니다.")
-            else:
-                messagebox.showerror("오류", "인쇄에 실패했습니다. 프린터 설정을 확인해주세요.")
+            # PDF 생성과 인쇄는 인쇄 작업자에서 처리
+            self.submit_gui_print(
+                None,
+                "벌크 생산 시트",
+                render=lambda: self.printer.create_bulk_production_sheet_pdf(data),
+                spool=lambda pdf_path: self.printer.print_label(pdf_path, copies=copies),
+            )
         except Exception as e:
             messagebox.showerror("오류", f"인쇄 중 오류가 발생했습니다: {e}")
     
-    def copy_to_next_rows(self, key, first_row_var, first_row_idx):
-        """첫 번째 행의 Lot code나 Bag QTY를 다음 행들에 복사 (Total KG이 입력된 행에만)"""
-        if not hasattr(self, 'table_data_inline'):
-            return
-        
-        value = first_row_var.get()
-        if not value:
-            return
-        
-        # 첫 번째 행을 제외한 나머지 행에 복사
-        # 단, Total KG이 입력된 행에만 복사
-        for i in range(1, len(self.table_data_inline)):
-            if key in self.table_data_inline[i]:
-                # Total KG이 입력된 행에만 복사
-                total_kg_value = self.table_data_inline[i]['total_kg'].get()
-                if total_kg_value:  # Total KG이 있으면
-                    # 현재 값이 비어있을 때만 복사
-                    current_value = self.table_data_inline[i][key].get()
-                    if not current_value:
-                        self.table_data_inline[i][key].set(value)
-    
-    def auto_increment_pallet(self, row_idx):
-        """Total KG 입력 시 Pallet 번호 자동 증가"""
-        if not hasattr(self, 'table_data_inline'):
-            return
-        
-        total_kg_value = self.table_data_inline[row_idx]['total_kg'].get()
-        
-        # Total KG이 입력되고 Pallet 번호가 비어있을 때만 자동 증가
-        if total_kg_value and not self.table_data_inline[row_idx]['pallet_num'].get():
-            # 이전 행들의 Pallet 번호를 확인하여 다음 번호 결정
-            max_pallet = 0
-            for i in range(row_idx):
-                pallet_str = self.table_data_inline[i]['pallet_num'].get()
-                if pallet_str:
-                    try:
-                        pallet_num = int(pallet_str)
-                        if pallet_num > max_pallet:
-                            max_pallet = pallet_num
-                    except ValueError:
-                        pass
-            
-            # 다음 Pallet 번호 설정
-            next_pallet = max_pallet + 1
-            self.table_data_inline[row_idx]['pallet_num'].set(f"{next_pallet:03d}")
-            
-            # Lot code와 Bag QTY가 비어있으면 첫 번째 행의 값 복사
-            lot_code = self.table_data_inline[row_idx]['bulk_plastic_bag_lot_codes'].get()
-            bag_qty = self.table_data_inline[row_idx]['bulk_bag_qty'].get()
-            
-            if not lot_code and len(self.table_data_inline) > 0:
-                first_lot = self.table_data_inline[0]['bulk_plastic_bag_lot_codes'].get()
-                if first_lot:
-                    self.table_data_inline[row_idx]['bulk_plastic_bag_lot_codes'].set(first_lot)
-            
-            if not bag_qty and len(self.table_data_inline) > 0:
-                first_bag_qty = self.table_data_inline[0]['bulk_bag_qty'].get()
-                if first_bag_qty:
-                    self.table_data_inline[row_idx]['bulk_bag_qty'].set(first_bag_qty)
-    
     def add_to_production_form(self, label_data):
-        """모바일 API로 인쇄 시 양식 테이블에 Total KG 자동 추가 (순수무게)"""
-        if not hasattr(self, 'table_data_inline'):
+        """모바일 API로 인쇄 시 양식 테이블에 Total KG 자동 추가 (순수무게)
+        
+        Pallet 번호 자동 증가와 Lot code/Bag QTY 복사는 production_table 모델이 처리하고,
+        표 화면은 한 번만 갱신됩니다. 입력한 행 번호를 반환합니다 (입력하지 않았으면 None).
+        """
+        if not hasattr(self, 'production_table'):
             return
         
         net_weight = label_data.get('net_weight', '')
         if not net_weight:
             return
         
-        # 첫 번째 빈 행에 Total KG 입력 (순수무게)
-        for i, row_data in enumerate(self.table_data_inline):
-            current_total_kg = row_data['total_kg'].get()
-            if not current_total_kg:
-                # Total KG 입력 (순수무게)
-                row_data['total_kg'].set(net_weight)
-                
-                # Pallet 번호 자동 증가
-                if not row_data['pallet_num'].get():
-                    max_pallet = 0
-                    for j in range(i):
-                        pallet_str = self.table_data_inline[j]['pallet_num'].get()
-                        if pallet_str:
-                            try:
-                                pallet_num = int(pallet_str)
-                                if pallet_num > max_pallet:
-                                    max_pallet = pallet_num
-                            except ValueError:
-                                pass
-                    
-                    next_pallet = max_pallet + 1
-                    row_data['pallet_num'].set(f"{next_pallet:03d}")
-                
-                # Lot code와 Bag QTY가 비어있으면 첫 번째 행의 값 복사
-                if not row_data['bulk_plastic_bag_lot_codes'].get() and len(self.table_data_inline) > 0:
-                    first_lot = self.table_data_inline[0]['bulk_plastic_bag_lot_codes'].get()
-                    if first_lot:
-                        row_data['bulk_plastic_bag_lot_codes'].set(first_lot)
-                
-                if not row_data['bulk_bag_qty'].get() and len(self.table_data_inline) > 0:
-                    first_bag_qty = self.table_data_inline[0]['bulk_bag_qty'].get()
-                    if first_bag_qty:
-                        row_data['bulk_bag_qty'].set(first_bag_qty)
-                
-                break  # 첫 번째 빈 행에만 입력
+        # 첫 번째 빈 행에 Total KG 입력 (순수무게) - 표가 꽉 차면 행이 늘어남
+        index = self.production_table.fill_next_total_kg(net_weight)
+        if index is not None:
+            self.show_production_row(index)
+        return index
     
     def on_extra_weight_changed(self, *args):
         """기타 무게 변경 시 처리"""
@@ -2075,6 +1035,10 @@ class LabelPrinterGUI:
             
         return True
         
+    def render_for_printer(self, data, printer_name):
+        """프린터 해상도와 인쇄 가능 영역에 맞춰 라벨 이미지를 바로 렌더링"""
+        return self.service.render_for_printer(data, printer_name)
+    
     def print_label(self):
         """라벨 인쇄 - Canvas를 이미지로 캡처하여 직접 인쇄"""
         data = self.get_label_data()
@@ -2096,235 +1060,6 @@ class LabelPrinterGUI:
             
             print(f"선택된 프린터: {actual_printer_name}")
             
-            # 라벨 용지 사이즈에 맞게 PIL Image로 직접 생성 (고정 크기, 화면 해상도 무관)
-            from PIL import Image, ImageDraw, ImageFont
-            import tempfile
-            
-            # 임시 파일 경로 생성
-            temp_canvas_path = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-            temp_img_path = temp_canvas_path.name
-            temp_canvas_path.close()
-            
-            # 300 DPI 기준으로 라벨 용지 사이즈에 맞는 절대적인 크기 계산
-            # 1cm = 118.11 pixels @ 300 DPI
-            target_width = int(self.label_width_cm * 118.11)  # 300 DPI 기준
-            target_height = int(self.label_height_cm * 118.11)
-            
-            print(f"라벨 용지 사이즈: {self.label_width_cm}cm x {self.label_height_cm}cm")
-            print(f"인쇄 목표 크기 (300 DPI): {target_width} x {target_height} 픽셀")
-            
-            # PIL Image 생성 (화이트 배경)
-            img = Image.new('RGB', (target_width, target_height), 'white')
-            draw = ImageDraw.Draw(img)
-            
-            # 데이터 가져오기
-            total_weight = data['total_weight'] or "0"
-            pallet_weight = data['pallet_weight'] or "0"
-            extra_weight = data.get('extra_weight', "0") or "0"
-            try:
-                total_val = float(total_weight)
-            except ValueError:
-                total_val = 0
-            try:
-                pallet_val = float(pallet_weight)
-            except ValueError:
-                pallet_val = 0
-            try:
-                extra_val = float(extra_weight)
-            except ValueError:
-                extra_val = 0
-            net_weight = total_val - pallet_val - extra_val
-            
-            # 테두리가 이미지 가장자리에 바로 붙도록 오프셋 제거
-            offset_px = 0
-            
-            if net_weight > 0:
-                # 1. 테두리 그리기 (이미지 가장자리에 바로)
-                border_width = 3
-                draw.rectangle([0, 0, target_width, target_height], 
-                             outline='black', width=border_width)
-                
-                # 2. 중앙에 숫자 그리기 (캔버스 미리보기와 동일한 비율로 계산)
-                net_weight_number = f"{net_weight:.1f}"
-                
-                # 캔버스 미리보기와 동일한 폰트 크기 계산 방식 사용
-                # 캔버스: 2배 미리보기 기준 (96 DPI)
-                # - base_canvas_width = label_width_cm * 2 * 37.8
-                # - scale = width / base_canvas_width
-                # - font_size = base_font_size * scale
-                #
-                # 인쇄: 300 DPI 기준
-                # - target_width = label_width_cm * 118.11 (300 DPI)
-                # - 캔버스와 동일한 비율을 적용하기 위해:
-                #   canvas_scale = target_width / (label_width_cm * 2 * 37.8 * 2)
-                #   실제로는 300 DPI에서의 실제 크기로 조정
-                
-                base_font_size = self.font_size
-                
-                # 캔버스 미리보기 기준 계산
-                # 캔버스는 2배 스케일 미리보기: base_canvas_width = label_width_cm * 2 * 37.8
-                # 실제 인쇄 크기는: target_width = label_width_cm * 118.11
-                # 비율: target_width / (label_width_cm * 2 * 37.8) = 118.11 / (2 * 37.8) ≈ 1.56
-                
-                # 하지만 더 정확하게는, 캔버스에서 사용하는 폰트 크기와 동일한 비율로 맞추기
-                # 캔버스에서: font_size = base_font_size * scale (scale은 캔버스 크기 비율)
-                # 인쇄에서도 동일한 비율 적용
-                
-                # 캔버스 기준 너비 (2배 미리보기): label_width_cm * 2 * 37.8
-                canvas_base_width = self.label_width_cm * 2 * 37.8
-                # 인쇄 크기 대비 캔버스 크기 비율
-                scale_ratio = target_width / canvas_base_width
-                
-                # 캔버스에서 사용하는 폰트 크기 계산 방식 적용
-                # 캔버스에서 scale은 실제 캔버스 크기 / base_canvas_width
-                # 인쇄에서는 동일한 비율 적용
-                font_size = int(base_font_size * scale_ratio)
-                font_size = max(20, font_size)  # 최소 크기 보장
-                
-                # 폰트 로드 시도 (설정된 폰트 이름 사용, 볼드 버전)
-                # 캔버스에서는 "bold" 스타일을 사용하므로, PIL에서도 볼드 폰트 파일 사용
-                font_name = self.font_name if hasattr(self, 'font_name') else "Arial"
-                
-                # 폰트 파일 매핑 (볼드 버전 포함)
-                font_file_map = {
-                    "Arial": "arialbd.ttf",  # bold 버전
-                    "Times New Roman": "timesbd.ttf",  # bold 버전
-                    "Courier": "courbd.ttf",  # bold 버전
-                    "Georgia": "georgiab.ttf",  # bold 버전 (있다면)
-                    "Verdana": "verdanab.ttf",  # bold 버전 (있다면)
-                    "Helvetica": "arialbd.ttf",  # Helvetica는 Arial로 대체
-                }
-                
-                # 일반 버전 매핑 (볼드가 없을 경우 대체)
-                font_file_map_normal = {
-                    "Arial": "arial.ttf",
-                    "Times New Roman": "times.ttf",
-                    "Courier": "cour.ttf",
-                    "Georgia": "georgia.ttf",
-                    "Verdana": "verdana.ttf",
-                    "Helvetica": "arial.ttf",
-                }
-                
-                # 볼드 폰트 파일 우선 시도
-                font_file = font_file_map.get(font_name, "arialbd.ttf")
-                font_paths = [
-                    f"C:/Windows/Fonts/{font_file}",
-                    f"C:/Windows/Fonts/{font_file_map_normal.get(font_name, 'arial.ttf')}",  # 일반 버전 fallback
-                    "C:/Windows/Fonts/arialbd.ttf",  # 최종 fallback
-                    "C:/Windows/Fonts/arial.ttf",
-                ]
-                
-                font = None
-                for font_path in font_paths:
-                    try:
-                        if os.path.exists(font_path):
-                            font = ImageFont.truetype(font_path, font_size)
-                            print(f"폰트 로드 성공: {font_path}, 크기: {font_size}")
-                            break
-                    except Exception as e:
-                        continue
-                
-                if font is None:
-                    print("⚠️ 폰트 로드 실패, 기본 폰트 사용")
-                    font = ImageFont.load_default()
-                
-                # 텍스트 크기 측정 및 정확한 중앙 정렬
-                # textbbox는 (left, top, right, bottom) 반환
-                # top은 음수일 수 있음 (기준선 위쪽 여백)
-                # PIL의 text() 메서드는 y 좌표를 기준선(baseline)으로 사용
-                
-                # 텍스트 바운딩 박스 측정 (기준선을 0으로 가정)
-                bbox = draw.textbbox((0, 0), net_weight_number, font=font)
-                
-                # bbox: (left, top, right, bottom)
-                # top은 기준선 위쪽 거리 (보통 음수)
-                # bottom은 기준선 아래쪽 거리 (보통 양수)
-                left, top, right, bottom = bbox
-                
-                text_width = right - left
-                text_height = bottom - top  # 전체 높이 (위쪽 + 아래쪽)
-                
-                # 기준선(baseline)에서 텍스트 중앙까지의 거리
-                # top이 음수이므로, 중앙은 (top + bottom) / 2
-                text_center_from_baseline = (top + bottom) / 2
-                
-                # 중앙 위치
-                center_x = target_width / 2
-                center_y = target_height / 2
-                
-                # 텍스트를 정확히 중앙에 배치
-                # baseline_y = center_y - text_center_from_baseline
-                text_x = center_x - text_width / 2
-                text_y = center_y - text_center_from_baseline
-                
-                # 숫자 그리기 (정확한 중앙 정렬)
-                draw.text((text_x, text_y), net_weight_number, fill='black', font=font)
-                
-                # 3. 우측 하단에 "kg" 작게 표시
-                kg_font_size = int(font_size * 0.3)
-                try:
-                    kg_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", kg_font_size)
-                except:
-                    kg_font = ImageFont.load_default()
-                
-                kg_bbox = draw.textbbox((0, 0), "kg", font=kg_font)
-                kg_width = kg_bbox[2] - kg_bbox[0]
-                kg_height = kg_bbox[3] - kg_bbox[1]
-                
-                draw.text((target_width - 10 - kg_width, 
-                          target_height - 10 - kg_height), 
-                         "kg", fill='black', font=kg_font)
-                
-                # 4. 바코드: 좌측 하단 (라벨 용지 사이즈에 비례한 절대적인 크기)
-                barcode_value = f"{net_weight:.1f}".replace(".", "").zfill(6)
-                
-                try:
-                    from barcode import Code128
-                    from barcode.writer import ImageWriter
-                    import io
-                    
-                    # 바코드 이미지 생성
-                    barcode_image = Code128(barcode_value, writer=ImageWriter())
-                    barcode_buffer = io.BytesIO()
-                    barcode_image.write(barcode_buffer)
-                    barcode_buffer.seek(0)
-                    
-                    # PIL Image로 변환
-                    from PIL import Image as PILImage
-                    barcode_pil = PILImage.open(barcode_buffer)
-                    
-                    # 바코드 크기 조정 (라벨 높이의 25%)
-                    barcode_height = int(target_height * 0.25)
-                    barcode_aspect = barcode_pil.width / barcode_pil.height
-                    barcode_width = int(barcode_height * barcode_aspect)
-                    barcode_resized = barcode_pil.resize((barcode_width, barcode_height), 
-                                                        PILImage.Resampling.LANCZOS)
-                    
-                    # 바코드를 좌측 하단에 배치
-                    barcode_x = 10
-                    barcode_y = target_height - 10 - barcode_height
-                    
-                    img.paste(barcode_resized, (barcode_x, barcode_y))
-                    
-                except Exception as e:
-                    # 바코드 생성 실패 시 텍스트로 표시
-                    print(f"바코드 생성 실패: {e}")
-                    barcode_font_size = int(target_height * 0.05)
-                    try:
-                        barcode_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", barcode_font_size)
-                    except:
-                        barcode_font = ImageFont.load_default()
-                    
-                    draw.text((10, target_height - 10), 
-                             barcode_value, fill='black', font=barcode_font)
-            
-            # 이미지 저장 (300 DPI)
-            img.save(temp_img_path, 'PNG', dpi=(300, 300))
-            print(f"✅ PIL Image 직접 생성 완료: {target_width} x {target_height} 픽셀 (300 DPI)")
-            print(f"이미지 파일: {temp_img_path}")
-            
-            # 이미지를 프린터로 직접 전송 (Word/한글 방식)
-            # 라벨용지 사이즈 전달하여 정확한 크기로 인쇄
             copies = self.default_label_copies
             try:
                 copies = int(data.get('copies', self.default_label_copies) or self.default_label_copies)
@@ -2333,50 +1068,116 @@ class LabelPrinterGUI:
             if copies < 1:
                 copies = self.default_label_copies
             
-            success = True
-            for copy_idx in range(copies):
-                if not self.printer.print_image(
-                    temp_img_path,
-                    actual_printer_name,
-                    label_width_cm=self.label_width_cm,
-                    label_height_cm=self.label_height_cm
-                ):
-                    success = False
-                    break
+            label_width_cm = self.label_width_cm
+            label_height_cm = self.label_height_cm
             
-            # 임시 파일 삭제
-            try:
-                os.remove(temp_ps_path)
-            except:
-                pass
-            try:
-                os.remove(temp_img_path)
-            except:
-                pass
-            
-            if success:
-                # 인쇄 기록 저장
-                self.save_print_record(data)
-                messagebox.showinfo("성공", f"프린터 '{actual_printer_name}'로 라벨이 성공적으로 인쇄되었습니다.")
+            if self.server_url:
+                # 원격 인쇄 서버로 요청 (렌더링/인쇄는 서버에서 처리)
+                def render_label():
+                    return None
                 
-                # 양식 기록 옵션 제공 - 인라인 양식에 자동 입력
-                response = messagebox.askyesno("양식 기록", "Daily Bulk Production Sheet 양식의 Total KG에 자동 입력하시겠습니까?")
-                if response:
-                    net_weight = data.get('net_weight', '')
-                    if net_weight and hasattr(self, 'table_data_inline'):
-                        # 첫 번째 빈 행에 Total KG 입력 (순수무게)
-                        for row_data in self.table_data_inline:
-                            if not row_data['total_kg'].get():
-                                row_data['total_kg'].set(net_weight)
-                                break
+                def spool_label(_):
+                    return self.print_label_remote(data, actual_printer_name, copies)
             else:
-                messagebox.showerror("오류", "인쇄에 실패했습니다. 프린터 설정을 확인해주세요.")
+                def render_label():
+                    # 프린터 해상도로 라벨 이미지 생성 (메모리에서 바로 인쇄, 임시 파일/리사이즈 없음)
+                    return self.render_for_printer(data, actual_printer_name)
+                
+                def spool_label(img):
+                    # 이미지를 프린터로 직접 전송 (Word/한글 방식)
+                    # 라벨용지 사이즈 전달, 매수는 인쇄 작업 하나로 전송 (복사본마다 다시 스풀하지 않음)
+                    return self.printer.print_image(
+                        img,
+                        actual_printer_name,
+                        label_width_cm=label_width_cm,
+                        label_height_cm=label_height_cm,
+                        copies=copies
+                    )
+            
+            # 렌더링/스풀은 인쇄 작업자에서 처리하고 결과는 UI 스레드 콜백으로 받음
+            self.submit_gui_print(
+                actual_printer_name,
+                f"라벨 {data.get('net_weight', '')}kg",
+                render=render_label,
+                spool=spool_label,
+                on_success=lambda: self.on_gui_label_printed(data),
+            )
                 
         except Exception as e:
             import traceback
             traceback.print_exc()
             messagebox.showerror("오류", f"인쇄 중 오류가 발생했습니다: {str(e)}")
             
+    def on_gui_label_printed(self, data):
+        """GUI 라벨 인쇄 성공 (UI 스레드) - 인쇄 기록 저장 및 양식 자동 입력"""
+        # 인쇄 기록 저장
+        self.save_print_record(data)
+        
+        # 자동 입력 설정이 켜져 있으면 인라인 양식의 첫 번째 빈 행에 Total KG 입력 (순수무게)
+        # 확인 창을 띄우지 않고 결과는 상태 표시줄에 표시 - 다음 인쇄/표 입력을 막지 않음
+        if self.auto_fill_total_kg and data.get('net_weight'):
+            index = self.add_to_production_form(data)
+            if index is not None:
+                self.print_status_label.config(
+                    text=f"✅ 라벨 인쇄 완료 - 양식 {index + 1}행 Total KG {data['net_weight']} 입력",
+                    foreground="green")
+    
+    def submit_gui_print(self, printer_name, description, render, spool, on_success=None):
+        """GUI 인쇄를 인쇄 작업 큐에 등록 (UI 스레드에서 호출)
+        
+        render/spool은 작업자 스레드에서 실행되고, 완료되면 on_success 또는 오류 메시지가
+        root.after로 UI 스레드에서 처리됩니다. 진행 상황은 서버 상태 영역의 표시줄에 나타납니다.
+        """
+        def on_done(job):
+            self.root.after(0, lambda: self.on_gui_print_done(job, description, on_success))
+        
+        job = self.print_queue.submit(printer_name, render=render, spool=spool,
+                                      data={'source': 'gui'}, on_done=on_done)
+        self.gui_print_jobs[job.job_id] = description
+        self.update_print_status(job.to_dict())
+        return job
+    
+    def on_gui_print_done(self, job, description, on_success):
+        """GUI 인쇄 작업 완료 (UI 스레드)"""
+        self.gui_print_jobs.pop(job.job_id, None)
+        if job.status == JOB_DONE:
+            self.print_status_label.config(text=f"✅ {description} 인쇄 완료", foreground="green")
+        else:
+            self.print_status_label.config(text=f"❌ {description} 인쇄 실패", foreground="red")
+        self.update_print_status(job.to_dict())
+        
+        if job.status == JOB_DONE:
+            if on_success:
+                on_success()
+        else:
+            messagebox.showerror("오류", f"{description} 인쇄에 실패했습니다: {job.error or '프린터 설정을 확인해주세요.'}")
+    
+    def update_print_status(self, job_info):
+        """인쇄 진행 상태 표시줄 갱신 (UI 스레드) - GUI에서 등록한 작업만 표시"""
+        if not hasattr(self, 'print_status_label'):
+            return
+        description = self.gui_print_jobs.get(job_info['job_id'])
+        if description is not None:
+            texts = {
+                JOB_QUEUED: f"🕒 {description} 인쇄 대기 중",
+                JOB_RENDERING: f"🖨️ {description} 생성 중",
+                JOB_SPOOLING: f"🖨️ {description} 프린터로 전송 중",
+            }
+            text = texts.get(job_info['status'])
+            if text:
+                if len(self.gui_print_jobs) > 1:
+                    text += f" (전체 {len(self.gui_print_jobs)}건)"
+                self.print_status_label.config(text=text, foreground="orange")
+        
+        # 진행 중인 GUI 인쇄가 있는 동안만 진행 표시
+        if self.gui_print_jobs:
+            if not self.print_progress.winfo_ismapped():
+                self.print_progress.grid()
+                self.print_progress.start(15)
+        else:
+            self.print_progress.stop()
+            self.print_progress.grid_remove()
+    
     def save_pdf(self):
         """PDF 파일로 저장"""
         data = self.get_label_data()
@@ -2405,88 +1206,69 @@ class LabelPrinterGUI:
         except Exception as e:
             messagebox.showerror("오류", f"PDF 저장 중 오류가 발생했습니다: {str(e)}")
             
-    def refresh_printers(self):
-        """프린터 목록 새로고침"""
+    def refresh_printers(self, force=False):
+        """프린터 목록 새로고침 (프린터 레지스트리의 메모리 목록 사용)
+        
+        원격 모드에서는 서버 조회를 백그라운드 스레드에서 하고, 결과가 오면 GUI 스레드에서 콤보박스를 갱신합니다.
+        
+        Args:
+            force: True이면 시스템 프린터를 즉시 다시 조회
+        """
+        if self.server_url:
+            self.fetch_remote_printers_async(force)
+            return
+        try:
+            printers = printer_registry.get_printers(refresh=force)
+        except Exception as e:
+            print(f"프린터 조회 오류: {e}")
+            printers = []
+        self.show_printers(printers)
+    
+    def fetch_remote_printers_async(self, refresh=False):
+        """원격 프린터 목록을 백그라운드에서 조회 (조회 중이면 끝난 뒤 한 번 더 조회)"""
+        if self._remote_printers_fetching:
+            self._remote_printers_refetch = bool(self._remote_printers_refetch) or refresh
+            return
+        self._remote_printers_fetching = True
+        
+        def worker():
+            try:
+                printers = self.fetch_remote_printers(refresh)
+            except Exception as e:
+                print(f"프린터 조회 오류: {e}")
+                printers = []
+            try:
+                self.root.after(0, lambda: self.on_remote_printers_fetched(printers))
+            except RuntimeError:
+                pass  # 창이 이미 닫힘
+        
+        threading.Thread(target=worker, name="remote-printers", daemon=True).start()
+    
+    def on_remote_printers_fetched(self, printers):
+        """원격 프린터 목록 도착 (GUI 스레드)"""
+        self._remote_printers_fetching = False
+        self.show_printers(printers)
+        if self._remote_printers_refetch is not None:
+            refresh, self._remote_printers_refetch = self._remote_printers_refetch, None
+            self.fetch_remote_printers_async(refresh)
+    
+    def show_printers(self, printers):
+        """프린터 목록을 콤보박스에 표시하고 기본 프린터 선택"""
         printer_list = []
         self.printer_names = {}  # 표시명 -> 실제 프린터명 매핑
         
         try:
-            if os.name == 'posix':
-                result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True)
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if line.startswith('printer'):
-                            parts = line.split()
-                            if len(parts) >= 2:
-                                printer_name = parts[1]
-                                status = '사용 가능' if 'idle' in line else '사용 중'
-                                display_name = f"{printer_name} ({status})"
-                                printer_list.append(display_name)
-                                self.printer_names[display_name] = printer_name
-                else:
-                    printer_list.append("기본 프린터")
-                    self.printer_names["기본 프린터"] = None
-            else:
-                # Windows의 경우 - win32print를 사용하여 프린터 목록 조회
-                try:
-                    import win32print
-                    
-                    # win32print로 프린터 목록 조회
-                    printers = win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS)
-                    
-                    for printer in printers:
-                        printer_name = printer[2]  # 프린터 이름
-                        if printer_name:
-                            display_name = f"{printer_name} (사용 가능)"
-                            printer_list.append(display_name)
-                            self.printer_names[display_name] = printer_name
-                    
-                    print(f"win32print로 발견된 프린터: {[p[2] for p in printers]}")
-                    
-                except ImportError:
-                    print("win32print 모듈이 없습니다. PowerShell로 프린터 목록 조회...")
-                    
-                    # 방법 1: PowerShell로 프린터 목록 조회
-                    ps_command = "Get-Printer | ForEach-Object { $_.Name }"
-                    result = subprocess.run([
-                        'powershell', '-Command', ps_command
-                    ], capture_output=True, text=True, timeout=10)
-                    
-                    if result.returncode == 0 and result.stdout.strip():
-                        printer_names = result.stdout.strip().split('\n')
-                        for printer_name in printer_names:
-                            printer_name = printer_name.strip()
-                            if printer_name:
-                                display_name = f"{printer_name} (사용 가능)"
-                                printer_list.append(display_name)
-                                self.printer_names[display_name] = printer_name
-                    
-                    # 방법 2: wmic 명령어로도 시도
-                    if not printer_list:
-                        wmic_result = subprocess.run([
-                            'wmic', 'printer', 'get', 'name', '/format:list'
-                        ], capture_output=True, text=True, timeout=10)
-                        
-                        if wmic_result.returncode == 0:
-                            for line in wmic_result.stdout.split('\n'):
-                                if line.startswith('Name='):
-                                    printer_name = line.replace('Name=', '').strip()
-                                    if printer_name and printer_name != '':
-                                        display_name = f"{printer_name} (사용 가능)"
-                                        printer_list.append(display_name)
-                                        self.printer_names[display_name] = printer_name
-                
-                except Exception as e:
-                    print(f"Windows 프린터 조회 오류: {e}")
-                    printer_list.append("기본 프린터")
-                    self.printer_names["기본 프린터"] = None
-
-                # 프린터가 없으면 기본 프린터 추가
-                if not printer_list:
-                    printer_list.append("기본 프린터")
-                    self.printer_names["기본 프린터"] = None
-                
+            for printer_info in printers:
+                printer_name = printer_info['name']
+                status = '사용 가능' if printer_info.get('status') == 'available' else '사용 중'
+                display_name = f"{printer_name} ({status})"
+                printer_list.append(display_name)
+                self.printer_names[display_name] = printer_name
         except Exception as e:
+            print(f"프린터 조회 오류: {e}")
+        
+        # 프린터가 없으면 기본 프린터 추가
+        if not printer_list:
             printer_list.append("기본 프린터")
             self.printer_names["기본 프린터"] = None
         
@@ -2516,6 +1298,14 @@ class LabelPrinterGUI:
             except ValueError:
                 self.printer_combo.set(selected_display)
     
+    def fetch_remote_printers(self, refresh=False):
+        """원격 인쇄 서버의 프린터 목록 (/api/printers)"""
+        import requests
+        
+        params = {'refresh': 'true'} if refresh else None
+        response = requests.get(f"{self.server_url.rstrip('/')}/api/printers", params=params, timeout=10)
+        return response.json().get('printers', [])
+    
     def on_printer_selected(self, event=None):
         """프린터 선택 변경 시 기본 프린터 저장"""
         display_name = self.printer_var.get()
@@ -2560,457 +1350,118 @@ class LabelPrinterGUI:
         self.update_print_history_display()
             
     def start_server(self):
-        """Flask 서버 시작"""
-        def run_server():
-            self.flask_app = Flask(__name__)
-            CORS(self.flask_app)
-            
-            # API 엔드포인트들
-            self.setup_api_endpoints()
-            
+        """Flask 서버 시작 (server_url이 설정되어 있으면 원격 서버 사용)"""
+        if self.server_url:
+            print(f"원격 인쇄 서버 사용: {self.server_url}")
+            self.start_remote_event_listener()
+        else:
+            self.server_thread = self.service.start_in_thread(
+                self.server_ip, self.server_port,
+                on_stopped=lambda: self.root.after(0, self.on_server_stopped)
+            )
             self.server_running = True
-            self.flask_app.run(host=self.server_ip, port=self.server_port, debug=False, use_reloader=False)
-            
-        self.server_thread = threading.Thread(target=run_server, daemon=True)
-        self.server_thread.start()
         
-        # 서버 상태 업데이트
+        # 서버 상태 표시 (이후에는 서버가 멈출 때만 갱신)
         self.root.after(1000, self.update_server_status)
+    
+    def on_server_stopped(self):
+        """내장 서버 스레드가 종료되면 상태 표시 갱신 (UI 스레드)"""
+        self.server_running = False
+        self.update_server_status()
+    
+    def on_api_print_done(self, data, job):
+        """API(모바일) 인쇄 성공 시 인쇄 기록 저장 및 양식 테이블에 Total KG 자동 입력"""
+        # GUI 스레드에서 실행되도록 root.after 사용
+        self.root.after(0, lambda: self.save_print_record(data))
+        self.root.after(0, lambda: self.add_to_production_form(data))
+    
+    def print_label_remote(self, data, printer_name, copies):
+        """원격 인쇄 서버(/api/print)로 라벨 인쇄 요청 - 서버 작업이 완료되면 True (작업자 스레드)
         
-    def setup_api_endpoints(self):
-        """API 엔드포인트 설정"""
-        app = self.flask_app
-        
-        @app.route('/api/status', methods=['GET'])
-        def server_status():
-            return jsonify({
-                'success': True,
-                'status': 'running',
-                'server_time': datetime.now().isoformat(),
-                'version': '1.0.0',
-                'label_size': '10cm x 5cm'
-            })
-            
-        @app.route('/api/print', methods=['POST'])
-        def print_label_api():
+        서버는 요청을 접수하면 바로 202로 응답하므로 /api/print/status로 작업이 끝날 때까지 확인합니다.
+        """
+        import requests
+        
+        base_url = self.server_url.rstrip('/')
+        payload = {
+            'total_weight': data['total_weight'],
+            'pallet_weight': data['pallet_weight'],
+            'extra_weight': data.get('extra_weight'),
+            'printer': printer_name or 'default',
+            'copies': copies,
+            'date': data.get('date'),
+            # 이 GUI의 인쇄는 label_printed 이벤트로 양식에 다시 입력하지 않도록 표시
+            'client_id': self.client_id,
+        }
+        response = requests.post(f"{base_url}/api/print", json=payload, timeout=10)
+        result = response.json()
+        if not result.get('success'):
+            raise RuntimeError(result.get('message') or result.get('error') or '원격 인쇄 실패')
+        job_id = result.get('job_id')
+        print(f"원격 인쇄 요청 접수: 작업 {job_id}")
+        
+        status = result.get('status')
+        deadline = time.monotonic() + REMOTE_JOB_TIMEOUT
+        while job_id and status not in (JOB_DONE, JOB_FAILED):
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"원격 인쇄 작업 {job_id}이(가) {REMOTE_JOB_TIMEOUT}초 안에 끝나지 않았습니다 (상태: {status})")
+            time.sleep(REMOTE_JOB_POLL_INTERVAL)
             try:
-                data = request.get_json()
-                
-                if not data.get('total_weight'):
-                    return jsonify({
-                        'success': False,
-                        'error': 'TOTAL_WEIGHT_REQUIRED',
-                        'message': '총무게 정보가 필요합니다.'
-                    }), 400
-                    
-                if not data.get('pallet_weight'):
-                    return jsonify({
-                        'success': False,
-                        'error': 'PALLET_WEIGHT_REQUIRED',
-                        'message': '팔렛무게 정보가 필요합니다.'
-                    }), 400
-                
-                # 순수무게 계산
-                try:
-                    total_weight = float(data['total_weight'])
-                    pallet_weight = float(data['pallet_weight'])
-                    extra_weight = float(data.get('extra_weight', self.extra_weight) or self.extra_weight)
-                    net_weight = total_weight - pallet_weight - extra_weight
-                    
-                    if net_weight <= 0:
-                        return jsonify({
-                            'success': False,
-                            'error': 'INVALID_WEIGHT',
-                            'message': '팔렛무게와 기타 무게의 합이 총무게보다 크거나 같습니다.'
-                        }), 400
-                        
-                except ValueError:
-                    return jsonify({
-                        'success': False,
-                        'error': 'INVALID_WEIGHT_FORMAT',
-                        'message': '무게는 숫자여야 합니다.'
-                    }), 400
-                
-                try:
-                    copies = int(data.get('copies', self.default_label_copies) or self.default_label_copies)
-                    if copies < 1:
-                        raise ValueError
-                except (ValueError, TypeError):
-                    return jsonify({
-                        'success': False,
-                        'error': 'INVALID_COPIES',
-                        'message': '인쇄 매수는 1 이상의 정수여야 합니다.'
-                    }), 400
-                
-                data['copies'] = str(copies)
-                
-                # 기본값 설정
-                data['net_weight'] = f"{net_weight:.1f}"
-                data['weight'] = f"{net_weight:.1f}"  # 라벨에 표시될 무게
-                if not data.get('date'):
-                    data['date'] = datetime.now().strftime('%Y-%m-%d')
-                if not data.get('product_name'):
-                    data['product_name'] = '제품'
-                if not data.get('printer'):
-                    data['printer'] = '기본 프린터'
-                
-                # 실제 프린터 이름 가져오기
-                display_name = data.get('printer', '기본 프린터')
-                
-                # API에서는 프린터 이름을 직접 사용 (GUI의 매핑 없이)
-                if display_name == '기본 프린터' or display_name == 'default':
-                    actual_printer_name = None  # 기본 프린터 사용
-                else:
-                    actual_printer_name = display_name  # 프린터 이름 직접 사용
-                
-                print(f"API 인쇄 - 선택된 프린터: {display_name}")
-                print(f"API 인쇄 - 실제 프린터명: {actual_printer_name}")
-                
-                # 이미지 직접 생성 방식으로 인쇄 (GUI와 동일)
-                from PIL import Image, ImageDraw, ImageFont
-                import tempfile
-                
-                # 임시 파일 경로 생성
-                temp_img_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-                temp_img_path = temp_img_file.name
-                temp_img_file.close()
-                
-                # 300 DPI 기준으로 라벨 용지 사이즈에 맞는 절대적인 크기 계산
-                target_width = int(self.label_width_cm * 118.11)  # 300 DPI 기준
-                target_height = int(self.label_height_cm * 118.11)
-                
-                print(f"API 인쇄 - 라벨 용지 사이즈: {self.label_width_cm}cm x {self.label_height_cm}cm")
-                print(f"API 인쇄 - 목표 크기 (300 DPI): {target_width} x {target_height} 픽셀")
-                
-                # PIL Image 생성 (화이트 배경)
-                img = Image.new('RGB', (target_width, target_height), 'white')
-                draw = ImageDraw.Draw(img)
-                
-                # 순수무게 사용
-                total_weight_str = data.get('total_weight', '0')
-                pallet_weight_str = data.get('pallet_weight', '0')
-                extra_weight_str = data.get('extra_weight', '0')
-                try:
-                    total_val = float(total_weight_str)
-                except ValueError:
-                    total_val = 0
-                try:
-                    pallet_val = float(pallet_weight_str)
-                except ValueError:
-                    pallet_val = 0
-                try:
-                    extra_val = float(extra_weight_str)
-                except ValueError:
-                    extra_val = 0
-                net_weight = total_val - pallet_val - extra_val
-                
-                if net_weight > 0:
-                    # 1. 테두리 그리기
-                    border_width = 3
-                    draw.rectangle([0, 0, target_width, target_height], 
-                                 outline='black', width=border_width)
-                    
-                    # 2. 중앙에 숫자 그리기
-                    net_weight_number = f"{net_weight:.1f}"
-                    
-                    # 폰트 크기 계산 (GUI와 동일한 방식)
-                    base_font_size = self.font_size
-                    canvas_base_width = self.label_width_cm * 2 * 37.8
-                    scale_ratio = target_width / canvas_base_width
-                    font_size = int(base_font_size * scale_ratio)
-                    font_size = max(20, font_size)
-                    
-                    # 폰트 로드
-                    font_name = self.font_name if hasattr(self, 'font_name') else "Arial"
-                    font_file_map = {
-                        "Arial": "arialbd.ttf",
-                        "Times New Roman": "timesbd.ttf",
-                        "Courier": "courbd.ttf",
-                        "Georgia": "georgiab.ttf",
-                        "Verdana": "verdanab.ttf",
-                        "Helvetica": "arialbd.ttf",
-                    }
-                    font_file_map_normal = {
-                        "Arial": "arial.ttf",
-                        "Times New Roman": "times.ttf",
-                        "Courier": "cour.ttf",
-                        "Georgia": "georgia.ttf",
-                        "Verdana": "verdana.ttf",
-                        "Helvetica": "arial.ttf",
-                    }
-                    
-                    font_file = font_file_map.get(font_name, "arialbd.ttf")
-                    font_paths = [
-                        f"C:/Windows/Fonts/{font_file}",
-                        f"C:/Windows/Fonts/{font_file_map_normal.get(font_name, 'arial.ttf')}",
-                        "C:/Windows/Fonts/arialbd.ttf",
-                        "C:/Windows/Fonts/arial.ttf",
-                    ]
-                    
-                    font = None
-                    for font_path in font_paths:
-                        try:
-                            if os.path.exists(font_path):
-                                font = ImageFont.truetype(font_path, font_size)
-                                break
-                        except:
-                            continue
-                    
-                    if font is None:
-                        font = ImageFont.load_default()
-                    
-                    # 텍스트 중앙 정렬
-                    bbox = draw.textbbox((0, 0), net_weight_number, font=font)
-                    left, top, right, bottom = bbox
-                    text_width = right - left
-                    text_center_from_baseline = (top + bottom) / 2
-                    
-                    center_x = target_width / 2
-                    center_y = target_height / 2
-                    text_x = center_x - text_width / 2
-                    text_y = center_y - text_center_from_baseline
-                    
-                    draw.text((text_x, text_y), net_weight_number, fill='black', font=font)
-                    
-                    # 3. 우측 하단에 "kg" 표시
-                    kg_font_size = int(font_size * 0.3)
-                    try:
-                        kg_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", kg_font_size)
-                    except:
-                        kg_font = ImageFont.load_default()
-                    
-                    kg_bbox = draw.textbbox((0, 0), "kg", font=kg_font)
-                    kg_width = kg_bbox[2] - kg_bbox[0]
-                    kg_height = kg_bbox[3] - kg_bbox[1]
-                    
-                    draw.text((target_width - 10 - kg_width, 
-                              target_height - 10 - kg_height), 
-                             "kg", fill='black', font=kg_font)
-                    
-                    # 4. 바코드: 좌측 하단
-                    barcode_value = f"{net_weight:.1f}".replace(".", "").zfill(6)
-                    
-                    try:
-                        from barcode import Code128
-                        from barcode.writer import ImageWriter
-                        import io
-                        
-                        barcode_image = Code128(barcode_value, writer=ImageWriter())
-                        barcode_buffer = io.BytesIO()
-                        barcode_image.write(barcode_buffer)
-                        barcode_buffer.seek(0)
-                        
-                        from PIL import Image as PILImage
-                        barcode_pil = PILImage.open(barcode_buffer)
-                        
-                        barcode_height = int(target_height * 0.25)
-                        barcode_aspect = barcode_pil.width / barcode_pil.height
-                        barcode_width = int(barcode_height * barcode_aspect)
-                        barcode_resized = barcode_pil.resize((barcode_width, barcode_height), 
-                                                            PILImage.Resampling.LANCZOS)
-                        
-                        barcode_x = 10
-                        barcode_y = target_height - 10 - barcode_height
-                        img.paste(barcode_resized, (barcode_x, barcode_y))
-                        
-                    except Exception as e:
-                        print(f"바코드 생성 실패: {e}")
-                        barcode_font_size = int(target_height * 0.05)
-                        try:
-                            barcode_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", barcode_font_size)
-                        except:
-                            barcode_font = ImageFont.load_default()
-                        
-                        draw.text((10, target_height - 10), 
-                                 barcode_value, fill='black', font=barcode_font)
-                
-                # 이미지 저장 (300 DPI)
-                img.save(temp_img_path, 'PNG', dpi=(300, 300))
-                print(f"✅ API 인쇄 - PIL Image 생성 완료: {target_width} x {target_height} 픽셀 (300 DPI)")
-                
-                # 이미지를 프린터로 직접 전송 (Word/한글 방식)
-                success = True
-                for copy_idx in range(copies):
-                    if not self.printer.print_image(
-                        temp_img_path,
-                        actual_printer_name,
-                        label_width_cm=self.label_width_cm,
-                        label_height_cm=self.label_height_cm
-                    ):
-                        success = False
-                        break
-                
-                # 임시 파일 삭제
+                response = requests.get(f"{base_url}/api/print/status/{job_id}", timeout=10)
+            except requests.RequestException as e:
+                # 일시적인 연결 오류는 다음 확인에서 다시 시도
+                logger.warning(f"원격 인쇄 상태 조회 실패: {e}")
+                continue
+            info = response.json()
+            if response.status_code == 404:
+                raise RuntimeError(info.get('message') or '원격 인쇄 작업을 찾을 수 없습니다.')
+            status = info.get('status')
+            if status == JOB_FAILED:
+                raise RuntimeError(info.get('error') or '원격 인쇄 실패')
+        print(f"✅ 원격 인쇄 완료: 작업 {job_id}")
+        return True
+    
+    def start_remote_event_listener(self):
+        """원격 서버의 /api/events를 구독해 다른 클라이언트(모바일)의 인쇄를 양식에 자동 입력"""
+        def worker():
+            import requests
+            
+            url = f"{self.server_url.rstrip('/')}/api/events"
+            while not self._remote_events_stop.is_set():
                 try:
-                    os.remove(temp_img_path)
-                except:
-                    pass
-                
-                if success:
-                    # 인쇄 기록 저장
-                    self.save_print_record(data)
-                    
-                    # 양식 테이블에 Total KG 자동 입력 (모바일 전송)
-                    # GUI 스레드에서 실행되도록 root.after 사용
-                    try:
-                        self.root.after(0, lambda: self.add_to_production_form(data))
-                    except:
-                        # root가 없을 경우 직접 호출
-                        self.add_to_production_form(data)
-                    
-                    return jsonify({
-                        'success': True,
-                        'message': '라벨이 성공적으로 인쇄되었습니다.',
-                        'data': {
-                            'total_weight': data.get('total_weight'),
-                            'pallet_weight': data.get('pallet_weight'),
-                            'net_weight': data.get('net_weight'),
-                            'printer': data.get('printer'),
-                        'extra_weight': data.get('extra_weight'),
-                            'copies': copies,
-                            'print_time': datetime.now().isoformat()
-                        }
-                    })
-                else:
-                    return jsonify({
-                        'success': False,
-                        'error': 'PRINT_FAILED',
-                        'message': '인쇄에 실패했습니다. 프린터 설정을 확인해주세요.'
-                    }), 500
-                    
-            except Exception as e:
-                return jsonify({
-                    'success': False,
-                    'error': 'INTERNAL_ERROR',
-                    'message': f'서버 오류가 발생했습니다: {str(e)}'
-                }), 500
-                
-        @app.route('/api/printers', methods=['GET'])
-        def list_printers():
-            try:
-                # Windows 테스트를 위해 강제로 Windows 경로 사용
-                force_windows = request.args.get('force_windows', 'false').lower() == 'true'
-                
-                if os.name == 'posix' and not force_windows:
-                    result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True)
-                    if result.returncode == 0:
-                        printers = []
-                        for line in result.stdout.split('\n'):
-                            if line.startswith('printer'):
-                                parts = line.split()
-                                if len(parts) >= 2:
-                                    printer_name = parts[1]
-                                    status = 'available' if 'idle' in line else 'busy'
-                                    printers.append({
-                                        'name': printer_name,
-                                        'status': status,
-                                        'description': f'프린터 {printer_name}'
-                                    })
-                        return jsonify({'success': True, 'printers': printers})
-                    else:
-                        return jsonify({'success': True, 'printers': []})
-                else:
-                    # Windows의 경우 - GUI와 동일한 로직 사용
-                    printers = []
-                    try:
-                        # 방법 1: PowerShell로 프린터 목록 조회
-                        ps_command = "Get-Printer | ForEach-Object { $_.Name }"
-                        result = subprocess.run([
-                            'powershell', '-Command', ps_command
-                        ], capture_output=True, text=True, timeout=10)
-                        
-                        print(f"PowerShell 결과: {result.returncode}, 출력: {result.stdout}")
-                        
-                        if result.returncode == 0 and result.stdout.strip():
-                            printer_names = result.stdout.strip().split('\n')
-                            for printer_name in printer_names:
-                                printer_name = printer_name.strip()
-                                if printer_name:
-                                    printers.append({
-                                        'name': printer_name,
-                                        'status': 'available',
-                                        'description': f'프린터 {printer_name}'
-                                    })
-                        
-                        # 방법 2: wmic 명령어로도 시도
-                        if not printers:
-                            print("PowerShell 실패, WMIC 시도 중...")
-                            wmic_result = subprocess.run([
-                                'wmic', 'printer', 'get', 'name', '/format:list'
-                            ], capture_output=True, text=True, timeout=10)
-                            
-                            print(f"WMIC 결과: {wmic_result.returncode}, 출력: {wmic_result.stdout}")
-                            
-                            if wmic_result.returncode == 0:
-                                for line in wmic_result.stdout.split('\n'):
-                                    if line.startswith('Name='):
-                                        printer_name = line.replace('Name=', '').strip()
-                                        if printer_name and printer_name != '':
-                                            printers.append({
-                                                'name': printer_name,
-                                                'status': 'available',
-                                                'description': f'프린터 {printer_name}'
-                                            })
-                        
-                        # 방법 3: 레지스트리에서 프린터 목록 조회 (Windows 전용)
-                        if not printers:
-                            print("WMIC 실패, 레지스트리 시도 중...")
-                            try:
-                                import winreg
-                                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SYSTEM\CurrentControlSet\Control\Print\Printers")
-                                i = 0
-                                while True:
-                                    try:
-                                        printer_name = winreg.EnumKey(key, i)
-                                        printers.append({
-                                            'name': printer_name,
-                                            'status': 'available',
-                                            'description': f'프린터 {printer_name}'
-                                        })
-                                        i += 1
-                                    except WindowsError:
-                                        break
-                                winreg.CloseKey(key)
-                            except ImportError:
-                                print("winreg 모듈을 사용할 수 없습니다 (Windows가 아님)")
-                        
-                        # 프린터가 없으면 기본 프린터 추가
-                        if not printers:
-                            print("모든 방법 실패, 기본 프린터 추가")
-                            printers.append({
-                                'name': 'default',
-                                'status': 'available',
-                                'description': '기본 프린터'
-                            })
-                            
-                    except Exception as e:
-                        print(f"Windows 프린터 조회 오류: {e}")
-                        printers.append({
-                            'name': 'default',
-                            'status': 'available',
-                            'description': '기본 프린터'
-                        })
-                    
-                    print(f"최종 프린터 목록: {printers}")
-                    return jsonify({'success': True, 'printers': printers})
-            except Exception as e:
-                return jsonify({
-                    'success': False,
-                    'error': 'PRINTER_LIST_FAILED',
-                    'message': f'프린터 목록 조회 실패: {str(e)}'
-                }), 500
-                
+                    # 서버가 15초마다 keep-alive를 보내므로 읽기 제한 시간은 그보다 길게
+                    with requests.get(url, stream=True, timeout=(5, 60)) as response:
+                        if response.status_code != 200:
+                            raise RuntimeError(f"HTTP {response.status_code}")
+                        for event, payload in read_sse(response.iter_lines(decode_unicode=True)):
+                            if self._remote_events_stop.is_set():
+                                return
+                            if event == 'label_printed':
+                                self.on_remote_label_printed(payload)
+                except Exception as e:
+                    logger.warning(f"원격 서버 이벤트 구독 끊김 ({REMOTE_EVENTS_RETRY}초 후 재연결): {e}")
+                self._remote_events_stop.wait(REMOTE_EVENTS_RETRY)
+        
+        threading.Thread(target=worker, name="remote-events", daemon=True).start()
+    
+    def on_remote_label_printed(self, payload):
+        """원격 서버의 라벨 인쇄 완료 이벤트 (구독 스레드) - 이 GUI가 보낸 인쇄는 건너뜀"""
+        data = payload.get('data') or {}
+        if data.get('client_id') == self.client_id:
+            return
+        self.on_api_print_done(data, None)
+    
     def update_server_status(self):
         """서버 상태 업데이트"""
-        if self.server_running:
+        if self.server_url:
+            self.status_label.config(text="원격 서버 사용 중", foreground="blue")
+            self.server_url_label.config(text=f"인쇄 서버: {self.server_url}")
+        elif self.server_running:
             self.status_label.config(text="서버 실행 중", foreground="green")
             self.server_url_label.config(text=f"모바일 앱에서 접속 가능: http://{self.server_ip}:{self.server_port}")
         else:
             self.status_label.config(text="서버 중지됨", foreground="red")
             self.server_url_label.config(text="")
-            
-        # 5초마다 상태 업데이트
-        self.root.after(5000, self.update_server_status)
         
     def open_production_form(self):
         """Daily Bulk Production Sheet 양식 창 열기"""
@@ -3196,8 +1647,8 @@ class LabelPrinterGUI:
                 'supervisor_signature': form_data['supervisor_signature'].get()
             }
             
-            self.production_records.append(record)
-            self.save_production_records()
+            self.production_records.add(record)
+            self.save_production_record(record)
             messagebox.showinfo("성공", "양식이 저장되었습니다.")
             form_window.destroy()
         
@@ -3411,8 +1862,8 @@ class LabelPrinterGUI:
                 'label_data': label_data  # 라벨 데이터도 함께 저장
             }
             
-            self.production_records.append(record)
-            self.save_production_records()
+            self.production_records.add(record)
+            self.save_production_record(record)
             messagebox.showinfo("성공", "양식이 저장되었습니다.")
             form_window.destroy()
         
@@ -3433,25 +1884,49 @@ class LabelPrinterGUI:
         ttk.Button(button_frame, text="취소", command=form_window.destroy).pack(side=tk.LEFT, padx=5)
     
     def load_production_records(self):
-        """저장된 양식 데이터 로드"""
+        """저장된 양식 데이터 로드 (SQLite 저장소, 처음 실행 시 JSON 자동 가져오기)"""
+        self.production_writer = None
         try:
-            records_file = "production_records.json"
-            if os.path.exists(records_file):
-                with open(records_file, 'r', encoding='utf-8') as f:
-                    self.production_records = json.load(f)
+            self.production_store = ProductionStore()
+            self.production_records = ProductionRecordIndex(self.production_store.load_all())
+            print(f"양식 데이터 로드 완료: {len(self.production_records)}개 기록")
+            # 저장은 백그라운드 작업자가 처리 (GUI 스레드에서 디스크 쓰기 없음)
+            self.production_writer = ProductionWriter(self.production_store)
+            self.production_writer.add_listener(
+                lambda count: self.root.after(0, self.update_pending_writes_status)
+            )
         except Exception as e:
             print(f"양식 데이터 로드 실패: {e}")
-            self.production_records = []
+            self.production_store = None
+            self.production_records = ProductionRecordIndex()
     
-    def save_production_records(self):
-        """양식 데이터를 JSON 파일로 저장"""
-        try:
-            records_file = "production_records.json"
-            with open(records_file, 'w', encoding='utf-8') as f:
-                json.dump(self.production_records, f, ensure_ascii=False, indent=2)
-            print(f"양식 데이터 저장 완료: {len(self.production_records)}개 기록")
-        except Exception as e:
-            print(f"양식 데이터 저장 실패: {e}")
+    def save_production_record(self, record):
+        """양식 기록 하나 저장 요청 (백그라운드에서 바뀐 행만 갱신)"""
+        if self.production_writer is None:
+            print("양식 데이터 저장 실패: 저장소를 열 수 없습니다.")
+            return
+        self.production_writer.save(record)
+    
+    def delete_production_record(self, record):
+        """양식 기록 하나 삭제 요청"""
+        if self.production_writer is None:
+            return
+        self.production_writer.delete(record)
+    
+    def update_pending_writes_status(self):
+        """서버 상태 영역에 저장 대기 건수 표시"""
+        if not hasattr(self, 'pending_writes_label') or self.production_writer is None:
+            return
+        pending = self.production_writer.pending_count()
+        if self.production_writer.last_error:
+            # 실패한 작업은 대기열에 남아 자동으로 다시 시도됨
+            self.pending_writes_label.config(
+                text=f"양식 저장 실패 - 재시도 중 ({pending}건 대기): {self.production_writer.last_error}",
+                foreground="red")
+        elif pending:
+            self.pending_writes_label.config(text=f"양식 저장 대기: {pending}건", foreground="orange")
+        else:
+            self.pending_writes_label.config(text="양식 저장 완료", foreground="gray")
     
     def load_saved_bulk_sheet(self):
         """저장된 양식 목록을 보여주고 선택해서 불러오기"""
@@ -3543,8 +2018,9 @@ class LabelPrinterGUI:
             
             if messagebox.askyesno("확인", "선택한 양식을 삭제하시겠습니까?"):
                 selected_idx = selection[0]
-                self.production_records.pop(selected_idx)
-                self.save_production_records()
+                record = self.production_records[selected_idx]
+                self.production_records.remove(record)
+                self.delete_production_record(record)
                 listbox.delete(selection[0])
                 messagebox.showinfo("성공", "양식이 삭제되었습니다.")
         
@@ -3558,12 +2034,54 @@ class LabelPrinterGUI:
         listbox.bind('<Double-Button-1>', on_double_click)
 
     def on_closing(self):
-        """프로그램 종료 시"""
+        """프로그램 종료 시 - 남은 양식 저장은 백그라운드에서 마무리하고 창은 "저장 중" 상태로 유지"""
+        if self._closing:
+            return
+        self._closing = True
         self.server_running = False
+        self._remote_events_stop.set()
+        self.service.shutdown()
+        printer_registry.stop()
         try:
             self.save_settings()
         except Exception:
             pass
+        
+        writer = self.production_writer
+        if writer is None:
+            self.finish_closing(True)
+            return
+        
+        # 대기 중인 양식 저장을 작업자 스레드에서 모두 쓰고, UI 스레드는 완료 여부만 확인
+        self.root.title("라벨 인쇄 프로그램 - 종료 중")
+        if hasattr(self, 'pending_writes_label'):
+            self.pending_writes_label.config(text="양식 저장 중... 저장이 끝나면 종료됩니다", foreground="orange")
+        result = {}
+        
+        def stop_writer():
+            result['saved'] = writer.stop(timeout=CLOSE_SAVE_TIMEOUT)
+        
+        stopper = threading.Thread(target=stop_writer, name="production-writer-stop", daemon=True)
+        stopper.start()
+        
+        def wait_for_writer():
+            if stopper.is_alive():
+                self.root.after(CLOSE_POLL_MS, wait_for_writer)
+            else:
+                self.finish_closing(result.get('saved', False))
+        
+        wait_for_writer()
+    
+    def finish_closing(self, saved):
+        """양식 저장이 끝났거나 제한 시간이 지나면 창 닫기 (UI 스레드)"""
+        if saved:
+            if self.production_store is not None:
+                self.production_store.close()
+        else:
+            # 작업자가 아직 쓰는 중일 수 있으므로 저장소는 닫지 않음 (프로세스 종료 시 정리됨)
+            unsaved = self.production_writer.pending_keys()
+            logger.error(f"양식 데이터 {len(unsaved)}건이 저장되지 않았습니다: {unsaved}")
+            print(f"⚠️ 양식 데이터 저장이 완료되지 않았습니다 ({len(unsaved)}건)")
         self.root.destroy()
 
 def main():
@@ -0,0 +1,406 @@
+"""
+라벨 렌더 엔진
+
+GUI 인쇄, API 인쇄, 미리보기가 모두 같은 코드로 라벨 이미지를 만듭니다.
+라벨 크기/폰트 설정별로 계산한 레이아웃(폰트 객체, 크기, 여백)은 캐시해서 재사용하고,
+완성된 라벨 이미지는 렌더 입력의 해시를 키로 RenderCache에 보관합니다.
+"""
+
+import os
+import hashlib
+import threading
+import logging
+from collections import OrderedDict
+
+from PIL import Image, ImageDraw, ImageFont
+
+from code128 import code128_image
+
+logger = logging.getLogger(__name__)
+
+# 인쇄용 기본 해상도 (300 DPI에서 1cm = 118.11 pixels)
+PRINT_PX_PER_CM = 118.11
+# 미리보기 해상도 (96 DPI에서 1cm = 37.8 pixels, 1.5배 확대)
+PREVIEW_PX_PER_CM = 1.5 * 37.8
+# 설정 폰트 크기 기준 해상도 (2배 미리보기 캔버스 기준: 1cm = 75.6 pixels)
+FONT_BASE_PX_PER_CM = 2 * 37.8
+
+# 폰트 파일 매핑 (볼드 버전 포함)
+FONT_FILE_MAP_BOLD = {
+    "Arial": "arialbd.ttf",
+    "Times New Roman": "timesbd.ttf",
+    "Courier": "courbd.ttf",
+    "Georgia": "georgiab.ttf",
+    "Verdana": "verdanab.ttf",
+    "Helvetica": "arialbd.ttf",  # Helvetica는 Arial로 대체
+}
+
+# 일반 버전 매핑 (볼드가 없을 경우 대체)
+FONT_FILE_MAP_NORMAL = {
+    "Arial": "arial.ttf",
+    "Times New Roman": "times.ttf",
+    "Courier": "cour.ttf",
+    "Georgia": "georgia.ttf",
+    "Verdana": "verdana.ttf",
+    "Helvetica": "arial.ttf",
+}
+
+# 리눅스에서 MS 폰트가 없을 때 사용하는 대체 폰트 (메트릭 호환)
+FONT_FALLBACK_FILES = {
+    "arialbd.ttf": ["LiberationSans-Bold.ttf", "DejaVuSans-Bold.ttf"],
+    "arial.ttf": ["LiberationSans-Regular.ttf", "DejaVuSans.ttf"],
+    "timesbd.ttf": ["LiberationSerif-Bold.ttf", "DejaVuSerif-Bold.ttf"],
+    "times.ttf": ["LiberationSerif-Regular.ttf", "DejaVuSerif.ttf"],
+    "courbd.ttf": ["LiberationMono-Bold.ttf", "DejaVuSansMono-Bold.ttf"],
+    "cour.ttf": ["LiberationMono-Regular.ttf", "DejaVuSansMono.ttf"],
+}
+
+
+def default_font_dirs():
+    """플랫폼별 기본 폰트 디렉터리"""
+    if os.name == 'nt':
+        windir = os.environ.get('WINDIR', 'C:/Windows')
+        return [os.path.join(windir, 'Fonts')]
+    return [
+        os.path.expanduser('~/.fonts'),
+        os.path.expanduser('~/.local/share/fonts'),
+        '/usr/share/fonts',
+        '/usr/local/share/fonts',
+        '/Library/Fonts',
+        '/System/Library/Fonts/Supplemental',
+    ]
+
+
+class FontRegistry:
+    """프로세스 공용 폰트 레지스트리
+
+    폰트 파일 경로는 (family, weight)별로 한 번만 찾고,
+    ImageFont 객체는 (family, weight, pixel size) 키로 LRU 캐시합니다.
+    """
+
+    def __init__(self, font_dirs=None, max_fonts=32):
+        self.max_fonts = max_fonts
+        self._font_dirs = list(font_dirs or default_font_dirs())
+        self._file_index = None
+        self._paths = {}
+        self._fonts = OrderedDict()
+        self._lock = threading.RLock()
+
+    def set_font_dirs(self, font_dirs):
+        """폰트 디렉터리 변경 (설정 파일의 font_dir) - 경로/폰트 캐시 초기화"""
+        with self._lock:
+            self._font_dirs = [d for d in font_dirs if d]
+            self._file_index = None
+            self._paths.clear()
+            self._fonts.clear()
+
+    def _index_files(self):
+        """폰트 디렉터리의 .ttf/.ttc 파일을 소문자 파일명으로 색인 (최초 1회)"""
+        if self._file_index is not None:
+            return self._file_index
+        index = {}
+        for font_dir in self._font_dirs:
+            if not os.path.isdir(font_dir):
+                continue
+            for dirpath, _, filenames in os.walk(font_dir):
+                for filename in filenames:
+                    if filename.lower().endswith(('.ttf', '.ttc', '.otf')):
+                        index.setdefault(filename.lower(), os.path.join(dirpath, filename))
+        self._file_index = index
+        return index
+
+    def resolve(self, family, bold=True):
+        """폰트 파일 경로 찾기 (없으면 None) - 결과는 캐시"""
+        key = (family, bool(bold))
+        with self._lock:
+            if key in self._paths:
+                return self._paths[key]
+
+            candidates = []
+            if bold:
+                candidates.append(FONT_FILE_MAP_BOLD.get(family, "arialbd.ttf"))
+            candidates.append(FONT_FILE_MAP_NORMAL.get(family, "arial.ttf"))
+            candidates.extend(["arialbd.ttf", "arial.ttf"] if bold else ["arial.ttf"])
+
+            index = self._index_files()
+            path = None
+            for font_file in candidates:
+                for name in [font_file] + FONT_FALLBACK_FILES.get(font_file, []):
+                    path = index.get(name.lower())
+                    if path:
+                        break
+                if path:
+                    break
+
+            if path is None:
+                print(f"⚠️ 폰트 파일을 찾을 수 없습니다: {family} (bold={bold}), 기본 폰트 사용")
+            self._paths[key] = path
+            return path
+
+    def preload(self, family):
+        """설정 폰트의 파일 경로를 미리 찾기 (시작 시 호출)"""
+        self.resolve(family, bold=True)
+        self.resolve("Arial", bold=False)
+
+    def get(self, family, size, bold=True):
+        """ImageFont 객체 조회 (LRU 캐시)"""
+        key = (family, bool(bold), int(size))
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self._fonts.move_to_end(key)
+                return font
+
+            path = self.resolve(family, bold)
+            font = None
+            if path:
+                try:
+                    font = ImageFont.truetype(path, int(size))
+                except Exception as e:
+                    print(f"⚠️ 폰트 로드 실패 ({path}): {e}")
+            if font is None:
+                font = ImageFont.load_default()
+
+            self._fonts[key] = font
+            while len(self._fonts) > self.max_fonts:
+                self._fonts.popitem(last=False)
+            return font
+
+
+# 프로세스 공용 폰트 레지스트리
+font_registry = FontRegistry()
+
+# 렌더 캐시 기본 메모리 한도
+DEFAULT_RENDER_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class RenderCache:
+    """완성된 라벨 이미지 LRU 캐시 (메모리 한도 기준)
+
+    키는 렌더 입력(순수무게 텍스트, 바코드 값, 폰트, 크기, 해상도)의 해시입니다.
+    같은 무게의 라벨을 다시 인쇄하거나 일괄 인쇄에서 무게가 반복되면 렌더링을 건너뜁니다.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_RENDER_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._images = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(*render_inputs):
+        """렌더 입력을 해시한 캐시 키"""
+        return hashlib.sha1(repr(render_inputs).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _image_bytes(img):
+        return img.width * img.height * len(img.getbands())
+
+    def get(self, key):
+        with self._lock:
+            img = self._images.get(key)
+            if img is None:
+                self.misses += 1
+                return None
+            self._images.move_to_end(key)
+            self.hits += 1
+            return img
+
+    def put(self, key, img):
+        size = self._image_bytes(img)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._images.pop(key, None)
+            if old is not None:
+                self._bytes -= self._image_bytes(old)
+            self._images[key] = img
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._bytes -= self._image_bytes(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """캐시 크기 조정용 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._images),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else None,
+            }
+
+
+def _to_float(value):
+    try:
+        return float(value or 0)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def compute_net_weight(data, default_extra_weight=0):
+    """라벨 데이터에서 순수무게 계산 (총무게 - 팔렛무게 - 기타무게)"""
+    if data.get('net_weight'):
+        try:
+            return float(data['net_weight'])
+        except (ValueError, TypeError):
+            pass
+    extra_weight = data.get('extra_weight')
+    if extra_weight in (None, ''):
+        extra_weight = default_extra_weight
+    return _to_float(data.get('total_weight')) - _to_float(data.get('pallet_weight')) - _to_float(extra_weight)
+
+
+def barcode_value_for(net_weight):
+    """순수무게를 바코드 문자열로 변환 (소수점 제거, 최소 6자리)"""
+    return f"{net_weight:.1f}".replace(".", "").zfill(6)
+
+
+def load_label_font(font_name, font_size, bold=True):
+    """라벨용 TrueType 폰트 로드 (공용 레지스트리 사용, 실패 시 기본 폰트)"""
+    return font_registry.get(font_name, font_size, bold=bold)
+
+
+class LabelLayout:
+    """라벨 크기/해상도/폰트 설정 하나에 대한 레이아웃"""
+
+    def __init__(self, width_px, height_px, px_per_cm, font_name, font_size):
+        self.width = width_px
+        self.height = height_px
+        self.px_per_cm = px_per_cm
+        # 300 DPI 기준 픽셀 값을 현재 해상도에 맞게 변환하는 비율
+        self.scale = px_per_cm / PRINT_PX_PER_CM
+
+        self.margin = max(2, round(10 * self.scale))
+        self.border_width = max(2, round(3 * self.scale))
+
+        self.font_px = max(20, int(font_size * px_per_cm / FONT_BASE_PX_PER_CM))
+        self.weight_font = load_label_font(font_name, self.font_px, bold=True)
+        self.kg_font = load_label_font("Arial", max(1, int(self.font_px * 0.3)), bold=False)
+        self.barcode_fallback_font = load_label_font("Arial", max(1, int(height_px * 0.05)), bold=False)
+
+        # "kg" 위치 (우측 하단) - 글자가 바뀌지 않으므로 미리 계산
+        measure = ImageDraw.Draw(Image.new('1', (1, 1)))
+        kg_left, kg_top, kg_right, kg_bottom = measure.textbbox((0, 0), "kg", font=self.kg_font)
+        self.kg_position = (width_px - self.margin - (kg_right - kg_left),
+                            height_px - self.margin - (kg_bottom - kg_top))
+
+        # 바코드 영역 (라벨 높이의 25%, 좌측 하단)
+        self.barcode_height = int(height_px * 0.25)
+        self.barcode_position = (self.margin, height_px - self.margin - self.barcode_height)
+
+
+class LabelRenderer:
+    """라벨 데이터를 메모리 상의 PIL 이미지로 렌더링"""
+
+    def __init__(self, label_width_cm=10.0, label_height_cm=5.0, font_name="Arial", font_size=48,
+                 cache=None):
+        self.label_width_cm = label_width_cm
+        self.label_height_cm = label_height_cm
+        self.font_name = font_name
+        self.font_size = font_size
+        self.cache = cache if cache is not None else RenderCache()
+        self._layouts = {}
+        self._lock = threading.Lock()
+
+    def configure(self, label_width_cm=None, label_height_cm=None, font_name=None, font_size=None):
+        """라벨 크기/폰트 설정 변경 (레이아웃 캐시 키가 바뀌므로 자동 반영)"""
+        if label_width_cm is not None:
+            self.label_width_cm = label_width_cm
+        if label_height_cm is not None:
+            self.label_height_cm = label_height_cm
+        if font_name:
+            self.font_name = font_name
+        if font_size:
+            self.font_size = font_size
+
+    def get_layout(self, px_per_cm=PRINT_PX_PER_CM, size=None):
+        """레이아웃 조회 (캐시)
+
+        Args:
+            px_per_cm: 1cm 당 픽셀 수
+            size: (width, height) 픽셀 - None이면 라벨 크기 x px_per_cm
+        """
+        if size is None:
+            size = (int(self.label_width_cm * px_per_cm), int(self.label_height_cm * px_per_cm))
+        key = (size, round(px_per_cm, 4), self.font_name, self.font_size)
+        with self._lock:
+            layout = self._layouts.get(key)
+            if layout is None:
+                if len(self._layouts) >= 16:
+                    self._layouts.clear()
+                layout = LabelLayout(size[0], size[1], px_per_cm, self.font_name, self.font_size)
+                self._layouts[key] = layout
+            return layout
+
+    def render(self, label_data, px_per_cm=PRINT_PX_PER_CM, size=None, default_extra_weight=0):
+        """라벨 이미지 생성 (캐시) - 테두리, 중앙 순수무게, 우측 하단 kg, 좌측 하단 바코드
+
+        반환된 이미지는 캐시와 공유되므로 수정하지 말고, 필요하면 copy()해서 사용합니다.
+        """
+        layout = self.get_layout(px_per_cm, size)
+        net_weight = compute_net_weight(label_data, default_extra_weight)
+        weight_text = f"{net_weight:.1f}" if net_weight > 0 else ""
+
+        key = self.cache.make_key(weight_text, barcode_value_for(net_weight) if weight_text else "",
+                                  self.font_name, self.font_size,
+                                  (layout.width, layout.height), round(layout.px_per_cm, 4))
+        img = self.cache.get(key)
+        if img is None:
+            img = self._draw(layout, net_weight)
+            self.cache.put(key, img)
+        return img
+
+    def _draw(self, layout, net_weight):
+        """라벨 이미지 그리기"""
+        img = Image.new('RGB', (layout.width, layout.height), 'white')
+        draw = ImageDraw.Draw(img)
+
+        # 1. 테두리 그리기 (이미지 가장자리에 바로)
+        draw.rectangle([0, 0, layout.width - 1, layout.height - 1],
+                       outline='black', width=layout.border_width)
+
+        if net_weight <= 0:
+            return img
+
+        # 2. 중앙에 숫자 그리기 (textbbox 기준으로 정확히 중앙 정렬)
+        net_weight_number = f"{net_weight:.1f}"
+        left, top, right, bottom = draw.textbbox((0, 0), net_weight_number, font=layout.weight_font)
+        text_x = layout.width / 2 - (right - left) / 2
+        text_y = layout.height / 2 - (top + bottom) / 2
+        draw.text((text_x, text_y), net_weight_number, fill='black', font=layout.weight_font)
+
+        # 3. 우측 하단에 "kg" 작게 표시
+        draw.text(layout.kg_position, "kg", fill='black', font=layout.kg_font)
+
+        # 4. 바코드: 좌측 하단
+        barcode_value = barcode_value_for(net_weight)
+        try:
+            img.paste(self._barcode_image(barcode_value, layout.barcode_height, layout.px_per_cm),
+                      layout.barcode_position)
+        except Exception as e:
+            # 바코드 생성 실패 시 텍스트로 표시
+            print(f"바코드 생성 실패: {e}")
+            bbox = draw.textbbox((0, 0), barcode_value, font=layout.barcode_fallback_font)
+            draw.text((layout.margin, layout.height - layout.margin - bbox[3]),
+                      barcode_value, fill='black', font=layout.barcode_fallback_font)
+
+        return img
+
+    def _barcode_image(self, barcode_value, barcode_height, px_per_cm):
+        """Code128 바코드 이미지 (목표 DPI에 맞춘 정수 픽셀 모듈, 메모이즈됨)"""
+        dpi = round(px_per_cm * 2.54)
+        return code128_image(barcode_value, barcode_height, dpi)
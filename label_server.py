@@ -0,0 +1,385 @@
+"""
+라벨 인쇄 서버 (헤드리스 실행 가능)
+
+API, 렌더 엔진, 프린터 백엔드, 인쇄 작업 큐를 Tkinter 없이 실행합니다.
+GUI(label_printer_gui.py)는 이 서비스를 프로세스 안에 띄우거나,
+label_size.txt의 server_url로 지정한 다른 PC의 서버를 클라이언트로 사용합니다.
+일괄 인쇄 API(/api/print/batch, /api/print/batch/stream)는 app.py 서버에만 있습니다.
+
+실행:
+    python label_server.py --host 0.0.0.0 --port 8080
+"""
+
+import os
+import sys
+import argparse
+import threading
+import logging
+from datetime import datetime
+
+from flask import Flask, request, jsonify
+from flask_cors import CORS
+
+from label_printer import LabelPrinter
+from label_render import LabelRenderer, RenderCache, font_registry, default_font_dirs
+from event_stream import EventBroadcaster, event_stream_response
+from idempotency import IdempotencyCache, idempotent
+from label_settings import DEFAULT_SETTINGS, load_label_settings
+from print_queue import PrintJobQueue, JOB_DONE
+from printer_caps import printer_caps
+from printer_registry import printer_registry
+from wsgi_server import serve, server_options
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8080
+API_VERSION = '1.0.0'
+
+
+class LabelPrintService:
+    """라벨 인쇄 서비스 - Flask API와 인쇄 작업 처리 (GUI 없이 동작)"""
+
+    def __init__(self, settings=None, spool_backend=None):
+        self.settings = dict(DEFAULT_SETTINGS)
+        self.settings.update(settings or {})
+
+        # 프린터 인스턴스
+        self.printer = LabelPrinter(spool_backend=spool_backend)
+
+        # 인쇄 작업 큐 (프린터별 워커 스레드, 기본 프린터는 실제 이름의 워커와 공유)
+        self.print_queue = PrintJobQueue(default_printer=self.printer.spool_backend.default_printer)
+
+        # 폰트 파일 경로를 시작 시 한 번만 찾아둠
+        if self.settings.get('font_dir'):
+            font_registry.set_font_dirs([self.settings['font_dir']] + default_font_dirs())
+        font_registry.preload(self.settings['font_name'])
+
+        # 라벨 렌더 엔진 (GUI 인쇄, API 인쇄, 미리보기 공용)
+        # 같은 무게/크기/해상도의 라벨은 렌더 캐시의 이미지를 재사용
+        self.label_renderer = LabelRenderer(
+            self.settings['label_width_cm'], self.settings['label_height_cm'],
+            self.settings['font_name'], self.settings['font_size'],
+            cache=RenderCache(self.settings['render_cache_mb'] * 1024 * 1024)
+        )
+
+        # API 인쇄 완료 콜백 (GUI가 인쇄 기록/양식 자동 입력에 사용)
+        self._print_listeners = []
+
+        # /api/events 구독자에게 작업 진행 상황과 프린터 목록 변경을 푸시
+        # (스트림 하나가 서버 스레드 하나를 점유하므로 스레드의 절반까지만 허용)
+        self.events = EventBroadcaster(max_subscribers=max(1, self.settings['server_threads'] // 2))
+        self.print_queue.add_listener(lambda job: self.events.publish('job', job.to_dict()))
+        printer_registry.add_listener(self._publish_printers)
+
+        # 멱등성 키 -> 응답 (모바일 재요청으로 같은 라벨이 두 번 인쇄되지 않도록)
+        self.idempotency = IdempotencyCache()
+
+    def configure(self, **settings):
+        """설정 변경 반영 (GUI에서 설정을 바꿀 때 호출)"""
+        self.settings.update(settings)
+        self.label_renderer.configure(
+            label_width_cm=self.settings['label_width_cm'],
+            label_height_cm=self.settings['label_height_cm'],
+            font_name=self.settings['font_name'],
+            font_size=self.settings['font_size'],
+        )
+
+    def add_print_listener(self, callback):
+        """API 인쇄 작업이 성공하면 호출될 콜백 등록 - callback(data, job)"""
+        self._print_listeners.append(callback)
+
+    def status_info(self):
+        """서버 상태 (/api/status 응답과 status 이벤트 공용)"""
+        return {
+            'status': 'running',
+            'server_time': datetime.now().isoformat(),
+            'version': API_VERSION,
+            'label_size': f"{self.settings['label_width_cm']:g}cm x {self.settings['label_height_cm']:g}cm",
+            'pending_jobs': self.print_queue.pending_count(),
+            'render_cache': self.label_renderer.cache.stats(),
+        }
+
+    def _publish_printers(self, printers=None):
+        self.events.publish('printers', printer_registry.snapshot())
+
+    def render_for_printer(self, data, printer_name):
+        """프린터 해상도와 인쇄 가능 영역에 맞춰 라벨 이미지를 바로 렌더링
+
+        프린터별 기능 정보는 printer_caps에 캐시되므로 조회는 프린터당 한 번입니다.
+        """
+        caps = printer_caps.get(printer_name)
+        size, px_per_cm = caps.fit_label(self.settings['label_width_cm'], self.settings['label_height_cm'])
+        img = self.label_renderer.render(data, px_per_cm=px_per_cm, size=size)
+        print(f"✅ 라벨 이미지 생성 완료: {img.width} x {img.height} 픽셀 ({caps.dpi_x} DPI)")
+        return img
+
+    def submit_label(self, data, copies):
+        """검증된 라벨 데이터를 인쇄 큐에 등록 (렌더링/인쇄는 프린터별 워커에서 처리)"""
+        display_name = data.get('printer', '기본 프린터')
+
+        # API에서는 프린터 이름을 직접 사용 (GUI의 매핑 없이)
+        if display_name == '기본 프린터' or display_name == 'default':
+            actual_printer_name = None  # 기본 프린터 사용
+        else:
+            actual_printer_name = display_name  # 프린터 이름 직접 사용
+
+        print(f"API 인쇄 - 선택된 프린터: {display_name}")
+        print(f"API 인쇄 - 실제 프린터명: {actual_printer_name}")
+
+        def render_label():
+            # 프린터 해상도로 라벨 이미지 생성 (GUI 인쇄와 동일, 메모리에 유지)
+            return self.render_for_printer(data, actual_printer_name)
+
+        def spool_label(img):
+            # Windows는 프린터 DC로 직접, 그 외(CUPS/파일 백엔드)는 라벨 크기 PDF로 스풀 (매수는 작업 하나로)
+            return self.printer.print_image(
+                img,
+                actual_printer_name,
+                label_width_cm=self.settings['label_width_cm'],
+                label_height_cm=self.settings['label_height_cm'],
+                copies=copies
+            )
+
+        def on_print_done(job):
+            if job.status != JOB_DONE:
+                print(f"❌ API 인쇄 실패 (작업 {job.job_id}): {job.error}")
+                return
+            for listener in self._print_listeners:
+                try:
+                    listener(data, job)
+                except Exception as e:
+                    logger.error(f"인쇄 완료 콜백 오류: {e}")
+            # 원격 모드 GUI가 모바일 인쇄를 양식에 자동 입력할 수 있도록 라벨 데이터도 푸시
+            self.events.publish('label_printed', {'job_id': job.job_id, 'data': data})
+
+        return self.print_queue.submit(
+            actual_printer_name,
+            render=render_label,
+            spool=spool_label,
+            data=data,
+            on_done=on_print_done
+        )
+
+    def create_app(self):
+        """API 엔드포인트가 등록된 Flask 앱 생성"""
+        app = Flask(__name__)
+        CORS(app)
+        self.register_routes(app)
+        return app
+
+    def register_routes(self, app):
+        """API 엔드포인트 설정"""
+
+        @app.route('/api/status', methods=['GET'])
+        def server_status():
+            return jsonify({'success': True, **self.status_info()})
+
+        @app.route('/api/events', methods=['GET'])
+        def event_stream():
+            """서버 상태/프린터 목록/인쇄 작업 진행 상황 SSE 스트림"""
+            return event_stream_response(self.events, [
+                ('status', self.status_info()),
+                ('printers', printer_registry.snapshot()),
+            ])
+
+        @app.route('/api/print', methods=['POST'])
+        @idempotent(self.idempotency)
+        def print_label_api():
+            try:
+                data = request.get_json()
+                extra_weight_default = self.settings['extra_weight']
+                default_copies = self.settings['default_label_copies']
+
+                if not data.get('total_weight'):
+                    return jsonify({
+                        'success': False,
+                        'error': 'TOTAL_WEIGHT_REQUIRED',
+                        'message': '총무게 정보가 필요합니다.'
+                    }), 400
+
+                if not data.get('pallet_weight'):
+                    return jsonify({
+                        'success': False,
+                        'error': 'PALLET_WEIGHT_REQUIRED',
+                        'message': '팔렛무게 정보가 필요합니다.'
+                    }), 400
+
+                # 순수무게 계산
+                try:
+                    total_weight = float(data['total_weight'])
+                    pallet_weight = float(data['pallet_weight'])
+                    extra_weight = float(data.get('extra_weight', extra_weight_default) or extra_weight_default)
+                    net_weight = total_weight - pallet_weight - extra_weight
+
+                    if net_weight <= 0:
+                        return jsonify({
+                            'success': False,
+                            'error': 'INVALID_WEIGHT',
+                            'message': '팔렛무게와 기타 무게의 합이 총무게보다 크거나 같습니다.'
+                        }), 400
+
+                except ValueError:
+                    return jsonify({
+                        'success': False,
+                        'error': 'INVALID_WEIGHT_FORMAT',
+                        'message': '무게는 숫자여야 합니다.'
+                    }), 400
+
+                try:
+                    copies = int(data.get('copies', default_copies) or default_copies)
+                    if copies < 1:
+                        raise ValueError
+                except (ValueError, TypeError):
+                    return jsonify({
+                        'success': False,
+                        'error': 'INVALID_COPIES',
+                        'message': '인쇄 매수는 1 이상의 정수여야 합니다.'
+                    }), 400
+
+                data['copies'] = str(copies)
+
+                # 기본값 설정
+                data['net_weight'] = f"{net_weight:.1f}"
+                data['weight'] = f"{net_weight:.1f}"  # 라벨에 표시될 무게
+                if not data.get('date'):
+                    data['date'] = datetime.now().strftime('%Y-%m-%d')
+                if not data.get('product_name'):
+                    data['product_name'] = '제품'
+                if not data.get('printer'):
+                    data['printer'] = '기본 프린터'
+
+                # 인쇄 작업 등록 후 바로 응답
+                job = self.submit_label(data, copies)
+
+                return jsonify({
+                    'success': True,
+                    'message': '라벨 인쇄 요청이 접수되었습니다.',
+                    'job_id': job.job_id,
+                    'status': job.status,
+                    'data': {
+                        'total_weight': data.get('total_weight'),
+                        'pallet_weight': data.get('pallet_weight'),
+                        'net_weight': data.get('net_weight'),
+                        'printer': data.get('printer'),
+                        'extra_weight': data.get('extra_weight'),
+                        'copies': copies,
+                        'job_id': job.job_id,
+                        'print_time': datetime.now().isoformat()
+                    }
+                }), 202
+
+            except Exception as e:
+                return jsonify({
+                    'success': False,
+                    'error': 'INTERNAL_ERROR',
+                    'message': f'서버 오류가 발생했습니다: {str(e)}'
+                }), 500
+
+        @app.route('/api/print/status/<label_id>', methods=['GET'])
+        def get_print_status(label_id):
+            """인쇄 작업 상태 조회 (label_id = 인쇄 작업 ID)"""
+            job = self.print_queue.get(label_id)
+            if job is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'JOB_NOT_FOUND',
+                    'message': '인쇄 작업을 찾을 수 없습니다.'
+                }), 404
+
+            job_info = job.to_dict()
+            return jsonify({
+                'success': True,
+                'label_id': label_id,
+                'status': job_info['status'],
+                'error': job_info['error'],
+                'job': job_info,
+                'print_time': job_info['updated_at']
+            })
+
+        @app.route('/api/printers', methods=['GET'])
+        def list_printers():
+            try:
+                # ?refresh=true이면 시스템 프린터를 즉시 다시 조회, 아니면 메모리 목록 사용
+                refresh = request.args.get('refresh', 'false').lower() == 'true'
+                snapshot = printer_registry.snapshot(refresh=refresh)
+                printers = snapshot['printers']
+                if not printers and os.name != 'posix':
+                    printers = [{
+                        'name': 'default',
+                        'status': 'available',
+                        'description': '기본 프린터'
+                    }]
+                return jsonify({
+                    'success': True,
+                    'printers': printers,
+                    'refreshed_at': snapshot['refreshed_at'],
+                    'age_seconds': snapshot['age_seconds']
+                })
+            except Exception as e:
+                return jsonify({
+                    'success': False,
+                    'error': 'PRINTER_LIST_FAILED',
+                    'message': f'프린터 목록 조회 실패: {str(e)}'
+                }), 500
+
+    def serve(self, app, host, port):
+        """서버 실행 (블로킹) - server_mode 설정에 따라 waitress 또는 Flask 개발 서버"""
+        serve(app, host, port, **server_options(self.settings))
+
+    def start_in_thread(self, host, port, on_stopped=None):
+        """백그라운드 스레드에서 서버 실행 (GUI 내장 모드) - 스레드 반환
+
+        on_stopped: 서버가 멈추면(포트 사용 중 등) 서버 스레드에서 호출되는 콜백
+        """
+        app = self.create_app()
+
+        def run():
+            try:
+                self.serve(app, host, port)
+            except Exception as e:
+                logger.error(f"라벨 인쇄 서버 오류: {e}")
+                print(f"❌ 라벨 인쇄 서버 오류: {e}")
+            finally:
+                if on_stopped:
+                    on_stopped()
+
+        thread = threading.Thread(target=run, name="label-server", daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self):
+        """이벤트 스트림과 인쇄 작업 큐 종료, 임시 PDF 정리"""
+        self.events.close()
+        self.print_queue.shutdown()
+        self.printer.close()
+
+
+def main(argv=None):
+    """헤드리스 서버 진입점 (GUI 없이 API만 실행)"""
+    parser = argparse.ArgumentParser(description="라벨 인쇄 서버 (헤드리스)")
+    parser.add_argument('--host', default='0.0.0.0', help="바인드 주소 (기본: 0.0.0.0)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"포트 (기본: {DEFAULT_PORT})")
+    parser.add_argument('--config', default='label_size.txt', help="설정 파일 경로 (기본: label_size.txt)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    service = LabelPrintService(load_label_settings(args.config))
+
+    # 프린터 목록은 시작 시 한 번 조회하고 백그라운드에서 갱신
+    printer_registry.start()
+
+    print(f"라벨 인쇄 서버(헤드리스)가 시작됩니다: http://{args.host}:{args.port}")
+    try:
+        service.serve(service.create_app(), args.host, args.port)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print("라벨 인쇄 서버를 종료합니다...")
+        printer_registry.stop()
+        service.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
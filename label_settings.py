@@ -0,0 +1,155 @@
+"""
+label_size.txt 설정 읽기/쓰기
+
+GUI와 헤드리스 서버가 같은 설정 파일을 같은 규칙으로 읽습니다.
+"""
+
+import os
+
+CONFIG_FILE = "label_size.txt"
+
+# 설정 기본값
+DEFAULT_SETTINGS = {
+    'label_width_cm': 10.0,
+    'label_height_cm': 5.0,
+    'font_name': "Arial",
+    'font_size': 48,
+    'font_dir': None,  # 추가 폰트 폴더 (리눅스 등)
+    'extra_weight': 3.0,  # 기본 기타 무게
+    'default_printer_name': None,
+    'default_label_copies': 2,
+    'default_bulk_copies': 2,
+    'server_url': None,  # 설정하면 GUI는 이 주소의 인쇄 서버를 사용 (내장 서버 시작 안 함)
+    'server_mode': 'production',  # production(waitress) 또는 development(Flask 개발 서버)
+    'server_threads': 8,  # 요청 처리 스레드 수
+    'server_keepalive': 30,  # 유휴 keep-alive 연결 유지 시간 (초)
+    'max_request_bytes': 1024 * 1024,  # 요청 본문 최대 크기
+    'render_cache_mb': 64,  # 렌더링된 라벨 이미지 캐시 메모리 한도 (MB)
+    'auto_fill_total_kg': True,  # GUI 라벨 인쇄 후 양식 Total KG에 순수무게 자동 입력
+}
+
+# 설정 파일 키 (소문자) -> (설정 이름, 변환 함수)
+_KEY_MAP = {}
+
+
+def _register(names, setting, convert):
+    for name in names:
+        _KEY_MAP[name] = (setting, convert)
+
+
+def _int(value):
+    return int(float(value))
+
+
+def _kilobytes(value):
+    return int(float(value) * 1024)
+
+
+def _server_mode(value):
+    value = value.lower()
+    if value not in ('production', 'development'):
+        raise ValueError(f"알 수 없는 서버 모드: {value}")
+    return value
+
+
+def _bool(value):
+    value = value.lower()
+    if value in ('1', 'true', 'yes', 'on', '예'):
+        return True
+    if value in ('0', 'false', 'no', 'off', '아니오'):
+        return False
+    raise ValueError(f"알 수 없는 값: {value}")
+
+
+def _text(value):
+    if not value:
+        raise ValueError("빈 값")
+    return value
+
+
+_register(('width', '너비'), 'label_width_cm', float)
+_register(('height', '높이'), 'label_height_cm', float)
+_register(('font', '폰트'), 'font_name', _text)
+_register(('fontsize', 'font_size', '폰트크기'), 'font_size', _int)
+_register(('font_dir', 'fontdir', '폰트폴더'), 'font_dir', _text)
+_register(('extra_weight', 'extraweight', 'tare', '기타무게'), 'extra_weight', float)
+_register(('default_printer', 'defaultprinter'), 'default_printer_name', _text)
+_register(('default_label_copies', 'label_copies', '라벨매수'), 'default_label_copies', _int)
+_register(('default_bulk_copies', 'bulk_copies', '벌크매수'), 'default_bulk_copies', _int)
+_register(('server_url', '서버주소'), 'server_url', _text)
+_register(('server_mode', '서버모드'), 'server_mode', _server_mode)
+_register(('server_threads', '서버스레드'), 'server_threads', _int)
+_register(('server_keepalive', 'keepalive'), 'server_keepalive', _int)
+_register(('max_request_kb', '최대요청크기'), 'max_request_bytes', _kilobytes)
+_register(('render_cache_mb', '렌더캐시'), 'render_cache_mb', _int)
+_register(('auto_fill_total_kg', '자동입력'), 'auto_fill_total_kg', _bool)
+
+
+def load_label_settings(config_file=CONFIG_FILE):
+    """설정 파일에서 읽은 값만 dict로 반환 (파일이 없거나 값이 잘못되면 해당 키 없음)
+
+    첫 줄처럼 "너비,높이" 형식의 줄은 라벨 크기로 읽습니다.
+    """
+    settings = {}
+    if not os.path.exists(config_file):
+        return settings
+
+    with open(config_file, 'r', encoding='utf-8') as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            if ',' in line and ':' not in line:
+                parts = [p.strip() for p in line.split(',')]
+                if len(parts) == 2:
+                    try:
+                        settings['label_width_cm'] = float(parts[0])
+                        settings['label_height_cm'] = float(parts[1])
+                    except ValueError:
+                        pass
+                continue
+
+            if ':' in line:
+                key, value = [token.strip() for token in line.split(':', 1)]
+                mapping = _KEY_MAP.get(key.lower())
+                if mapping is None:
+                    continue
+                setting, convert = mapping
+                try:
+                    settings[setting] = convert(value)
+                except ValueError:
+                    pass
+    return settings
+
+
+def save_label_settings(settings, config_file=CONFIG_FILE):
+    """설정을 label_size.txt 형식으로 저장 (None인 선택 항목은 생략)"""
+    values = dict(DEFAULT_SETTINGS)
+    values.update(settings)
+    lines = [
+        f"{values['label_width_cm']:g},{values['label_height_cm']:g}",
+        f"font: {values['font_name']}",
+        f"fontsize: {values['font_size']}",
+        f"extra_weight: {values['extra_weight']:g}",
+        f"default_label_copies: {values['default_label_copies']}",
+        f"default_bulk_copies: {values['default_bulk_copies']}",
+    ]
+    if values.get('default_printer_name'):
+        lines.append(f"default_printer: {values['default_printer_name']}")
+    if values.get('font_dir'):
+        lines.append(f"font_dir: {values['font_dir']}")
+    if values.get('server_url'):
+        lines.append(f"server_url: {values['server_url']}")
+    # 서버 설정은 기본값과 다를 때만 기록
+    for setting in ('server_mode', 'server_threads', 'server_keepalive', 'render_cache_mb'):
+        if values[setting] != DEFAULT_SETTINGS[setting]:
+            lines.append(f"{setting}: {values[setting]}")
+    if values['auto_fill_total_kg'] != DEFAULT_SETTINGS['auto_fill_total_kg']:
+        lines.append(f"auto_fill_total_kg: {'true' if values['auto_fill_total_kg'] else 'false'}")
+    if values['max_request_bytes'] != DEFAULT_SETTINGS['max_request_bytes']:
+        lines.append(f"max_request_kb: {values['max_request_bytes'] / 1024:g}")
+
+    with open(config_file, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(str(line) for line in lines))
+        f.write('\n')
@@ -0,0 +1,204 @@
+"""
+인쇄 작업 큐
+
+요청 스레드는 검증 후 작업을 등록하고 바로 응답하며,
+물리 프린터마다 하나의 워커 스레드가 큐를 순서대로 처리합니다.
+"""
+
+import threading
+import queue
+import uuid
+import logging
+from collections import OrderedDict
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_QUEUED = 'queued'
+JOB_RENDERING = 'rendering'
+JOB_SPOOLING = 'spooling'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+
+# 프린터 이름이 없고 기본 프린터 이름도 알 수 없을 때 사용하는 큐 키
+DEFAULT_PRINTER_KEY = '__default__'
+
+
+class PrintJob:
+    """인쇄 작업 하나의 상태"""
+
+    def __init__(self, printer_name, render, spool, data=None, on_done=None):
+        self.job_id = uuid.uuid4().hex
+        self.printer_name = printer_name
+        self.render = render
+        self.spool = spool
+        self.data = data or {}
+        self.on_done = on_done
+        self.status = JOB_QUEUED
+        self.error = None
+        self.created_at = datetime.now()
+        self.updated_at = self.created_at
+        self.finished = threading.Event()
+
+    def set_status(self, status, error=None):
+        self.status = status
+        self.error = error
+        self.updated_at = datetime.now()
+        if status in (JOB_DONE, JOB_FAILED):
+            self.finished.set()
+
+    def wait(self, timeout=None):
+        """작업 완료까지 대기 (완료되면 True)"""
+        return self.finished.wait(timeout)
+
+    def to_dict(self):
+        return {
+            'job_id': self.job_id,
+            'printer': self.printer_name,
+            'status': self.status,
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+        }
+
+
+class PrintJobQueue:
+    """프린터별 워커 스레드로 인쇄 작업을 처리하는 큐"""
+
+    def __init__(self, max_history=500, default_printer=None):
+        """
+        Args:
+            max_history: 상태 조회용으로 보관할 작업 수
+            default_printer: 기본 프린터 이름을 반환하는 함수 - 프린터 이름 없이 온 작업과
+                기본 프린터 이름을 직접 지정한 작업이 같은 워커에서 순서대로 처리되도록 사용
+        """
+        self.max_history = max_history
+        self._default_printer = default_printer
+        self._jobs = OrderedDict()
+        self._queues = {}
+        self._workers = {}
+        self._lock = threading.Lock()
+        self._running = True
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """작업 상태가 바뀔 때마다 호출될 콜백 등록 - callback(job) (워커/요청 스레드에서 호출됨)"""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def _set_status(self, job, status, error=None):
+        """작업 상태 변경 후 리스너에 알림"""
+        job.set_status(status, error)
+        self._notify(job)
+
+    def _notify(self, job):
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(job)
+            except Exception as e:
+                logger.error(f"인쇄 작업 상태 콜백 오류: {e}")
+
+    def submit(self, printer_name, render, spool, data=None, on_done=None):
+        """작업 등록
+
+        Args:
+            printer_name: 대상 프린터 이름 (None이면 기본 프린터)
+            render: 인쇄물을 만드는 함수 - 반환값이 spool에 전달됨
+            spool: render 결과를 프린터로 보내는 함수 - 성공 시 True
+            data: 상태 조회 시 함께 보관할 요청 데이터
+            on_done: 완료 후 호출되는 콜백 (job 인자)
+        """
+        job = PrintJob(printer_name, render, spool, data=data, on_done=on_done)
+        key = self._queue_key(printer_name)
+
+        with self._lock:
+            if not self._running:
+                raise RuntimeError("인쇄 큐가 종료되었습니다.")
+            self._jobs[job.job_id] = job
+            while len(self._jobs) > self.max_history:
+                oldest_id, oldest = next(iter(self._jobs.items()))
+                if not oldest.finished.is_set():
+                    break
+                self._jobs.pop(oldest_id)
+            job_queue = self._queues.get(key)
+            if job_queue is None:
+                job_queue = queue.Queue()
+                self._queues[key] = job_queue
+                worker = threading.Thread(
+                    target=self._run_worker,
+                    args=(key, job_queue),
+                    name=f"print-worker-{key}",
+                    daemon=True,
+                )
+                self._workers[key] = worker
+                worker.start()
+
+        # 워커가 상태를 바꾸기 전에 queued 상태를 먼저 알림
+        self._notify(job)
+        job_queue.put(job)
+        logger.info(f"인쇄 작업 등록: {job.job_id} (프린터: {key}, 대기: {job_queue.qsize()})")
+        return job
+
+    def _queue_key(self, printer_name):
+        """작업을 처리할 워커의 키 - 이름이 없으면 실제 기본 프린터 이름 (물리 프린터당 워커 하나)"""
+        if not printer_name and self._default_printer is not None:
+            try:
+                printer_name = self._default_printer()
+            except Exception as e:
+                logger.warning(f"기본 프린터 이름 조회 실패: {e}")
+        return printer_name or DEFAULT_PRINTER_KEY
+
+    def get(self, job_id):
+        """작업 조회 (없으면 None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def pending_count(self, printer_name=None):
+        """대기 중인 작업 수"""
+        key = self._queue_key(printer_name) if printer_name is not None else None
+        with self._lock:
+            if key is not None:
+                job_queue = self._queues.get(key)
+                return job_queue.qsize() if job_queue else 0
+            return sum(q.qsize() for q in self._queues.values())
+
+    def _run_worker(self, key, job_queue):
+        """프린터 한 대의 작업을 순서대로 처리"""
+        while True:
+            job = job_queue.get()
+            if job is None:
+                break
+            try:
+                self._set_status(job, JOB_RENDERING)
+                payload = job.render()
+                self._set_status(job, JOB_SPOOLING)
+                if job.spool(payload):
+                    self._set_status(job, JOB_DONE)
+                else:
+                    self._set_status(job, JOB_FAILED, '인쇄에 실패했습니다. 프린터 설정을 확인해주세요.')
+            except Exception as e:
+                logger.error(f"인쇄 작업 {job.job_id} 실패: {e}")
+                self._set_status(job, JOB_FAILED, str(e))
+            finally:
+                job_queue.task_done()
+
+            if job.on_done:
+                try:
+                    job.on_done(job)
+                except Exception as e:
+                    logger.error(f"인쇄 작업 완료 콜백 오류: {e}")
+
+    def shutdown(self, wait=False):
+        """워커 종료 (대기 중인 작업은 처리 후 종료)"""
+        with self._lock:
+            self._running = False
+            queues = list(self._queues.values())
+            workers = list(self._workers.values())
+        for job_queue in queues:
+            job_queue.put(None)
+        if wait:
+            for worker in workers:
+                worker.join()
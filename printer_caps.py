@@ -0,0 +1,183 @@
+"""
+프린터 기능(해상도/인쇄 가능 영역) 조회 및 캐시
+
+라벨을 고정 300 DPI로 그린 뒤 프린터 해상도에 맞춰 리사이즈하는 대신,
+프린터별로 한 번 조회한 DPI와 인쇄 가능 영역으로 처음부터 그 크기에 맞게 렌더링합니다.
+"""
+
+import importlib.util
+import re
+import subprocess
+import threading
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# 프린터 정보를 알 수 없을 때 사용하는 기본 해상도
+DEFAULT_DPI = 300
+CM_PER_INCH = 2.54
+
+# GetDeviceCaps 상수
+LOGPIXELSX = 88
+LOGPIXELSY = 90
+HORZRES = 8
+VERTRES = 10
+PHYSICALOFFSETX = 112
+PHYSICALOFFSETY = 113
+
+
+class PrinterCaps:
+    """프린터 한 대의 해상도와 인쇄 가능 영역 (픽셀)"""
+
+    def __init__(self, printer_name, dpi_x=DEFAULT_DPI, dpi_y=None,
+                 printable_width=None, printable_height=None,
+                 offset_x=0, offset_y=0, source='default'):
+        self.printer_name = printer_name
+        self.dpi_x = dpi_x
+        self.dpi_y = dpi_y or dpi_x
+        self.printable_width = printable_width
+        self.printable_height = printable_height
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.source = source
+        self.probed_at = datetime.now()
+
+    @property
+    def px_per_cm(self):
+        return self.dpi_x / CM_PER_INCH
+
+    def fit_label(self, label_width_cm, label_height_cm):
+        """라벨 용지를 프린터 해상도로 환산한 출력 크기와 렌더 해상도
+
+        인쇄 가능 영역보다 크면 비율을 유지하며 축소합니다.
+
+        Returns:
+            ((width_px, height_px), px_per_cm)
+        """
+        width = int(label_width_cm / CM_PER_INCH * self.dpi_x)
+        height = int(label_height_cm / CM_PER_INCH * self.dpi_y)
+        px_per_cm = self.px_per_cm
+
+        if self.printable_width and self.printable_height and \
+                (width > self.printable_width or height > self.printable_height):
+            ratio = min(self.printable_width / width, self.printable_height / height)
+            width = min(int(width * ratio), self.printable_width)
+            height = min(int(height * ratio), self.printable_height)
+            px_per_cm *= ratio
+            print(f"⚠️ 라벨이 인쇄 가능 영역을 초과하여 비율 유지하며 축소: {width} x {height} 픽셀")
+
+        return (width, height), px_per_cm
+
+    def to_dict(self):
+        return {
+            'printer': self.printer_name,
+            'dpi': [self.dpi_x, self.dpi_y],
+            'printable_area': [self.printable_width, self.printable_height],
+            'offset': [self.offset_x, self.offset_y],
+            'source': self.source,
+            'probed_at': self.probed_at.isoformat(),
+        }
+
+
+def caps_from_dc(printer_name, hdc):
+    """열려 있는 프린터 DC(win32ui)에서 기능 정보 읽기"""
+    try:
+        offset_x = hdc.GetDeviceCaps(PHYSICALOFFSETX)
+        offset_y = hdc.GetDeviceCaps(PHYSICALOFFSETY)
+    except Exception:
+        offset_x = offset_y = 0
+    return PrinterCaps(
+        printer_name,
+        dpi_x=hdc.GetDeviceCaps(LOGPIXELSX),
+        dpi_y=hdc.GetDeviceCaps(LOGPIXELSY),
+        printable_width=hdc.GetDeviceCaps(HORZRES),
+        printable_height=hdc.GetDeviceCaps(VERTRES),
+        offset_x=offset_x,
+        offset_y=offset_y,
+        source='win32',
+    )
+
+
+def probe_win32(printer_name):
+    """Windows 프린터 DC를 잠깐 열어 기능 정보 조회"""
+    import win32print
+    import win32ui
+
+    target = printer_name or win32print.GetDefaultPrinter()
+    hdc = win32ui.CreateDC()
+    hdc.CreatePrinterDC(target)
+    try:
+        return caps_from_dc(printer_name, hdc)
+    finally:
+        hdc.DeleteDC()
+
+
+def probe_cups(printer_name):
+    """CUPS 프린터 옵션(lpoptions -l)의 Resolution 기본값으로 해상도 조회"""
+    cmd = ['lpoptions', '-l']
+    if printer_name:
+        cmd[1:1] = ['-p', printer_name]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or 'lpoptions 실패')
+    for line in result.stdout.split('\n'):
+        if not line.lower().startswith('resolution'):
+            continue
+        match = re.search(r'\*(\d+)(?:x(\d+))?dpi', line)
+        if match:
+            dpi_x = int(match.group(1))
+            dpi_y = int(match.group(2) or dpi_x)
+            return PrinterCaps(printer_name, dpi_x=dpi_x, dpi_y=dpi_y, source='cups')
+    return PrinterCaps(printer_name, source='cups')
+
+
+class PrinterCapsCache:
+    """프린터별 기능 정보 캐시 - 프린터마다 한 번만 조회"""
+
+    def __init__(self, probe=None):
+        self._probe = probe
+        self._caps = {}
+        self._lock = threading.Lock()
+
+    def _default_probe(self, printer_name):
+        if importlib.util.find_spec('win32ui') is not None:
+            return probe_win32(printer_name)
+        return probe_cups(printer_name)
+
+    def get(self, printer_name, refresh=False):
+        """프린터 기능 정보 (조회 실패 시 기본 300 DPI, 실패 결과도 캐시)"""
+        with self._lock:
+            caps = self._caps.get(printer_name)
+        if caps is not None and not refresh:
+            return caps
+
+        probe = self._probe or self._default_probe
+        try:
+            caps = probe(printer_name)
+            print(f"프린터 기능 조회: {printer_name or '기본 프린터'} - "
+                  f"{caps.dpi_x} x {caps.dpi_y} DPI, 인쇄 가능 영역 {caps.printable_width} x {caps.printable_height}")
+        except Exception as e:
+            logger.warning(f"프린터 기능 조회 실패 ({printer_name}): {e} - 기본 {DEFAULT_DPI} DPI 사용")
+            caps = PrinterCaps(printer_name)
+
+        with self._lock:
+            self._caps[printer_name] = caps
+        return caps
+
+    def update(self, caps):
+        """인쇄 중 얻은 최신 정보로 캐시 갱신"""
+        with self._lock:
+            self._caps[caps.printer_name] = caps
+
+    def invalidate(self, printer_name=None):
+        """캐시 삭제 (printer_name이 None이면 전체)"""
+        with self._lock:
+            if printer_name is None:
+                self._caps.clear()
+            else:
+                self._caps.pop(printer_name, None)
+
+
+# 프로세스 전체에서 공유하는 프린터 기능 캐시
+printer_caps = PrinterCapsCache()
@@ -0,0 +1,220 @@
+"""
+프린터 목록 레지스트리
+
+프린터 조회(lpstat, win32print, PowerShell, wmic)는 Windows에서 수 초가 걸릴 수 있으므로
+시작할 때 한 번 조회하고, 이후에는 백그라운드 스레드가 TTL마다 갱신합니다.
+/api/printers와 GUI 프린터 목록은 메모리에 있는 결과를 바로 사용합니다.
+"""
+
+import os
+import subprocess
+import threading
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# 기본 갱신 주기 (초)
+DEFAULT_PRINTER_TTL = 120
+
+STATUS_AVAILABLE = 'available'
+STATUS_BUSY = 'busy'
+
+
+def _printer_entry(printer_name, status=STATUS_AVAILABLE):
+    return {
+        'name': printer_name,
+        'status': status,
+        'description': f'프린터 {printer_name}'
+    }
+
+
+def _enumerate_cups():
+    result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True, timeout=10)
+    if result.returncode != 0:
+        return []
+    printers = []
+    for line in result.stdout.split('\n'):
+        if line.startswith('printer'):
+            parts = line.split()
+            if len(parts) >= 2:
+                status = STATUS_AVAILABLE if 'idle' in line else STATUS_BUSY
+                printers.append(_printer_entry(parts[1], status))
+    return printers
+
+
+def _enumerate_windows():
+    # 방법 1: win32print
+    try:
+        import win32print
+        printers = win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS)
+        return [_printer_entry(printer[2]) for printer in printers if printer[2]]
+    except ImportError:
+        print("win32print 모듈이 없습니다. PowerShell로 프린터 목록 조회...")
+
+    printers = []
+
+    # 방법 2: PowerShell
+    try:
+        result = subprocess.run([
+            'powershell', '-Command', "Get-Printer | ForEach-Object { $_.Name }"
+        ], capture_output=True, text=True, timeout=10)
+        if result.returncode == 0 and result.stdout.strip():
+            for printer_name in result.stdout.strip().split('\n'):
+                printer_name = printer_name.strip()
+                if printer_name:
+                    printers.append(_printer_entry(printer_name))
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"PowerShell 프린터 조회 실패: {e}")
+
+    # 방법 3: wmic
+    if not printers:
+        try:
+            result = subprocess.run([
+                'wmic', 'printer', 'get', 'name', '/format:list'
+            ], capture_output=True, text=True, timeout=10)
+            if result.returncode == 0:
+                for line in result.stdout.split('\n'):
+                    if line.startswith('Name='):
+                        printer_name = line.replace('Name=', '').strip()
+                        if printer_name:
+                            printers.append(_printer_entry(printer_name))
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"WMIC 프린터 조회 실패: {e}")
+
+    # 방법 4: 레지스트리
+    if not printers:
+        try:
+            import winreg
+            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SYSTEM\CurrentControlSet\Control\Print\Printers")
+            try:
+                i = 0
+                while True:
+                    try:
+                        printers.append(_printer_entry(winreg.EnumKey(key, i)))
+                        i += 1
+                    except OSError:
+                        break
+            finally:
+                winreg.CloseKey(key)
+        except (ImportError, OSError) as e:
+            print(f"레지스트리 프린터 조회 실패: {e}")
+
+    return printers
+
+
+def enumerate_printers():
+    """시스템 프린터 목록 조회 (느릴 수 있음 - PrinterRegistry를 통해 사용)"""
+    if os.name == 'posix':
+        return _enumerate_cups()
+    return _enumerate_windows()
+
+
+class PrinterRegistry:
+    """프린터 목록을 메모리에 보관하고 백그라운드에서 TTL마다 갱신"""
+
+    def __init__(self, ttl=DEFAULT_PRINTER_TTL, enumerate_func=None):
+        self.ttl = ttl
+        self._enumerate = enumerate_func or enumerate_printers
+        self._printers = []
+        self._refreshed_at = None
+        self._error = None
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """백그라운드 갱신 스레드 시작 (아직 조회 전이면 즉시 조회)"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="printer-registry", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            # 최근에 조회했으면(시작 시 GUI 조회, 강제 갱신 등) 남은 시간만큼 대기
+            age = self.age_seconds()
+            if age is None or age >= self.ttl:
+                self.refresh()
+                age = 0
+            self._stop_event.wait(self.ttl - age)
+
+    def refresh(self):
+        """프린터 목록 즉시 다시 조회 (동시에 여러 번 호출되면 한 번만 조회)"""
+        if not self._refresh_lock.acquire(blocking=False):
+            # 다른 스레드가 조회 중이면 그 결과를 기다림
+            with self._refresh_lock:
+                return self.get_printers()
+        try:
+            try:
+                printers = self._enumerate()
+                error = None
+            except Exception as e:
+                logger.error(f"프린터 목록 조회 실패: {e}")
+                printers, error = None, str(e)
+
+            with self._lock:
+                changed = printers is not None and printers != self._printers
+                if printers is not None:
+                    self._printers = printers
+                self._refreshed_at = datetime.now()
+                self._error = error
+                listeners = list(self._listeners)
+                result = list(self._printers)
+        finally:
+            self._refresh_lock.release()
+
+        if changed:
+            print(f"프린터 목록 갱신: {[p['name'] for p in result]}")
+            for listener in listeners:
+                try:
+                    listener(result)
+                except Exception as e:
+                    logger.error(f"프린터 목록 갱신 콜백 오류: {e}")
+        return result
+
+    def get_printers(self, refresh=False):
+        """메모리의 프린터 목록 (아직 조회 전이거나 refresh=True이면 조회)"""
+        with self._lock:
+            loaded = self._refreshed_at is not None
+            printers = list(self._printers)
+        if refresh or not loaded:
+            return self.refresh()
+        return printers
+
+    def age_seconds(self):
+        """마지막 조회 후 경과 시간 (조회 전이면 None)"""
+        with self._lock:
+            if self._refreshed_at is None:
+                return None
+            return (datetime.now() - self._refreshed_at).total_seconds()
+
+    def add_listener(self, callback):
+        """목록이 바뀌면 호출될 콜백 등록 (백그라운드 스레드에서 호출됨)"""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def snapshot(self, refresh=False):
+        """API 응답용 - 프린터 목록과 조회 시각/경과 시간"""
+        printers = self.get_printers(refresh=refresh)
+        with self._lock:
+            refreshed_at = self._refreshed_at
+            error = self._error
+        age = self.age_seconds()
+        return {
+            'printers': printers,
+            'refreshed_at': refreshed_at.isoformat() if refreshed_at else None,
+            'age_seconds': round(age, 1) if age is not None else None,
+            'ttl_seconds': self.ttl,
+            'error': error,
+        }
+
+
+# 프로세스 전체에서 공유하는 프린터 레지스트리
+printer_registry = PrinterRegistry()
@@ -0,0 +1,521 @@
+"""
+생산 시트(Daily Bulk Production Sheet) 기록 저장소 (SQLite)
+
+production_records.json 전체를 매번 다시 쓰는 대신 시트 1개 = sheets 1행,
+production_table 한 줄 = sheet_rows 1행으로 저장하고, 자동 저장 시 바뀐 행만 씁니다.
+처음 실행할 때 기존 JSON 파일이 있으면 자동으로 가져옵니다.
+"""
+
+import os
+import copy
+import json
+import time
+import sqlite3
+import threading
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = "production_records.db"
+LEGACY_JSON_PATH = "production_records.json"
+
+# production_table 한 줄의 컬럼 (순서 고정)
+ROW_FIELDS = (
+    'bulk_plastic_bag_lot_codes',
+    'bulk_bag_qty',
+    'pallet_num',
+    'total_kg',
+    'notes',
+    'initial',
+)
+
+# 기록 dict에서 sheets 테이블 컬럼으로 따로 저장하는 키 (나머지는 fields JSON)
+SHEET_COLUMNS = ('date', 'shift', 'product_name', 'timestamp')
+
+# 기록 dict에 붙는 저장소 ID 키
+RECORD_ID_KEY = 'id'
+
+# 연속된 저장 요청을 모으는 시간 (초)
+DEFAULT_COALESCE_DELAY = 0.5
+# 저장 실패 시 다시 시도하기까지의 대기 시간 (초) - 실패할 때마다 두 배, 최대 MAX_RETRY_DELAY
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 30.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sheets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL DEFAULT '',
+    shift TEXT NOT NULL DEFAULT '',
+    product_name TEXT NOT NULL DEFAULT '',
+    timestamp TEXT NOT NULL DEFAULT '',
+    fields TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_sheets_date_shift ON sheets(date, shift);
+CREATE TABLE IF NOT EXISTS sheet_rows (
+    sheet_id INTEGER NOT NULL REFERENCES sheets(id) ON DELETE CASCADE,
+    row_index INTEGER NOT NULL,
+    bulk_plastic_bag_lot_codes TEXT NOT NULL DEFAULT '',
+    bulk_bag_qty TEXT NOT NULL DEFAULT '',
+    pallet_num TEXT NOT NULL DEFAULT '',
+    total_kg TEXT NOT NULL DEFAULT '',
+    notes TEXT NOT NULL DEFAULT '',
+    initial TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (sheet_id, row_index)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _sheet_values(record):
+    """기록 dict -> sheets 행 값 (date, shift, product_name, timestamp, fields)"""
+    fields = {key: value for key, value in record.items()
+              if key not in SHEET_COLUMNS and key not in ('production_table', RECORD_ID_KEY)}
+    return tuple(str(record.get(key) or '') for key in SHEET_COLUMNS) + \
+        (json.dumps(fields, ensure_ascii=False, sort_keys=True),)
+
+
+def _row_values(row):
+    """production_table 한 줄 -> sheet_rows 값 튜플"""
+    return tuple(str(row.get(key) or '') for key in ROW_FIELDS)
+
+
+class ProductionStore:
+    """생산 시트 기록 SQLite 저장소
+
+    마지막으로 쓴 값을 시트별로 기억해서, 저장 시 헤더/행이 바뀐 경우에만 씁니다.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, legacy_json_path=LEGACY_JSON_PATH):
+        self.db_path = db_path
+        self.legacy_json_path = legacy_json_path
+        self._lock = threading.Lock()
+        # sheet_id -> (sheet 값 튜플, [행 값 튜플, ...]) - 마지막으로 저장한 상태
+        self._written = {}
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(SCHEMA)
+        self._import_legacy_json()
+
+    def _import_legacy_json(self):
+        """처음 실행 시 기존 production_records.json 가져오기 (한 번만)"""
+        with self._lock:
+            done = self._conn.execute("SELECT value FROM meta WHERE key = 'json_imported'").fetchone()
+        if done or not self.legacy_json_path or not os.path.exists(self.legacy_json_path):
+            return
+        try:
+            with open(self.legacy_json_path, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+        except Exception as e:
+            logger.error(f"기존 양식 JSON 가져오기 실패: {e}")
+            return
+
+        with self._lock:
+            staged = {}
+            with self._conn:
+                for record in records:
+                    self._insert(record, staged)
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported', ?)",
+                                   (self.legacy_json_path,))
+            self._commit_written(staged)
+        print(f"기존 양식 데이터 가져오기 완료: {len(records)}개 기록 ({self.legacy_json_path} -> {self.db_path})")
+
+    def load_all(self):
+        """모든 기록을 저장 순서대로 dict 목록으로 로드 (각 기록에 'id' 포함)"""
+        with self._lock:
+            sheets = self._conn.execute(
+                "SELECT id, date, shift, product_name, timestamp, fields FROM sheets ORDER BY id"
+            ).fetchall()
+            rows = self._conn.execute(
+                f"SELECT sheet_id, {', '.join(ROW_FIELDS)} FROM sheet_rows ORDER BY sheet_id, row_index"
+            ).fetchall()
+
+            table_by_sheet = {}
+            for row in rows:
+                table_by_sheet.setdefault(row[0], []).append(tuple(row[1:]))
+
+            records = []
+            for sheet_id, date, shift, product_name, timestamp, fields in sheets:
+                record = json.loads(fields or '{}')
+                record.update({'date': date, 'shift': shift,
+                               'product_name': product_name, 'timestamp': timestamp})
+                table = table_by_sheet.get(sheet_id, [])
+                record['production_table'] = [dict(zip(ROW_FIELDS, values)) for values in table]
+                record[RECORD_ID_KEY] = sheet_id
+                self._written[sheet_id] = ((date, shift, product_name, timestamp, fields), list(table))
+                records.append(record)
+        return records
+
+    def save(self, record):
+        """기록 저장 (id가 있으면 바뀐 부분만 갱신, 없으면 추가) - 기록의 id 반환"""
+        return self.apply([('save', record)])[0]
+
+    def delete(self, sheet_id):
+        """기록 삭제 (production_table 행도 함께 삭제)"""
+        if sheet_id is None:
+            return
+        self.apply([('delete', sheet_id)])
+
+    def apply(self, operations):
+        """여러 저장/삭제를 트랜잭션 하나로 처리
+
+        마지막으로 쓴 상태(_written)는 트랜잭션이 커밋된 뒤에만 갱신합니다.
+        중간에 실패해서 롤백되면 캐시도 그대로라 다음 저장에서 같은 행을 다시 씁니다.
+
+        Args:
+            operations: [('save', record) 또는 ('delete', sheet_id), ...]
+
+        Returns:
+            각 작업의 결과 목록 (save는 기록 id, delete는 None)
+        """
+        results = []
+        with self._lock:
+            # 이번 트랜잭션에서 쓴 상태 (sheet_id -> 값, 삭제는 None)
+            staged = {}
+            with self._conn:
+                for op, target in operations:
+                    if op == 'save':
+                        sheet_id = target.get(RECORD_ID_KEY)
+                        if sheet_id is None or self._cached(sheet_id, staged) is None:
+                            sheet_id = self._insert(target, staged)
+                        else:
+                            self._update(sheet_id, target, staged)
+                        results.append(sheet_id)
+                    else:
+                        if target is not None:
+                            self._conn.execute("DELETE FROM sheets WHERE id = ?", (target,))
+                            staged[target] = None
+                        results.append(None)
+            self._commit_written(staged)
+        for (op, target), sheet_id in zip(operations, results):
+            if op == 'save':
+                target[RECORD_ID_KEY] = sheet_id
+        return results
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sheets").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _cached(self, sheet_id, staged):
+        """마지막으로 쓴 상태 (이번 트랜잭션에서 쓴 값 우선, 없거나 삭제되었으면 None)"""
+        if sheet_id in staged:
+            return staged[sheet_id]
+        return self._written.get(sheet_id)
+
+    def _commit_written(self, staged):
+        """커밋된 트랜잭션의 상태를 캐시에 반영"""
+        for sheet_id, written in staged.items():
+            if written is None:
+                self._written.pop(sheet_id, None)
+            else:
+                self._written[sheet_id] = written
+
+    def _insert(self, record, staged):
+        sheet_values = _sheet_values(record)
+        cursor = self._conn.execute(
+            "INSERT INTO sheets (date, shift, product_name, timestamp, fields) VALUES (?, ?, ?, ?, ?)",
+            sheet_values
+        )
+        sheet_id = cursor.lastrowid
+        table = [_row_values(row) for row in record.get('production_table') or []]
+        self._conn.executemany(
+            f"INSERT INTO sheet_rows (sheet_id, row_index, {', '.join(ROW_FIELDS)}) "
+            f"VALUES (?, ?, {', '.join('?' for _ in ROW_FIELDS)})",
+            [(sheet_id, index) + values for index, values in enumerate(table)]
+        )
+        staged[sheet_id] = (sheet_values, table)
+        return sheet_id
+
+    def _update(self, sheet_id, record, staged):
+        old_sheet, old_table = self._cached(sheet_id, staged)
+        sheet_values = _sheet_values(record)
+        table = [_row_values(row) for row in record.get('production_table') or []]
+
+        if sheet_values != old_sheet:
+            self._conn.execute(
+                "UPDATE sheets SET date = ?, shift = ?, product_name = ?, timestamp = ?, fields = ? WHERE id = ?",
+                sheet_values + (sheet_id,)
+            )
+
+        # 바뀐 행만 쓰기 (행 수가 줄었으면 남는 행 삭제)
+        changed_rows = [(sheet_id, index) + values for index, values in enumerate(table)
+                        if index >= len(old_table) or old_table[index] != values]
+        if changed_rows:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO sheet_rows (sheet_id, row_index, {', '.join(ROW_FIELDS)}) "
+                f"VALUES (?, ?, {', '.join('?' for _ in ROW_FIELDS)})",
+                changed_rows
+            )
+        if len(table) < len(old_table):
+            self._conn.execute("DELETE FROM sheet_rows WHERE sheet_id = ? AND row_index >= ?",
+                               (sheet_id, len(table)))
+
+        staged[sheet_id] = (sheet_values, table)
+        return len(changed_rows)
+
+
+def record_key(record):
+    """기록 색인 키 (date, shift, product_name)"""
+    return (record.get('date') or '', record.get('shift') or '', record.get('product_name') or '')
+
+
+class ProductionRecordIndex:
+    """생산 시트 기록 목록 + (date, shift, product) 색인
+
+    목록 순서(저장 순서)는 그대로 유지하고, 저장/불러오기/삭제 시 기록을 찾을 때는
+    색인을 사용하므로 기록이 쌓여도 upsert 비용이 늘지 않습니다.
+    """
+
+    def __init__(self, records=None):
+        self.records = []
+        self._by_key = {}
+        # (date, shift) -> 해당 날짜/교대의 기록 목록 (보통 1개)
+        self._by_date_shift = {}
+        for record in records or []:
+            self.add(record)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+    def _index(self, record):
+        key = record_key(record)
+        self._by_key[key] = record
+        self._by_date_shift.setdefault(key[:2], []).append(record)
+
+    def _unindex(self, record, key=None):
+        key = key or record_key(record)
+        if self._by_key.get(key) is record:
+            del self._by_key[key]
+            # 같은 키의 다른 기록이 남아 있으면 그 기록으로 대체
+            for other in reversed(self._by_date_shift.get(key[:2], [])):
+                if other is not record and record_key(other) == key:
+                    self._by_key[key] = other
+                    break
+        same_shift = self._by_date_shift.get(key[:2], [])
+        for i, other in enumerate(same_shift):
+            if other is record:
+                same_shift.pop(i)
+                break
+        if not same_shift:
+            self._by_date_shift.pop(key[:2], None)
+
+    def add(self, record):
+        """새 기록 추가"""
+        self.records.append(record)
+        self._index(record)
+        return record
+
+    def find(self, date, shift, product_name=None):
+        """기록 찾기 - (date, shift, product) 정확히 일치하는 기록,
+        없으면 같은 date/shift의 가장 최근 기록 (없으면 None)"""
+        if product_name is not None:
+            record = self._by_key.get((date or '', shift or '', product_name or ''))
+            if record is not None:
+                return record
+        same_shift = self._by_date_shift.get((date or '', shift or ''))
+        return same_shift[-1] if same_shift else None
+
+    def upsert(self, record):
+        """같은 date/shift(/product) 기록이 있으면 그 기록을 갱신, 없으면 추가
+
+        Returns:
+            (저장된 기록 dict, 새로 추가되었는지 여부)
+        """
+        existing = self.find(record.get('date'), record.get('shift'), record.get('product_name'))
+        if existing is None:
+            return self.add(record), True
+
+        old_key = record_key(existing)
+        record_id = existing.get(RECORD_ID_KEY)
+        existing.update(record)
+        if record_id is not None:
+            existing[RECORD_ID_KEY] = record_id
+        if record_key(existing) != old_key:
+            self._unindex(existing, old_key)
+            self._index(existing)
+        return existing, False
+
+    def remove(self, record):
+        """기록 삭제"""
+        self._unindex(record)
+        for i, other in enumerate(self.records):
+            if other is record:
+                self.records.pop(i)
+                break
+
+
+class ProductionWriter:
+    """생산 시트 기록을 백그라운드 스레드에서 저장하는 작업자
+
+    GUI 스레드는 기록 스냅샷만 넘기고 바로 돌아갑니다. 짧은 시간 안에 같은 기록이
+    여러 번 저장되면 마지막 스냅샷 하나로 합치고, 모인 작업은 트랜잭션 하나로 씁니다.
+    저장에 실패한 작업은 대기열에 되돌려 점점 긴 간격으로 다시 시도합니다
+    (그 사이 같은 기록의 새 스냅샷이 들어왔으면 새 스냅샷을 씀).
+    """
+
+    def __init__(self, store, coalesce_delay=DEFAULT_COALESCE_DELAY):
+        self.store = store
+        self.coalesce_delay = coalesce_delay
+        self.last_error = None
+        # 연속 실패 횟수와 다음 재시도 시각 (monotonic)
+        self.failures = 0
+        self._retry_at = None
+        # 기록 객체 id -> (작업, 원본 기록, 스냅샷)
+        self._pending = OrderedDict()
+        self._in_flight = 0
+        # 쓰는 중인 배치의 기록 (종료 시 저장되지 않은 기록 확인용)
+        self._in_flight_records = []
+        self._flush_requested = False
+        self._running = True
+        self._listeners = []
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="production-writer", daemon=True)
+        self._thread.start()
+
+    def save(self, record):
+        """기록 저장 요청 (현재 내용의 스냅샷을 저장)"""
+        snapshot = copy.deepcopy(record)
+        with self._cond:
+            key = id(record)
+            self._pending.pop(key, None)
+            self._pending[key] = ('save', record, snapshot)
+            self._cond.notify_all()
+        self._notify_listeners()
+
+    def delete(self, record):
+        """기록 삭제 요청 (대기 중인 저장은 취소)"""
+        with self._cond:
+            key = id(record)
+            self._pending.pop(key, None)
+            self._pending[key] = ('delete', record, None)
+            self._cond.notify_all()
+        self._notify_listeners()
+
+    def pending_count(self):
+        """아직 디스크에 쓰이지 않은 작업 수"""
+        with self._cond:
+            return len(self._pending) + self._in_flight
+
+    def pending_keys(self):
+        """아직 디스크에 쓰이지 않은 기록의 (date, shift, product_name) 목록"""
+        with self._cond:
+            records = self._in_flight_records + [record for _, record, _ in self._pending.values()]
+        return [record_key(record) for record in records]
+
+    def add_listener(self, callback):
+        """대기 작업 수가 바뀌면 호출될 콜백 등록 (pending_count 인자, 작업자 스레드에서도 호출됨)"""
+        self._listeners.append(callback)
+
+    def flush(self, timeout=None):
+        """대기 중인 작업을 모두 쓸 때까지 대기 (완료되면 True)"""
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            done = self._cond.wait_for(lambda: not self._pending and not self._in_flight, timeout)
+            self._flush_requested = False
+        return done
+
+    def stop(self, timeout=None):
+        """남은 작업을 쓰고 작업자 종료"""
+        done = self.flush(timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return done
+
+    def _notify_listeners(self):
+        count = self.pending_count()
+        for listener in self._listeners:
+            try:
+                listener(count)
+            except Exception as e:
+                logger.error(f"저장 대기 상태 콜백 오류: {e}")
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or not self._running)
+                if not self._pending:
+                    break
+                # 연속 입력을 모으기 위해 잠깐 대기 (flush 요청 시 바로 쓰기)
+                # 앞선 저장이 실패했으면 재시도 시각까지 대기 (종료 중이면 바로 마지막 시도)
+                deadline = time.monotonic() + self.coalesce_delay
+                if self._retry_at is not None:
+                    deadline = max(deadline, self._retry_at)
+                while self._running and (not self._flush_requested or self._retry_at is not None):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = list(self._pending.items())
+                self._pending.clear()
+                self._in_flight = len(batch)
+                self._in_flight_records = [record for _, (_, record, _) in batch]
+
+            # 저장소 ID는 실행 시점에 확인 (앞선 배치에서 새로 추가된 기록의 중복 삽입 방지)
+            operations = []
+            for _, (op, record, snapshot) in batch:
+                if op == 'save':
+                    snapshot[RECORD_ID_KEY] = record.get(RECORD_ID_KEY)
+                    operations.append(('save', snapshot))
+                else:
+                    operations.append(('delete', record.get(RECORD_ID_KEY)))
+
+            try:
+                results = self.store.apply(operations)
+            except Exception as e:
+                stopping = self._requeue(batch, e)
+                self._notify_listeners()
+                if stopping:
+                    break
+                continue
+
+            for (_, (op, record, _)), sheet_id in zip(batch, results):
+                if op == 'save':
+                    record[RECORD_ID_KEY] = sheet_id
+            print(f"양식 데이터 저장 완료: {len(batch)}건")
+            with self._cond:
+                # 실패했던 작업도 이번 배치에 포함되어 저장됨
+                self.last_error = None
+                self.failures = 0
+                self._retry_at = None
+                self._in_flight = 0
+                self._in_flight_records = []
+                self._cond.notify_all()
+            self._notify_listeners()
+
+    def _requeue(self, batch, error):
+        """실패한 배치를 대기열 앞에 되돌리고 재시도 예약 - 종료 중이면 True (더 시도하지 않음)"""
+        with self._cond:
+            self.last_error = str(error)
+            self.failures += 1
+            delay = min(RETRY_DELAY * 2 ** (self.failures - 1), MAX_RETRY_DELAY)
+            self._retry_at = time.monotonic() + delay
+            # 그 사이 같은 기록의 새 스냅샷이 들어온 작업은 새 스냅샷으로 대체
+            pending = OrderedDict((key, item) for key, item in batch if key not in self._pending)
+            pending.update(self._pending)
+            self._pending = pending
+            self._in_flight = 0
+            self._in_flight_records = []
+            stopping = not self._running
+            self._cond.notify_all()
+        if stopping:
+            logger.error(f"양식 데이터 저장 실패 - 종료 중이라 {len(pending)}건을 저장하지 못했습니다: {error}")
+        else:
+            logger.error(f"양식 데이터 저장 실패 ({self.failures}회), {delay:g}초 후 다시 시도: {error}")
+        return stopping
@@ -0,0 +1,252 @@
+"""
+Daily Bulk Production Sheet의 Production Data Table 모델
+
+GUI 표(StringVar/Entry)와 분리된 행 데이터와 자동 입력 규칙을 관리합니다.
+- Total KG가 입력된 행의 Pallet # 자동 증가 (위쪽 행들의 최대 번호 + 1)
+- 첫 번째 행의 Lot code / Bag QTY를 Total KG가 입력된 다음 행들에 복사
+- 첫 번째 빈 행(Total KG 없음)에 모바일/라벨 인쇄의 순수무게 입력
+
+행별 Pallet 번호의 구간 최대값, 첫 번째 빈 행, 복사할 값이 비어 있는 행을
+값이 바뀔 때마다 갱신해 두므로 행이 많아져도 입력 한 번에 표 전체를 다시 훑지 않습니다.
+변경된 행 번호는 작업 단위로 모아서 리스너에 한 번만 알립니다.
+
+행은 ROW_FIELDS 순서의 튜플로 보관하고 빈 행은 하나의 튜플을 공유하므로,
+마지막 행에 값이 들어갈 때마다 빈 행을 하나씩 덧붙여 표가 제한 없이 늘어납니다.
+"""
+
+import logging
+from contextlib import contextmanager
+
+from production_store import ROW_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# 기본 행 수 (양식 한 장 분량)
+DEFAULT_ROW_COUNT = 15
+
+# 첫 번째 행에서 다음 행들로 복사하는 컬럼
+COPY_FIELDS = ('bulk_plastic_bag_lot_codes', 'bulk_bag_qty')
+
+_FIELD_INDEX = {key: col for col, key in enumerate(ROW_FIELDS)}
+_TOTAL_KG = _FIELD_INDEX['total_kg']
+_PALLET_NUM = _FIELD_INDEX['pallet_num']
+# 모든 빈 행이 공유하는 값
+_EMPTY_ROW = ('',) * len(ROW_FIELDS)
+
+
+def parse_pallet_num(value):
+    """Pallet # 문자열을 숫자로 (숫자가 아니면 None)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _PrefixMax:
+    """행 번호별 숫자의 앞부분 최대값 (세그먼트 트리, 갱신/조회 O(log n))"""
+
+    def __init__(self, size=DEFAULT_ROW_COUNT):
+        self._size = 1
+        while self._size < size:
+            self._size *= 2
+        self._tree = [0] * (2 * self._size)
+
+    def update(self, index, value):
+        if index >= self._size:
+            self._grow(index + 1)
+        pos = index + self._size
+        self._tree[pos] = value
+        pos //= 2
+        while pos:
+            self._tree[pos] = max(self._tree[2 * pos], self._tree[2 * pos + 1])
+            pos //= 2
+
+    def prefix_max(self, end):
+        """0 ~ end-1 번 행의 최대값 (없으면 0)"""
+        result = 0
+        lo = self._size
+        hi = min(end, self._size) + self._size
+        while lo < hi:
+            if lo & 1:
+                result = max(result, self._tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                result = max(result, self._tree[hi])
+            lo //= 2
+            hi //= 2
+        return result
+
+    def total(self):
+        return self._tree[1]
+
+    def _grow(self, size):
+        leaves = self._tree[self._size:]
+        while self._size < size:
+            self._size *= 2
+        self._tree = [0] * self._size + leaves + [0] * (self._size - len(leaves))
+        for pos in range(self._size - 1, 0, -1):
+            self._tree[pos] = max(self._tree[2 * pos], self._tree[2 * pos + 1])
+
+
+class ProductionTableModel:
+    """Production Data Table 행 데이터 + 자동 입력 규칙"""
+
+    def __init__(self, row_count=DEFAULT_ROW_COUNT):
+        # 행마다 ROW_FIELDS 순서의 문자열 튜플 (빈 행은 _EMPTY_ROW 공유)
+        self._min_rows = max(1, row_count)
+        self._rows = [_EMPTY_ROW] * self._min_rows
+        # 행별 Pallet 번호 (숫자가 아니거나 비어 있으면 0) - 위쪽 행들의 최대값 조회용
+        self._pallets = _PrefixMax(self._min_rows)
+        # Total KG가 비어 있는 첫 행 (이 행보다 앞의 행은 모두 입력됨)
+        self._first_empty = 0
+        # 컬럼별로 Total KG는 있는데 그 컬럼이 비어 있는 행 (첫 행 제외)
+        self._missing = {key: set() for key in COPY_FIELDS}
+        self._listeners = []
+        self._dirty = set()
+        self._batch_depth = 0
+
+    def __len__(self):
+        return len(self._rows)
+
+    @property
+    def max_pallet(self):
+        """표 전체에서 가장 큰 Pallet 번호"""
+        return self._pallets.total()
+
+    def add_listener(self, callback):
+        """값이 바뀐 행 번호 집합을 받을 콜백 등록 - callback(indices)"""
+        self._listeners.append(callback)
+
+    @contextmanager
+    def batch(self):
+        """여러 변경을 묶어 마지막에 한 번만 알림"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush()
+
+    def _flush(self):
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        for callback in list(self._listeners):
+            try:
+                callback(dirty)
+            except Exception as e:
+                logger.warning(f"표 변경 알림 실패: {e}")
+
+    # ----- 조회 -----
+
+    def get(self, index, key):
+        return self._rows[index][_FIELD_INDEX[key]]
+
+    def row(self, index):
+        """행 하나를 dict로"""
+        return dict(zip(ROW_FIELDS, self._rows[index]))
+
+    def rows(self):
+        """모든 행 (빈 행 포함) - 자동 저장용"""
+        return [dict(zip(ROW_FIELDS, values)) for values in self._rows]
+
+    def filled_rows(self):
+        """값이 하나라도 있는 행 - 인쇄/미리보기용"""
+        return [dict(zip(ROW_FIELDS, values)) for values in self._rows if values is not _EMPTY_ROW]
+
+    def first_empty_row(self):
+        """Total KG가 비어 있는 첫 행 번호"""
+        return self._first_empty
+
+    # ----- 변경 -----
+
+    def set(self, index, key, value):
+        """사용자 입력 한 칸 반영 + 자동 입력 규칙 적용"""
+        with self.batch():
+            if not self._assign(index, key, value):
+                return
+            if key == 'total_kg':
+                self._auto_fill_row(index)
+            elif key in COPY_FIELDS and index == 0 and value:
+                # 첫 행 값을 Total KG가 있고 그 칸이 빈 행들에 복사
+                for row_idx in sorted(self._missing[key]):
+                    self._assign(row_idx, key, value)
+
+    def fill_next_total_kg(self, net_weight):
+        """첫 번째 빈 행에 Total KG 입력 (입력한 행 번호, 값이 없으면 None)"""
+        if not net_weight:
+            return None
+        index = self.first_empty_row()
+        self.set(index, 'total_kg', net_weight)
+        return index
+
+    def clear(self):
+        """모든 행 비우기 (늘어난 행은 처음 행 수로 되돌림)"""
+        with self.batch():
+            for index, values in enumerate(self._rows):
+                if values is not _EMPTY_ROW:
+                    self._dirty.add(index)
+            self._rows = [_EMPTY_ROW] * self._min_rows
+            self._pallets = _PrefixMax(self._min_rows)
+            self._first_empty = 0
+            for indices in self._missing.values():
+                indices.clear()
+
+    def _auto_fill_row(self, index):
+        """Total KG가 입력된 행의 Pallet # 자동 증가, 첫 행의 Lot code/Bag QTY 복사"""
+        values = self._rows[index]
+        if not values[_TOTAL_KG] or values[_PALLET_NUM]:
+            return
+        # 이 행보다 위쪽 행들의 최대 번호 + 1 (아래쪽 행 번호와는 무관)
+        self._assign(index, 'pallet_num', f"{self._pallets.prefix_max(index) + 1:03d}")
+        if index == 0:
+            return
+        first_row = self._rows[0]
+        for key in COPY_FIELDS:
+            col = _FIELD_INDEX[key]
+            if not values[col] and first_row[col]:
+                self._assign(index, key, first_row[col])
+
+    def _assign(self, index, key, value):
+        """값 저장 + 색인 갱신 (규칙은 적용하지 않음) - 값이 바뀌었으면 True"""
+        value = '' if value is None else str(value)
+        col = _FIELD_INDEX[key]
+        old = self._rows[index][col]
+        if old == value:
+            return False
+        values = list(self._rows[index])
+        values[col] = value
+        self._rows[index] = tuple(values) if any(values) else _EMPTY_ROW
+        self._dirty.add(index)
+        if value and index == len(self._rows) - 1:
+            # 마지막 행이 채워지면 빈 행 하나 추가 (다음 입력/모바일 인쇄용)
+            self._rows.append(_EMPTY_ROW)
+            self._dirty.add(index + 1)
+
+        if key == 'pallet_num':
+            self._pallets.update(index, parse_pallet_num(value) or 0)
+        elif key == 'total_kg':
+            self._update_first_empty(index, value)
+        if index > 0 and (key == 'total_kg' or key in COPY_FIELDS):
+            self._update_missing(index)
+        return True
+
+    def _update_first_empty(self, index, value):
+        if not value:
+            self._first_empty = min(self._first_empty, index)
+        elif index == self._first_empty:
+            # 다음 빈 행까지 이동 (행마다 한 번씩만 지나가므로 전체 비용은 행 수에 비례)
+            next_empty = index + 1
+            while self._rows[next_empty][_TOTAL_KG]:
+                next_empty += 1
+            self._first_empty = next_empty
+
+    def _update_missing(self, index):
+        values = self._rows[index]
+        for key in COPY_FIELDS:
+            if values[_TOTAL_KG] and not values[_FIELD_INDEX[key]]:
+                self._missing[key].add(index)
+            else:
+                self._missing[key].discard(index)
@@ -0,0 +1,258 @@
+"""
+인쇄 스풀 백엔드
+
+문서를 지정된 프린터의 스풀러로 바로 보냅니다.
+시스템 기본 프린터를 바꾸거나 고정 시간만큼 대기하지 않습니다.
+테스트에서는 FileSinkBackend로 실제 프린터를 대신할 수 있습니다.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# lp 명령이 이 시간(초) 안에 끝나지 않으면 인쇄 실패로 처리
+SPOOL_TIMEOUT = 30
+
+# printto 후 스풀러에 작업이 나타날 때까지 기다리는 시간(초)과 확인 간격
+JOB_APPEAR_TIMEOUT = 20
+JOB_POLL_INTERVAL = 0.25
+
+
+class SpoolBackend:
+    """스풀 백엔드 기본 인터페이스"""
+
+    name = 'base'
+
+    def list_printers(self):
+        """백엔드가 볼 수 있는 프린터 이름 목록"""
+        return []
+
+    def default_printer(self):
+        """시스템 기본 프린터 이름 (알 수 없으면 None)"""
+        return None
+
+    def resolve_printer(self, printer_name):
+        """요청된 프린터 이름을 실제 설치된 프린터 이름으로 변환
+
+        정확히 일치하는 프린터가 없으면 이름이 포함된 프린터를 찾고,
+        그것도 없으면 None(기본 프린터)을 반환합니다.
+        """
+        if not printer_name:
+            return None
+        printers = self.list_printers()
+        if not printers or printer_name in printers:
+            return printer_name
+        similar = [p for p in printers
+                   if printer_name.lower() in p.lower() or p.lower() in printer_name.lower()]
+        if similar:
+            print(f"프린터 '{printer_name}' 대신 비슷한 프린터 '{similar[0]}' 사용")
+            return similar[0]
+        print(f"❌ 프린터 '{printer_name}'를 찾을 수 없습니다. 기본 프린터로 인쇄합니다.")
+        return None
+
+    def spool_file(self, path, printer_name=None, copies=1, doc_name=None):
+        """파일(PDF 등)을 프린터 스풀러로 전송 - 성공 시 True"""
+        raise NotImplementedError
+
+
+class CupsSpoolBackend(SpoolBackend):
+    """CUPS lp 명령으로 인쇄 (Linux/macOS)"""
+
+    name = 'cups'
+
+    def list_printers(self):
+        try:
+            result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            return []
+        if result.returncode != 0:
+            return []
+        return [line.split()[1] for line in result.stdout.split('\n')
+                if line.startswith('printer') and len(line.split()) >= 2]
+
+    def default_printer(self):
+        try:
+            result = subprocess.run(['lpstat', '-d'], capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            return None
+        # "system default destination: NAME" (기본 프린터가 없으면 "no system default destination")
+        line = result.stdout.strip()
+        if result.returncode != 0 or ':' not in line:
+            return None
+        return line.split(':', 1)[1].strip() or None
+
+    def spool_file(self, path, printer_name=None, copies=1, doc_name=None):
+        cmd = ['lp']
+        if printer_name:
+            cmd.extend(['-d', printer_name])
+        if copies > 1:
+            cmd.extend(['-n', str(copies)])
+        if doc_name:
+            cmd.extend(['-t', doc_name])
+        cmd.append(path)
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=SPOOL_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            logger.error(f"CUPS 인쇄 실패: lp가 {SPOOL_TIMEOUT}초 안에 끝나지 않았습니다 ({path})")
+            return False
+        except OSError as e:
+            logger.error(f"CUPS 인쇄 실패: lp 실행 불가 - {e}")
+            return False
+        if result.returncode == 0:
+            logger.info(f"CUPS 인쇄 요청 성공: {path} -> {printer_name or '기본 프린터'} (copies={copies})")
+            return True
+        logger.error(f"CUPS 인쇄 실패: {result.stderr}")
+        return False
+
+
+class Win32SpoolBackend(SpoolBackend):
+    """Windows 스풀러로 지정 프린터에 직접 인쇄
+
+    ShellExecute의 "printto" 동사로 PDF 처리기에 프린터 이름을 넘기므로
+    시스템 기본 프린터를 변경하지 않습니다. printto는 결과를 알려주지 않으므로
+    스풀러에 새 작업이 copies개 나타나는지 확인하고, 나타나지 않으면 실패로 처리합니다.
+    raw=True이면 PDF를 RAW 데이터로 스풀러에 바로 씁니다 (PDF 직접 인쇄 지원 프린터용).
+    """
+
+    name = 'win32'
+
+    def __init__(self, raw=False):
+        self.raw = raw
+
+    def list_printers(self):
+        try:
+            import win32print
+        except ImportError:
+            return []
+        printers = win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS)
+        return [printer[2] for printer in printers if printer[2]]
+
+    def default_printer(self):
+        try:
+            import win32print
+            return win32print.GetDefaultPrinter() or None
+        except Exception:
+            return None
+
+    def spool_file(self, path, printer_name=None, copies=1, doc_name=None):
+        import win32print
+        import win32api
+
+        target = printer_name or win32print.GetDefaultPrinter()
+        doc_name = doc_name or os.path.basename(path)
+
+        if self.raw:
+            with open(path, 'rb') as f:
+                payload = f.read()
+            handle = win32print.OpenPrinter(target)
+            try:
+                for _ in range(max(1, copies)):
+                    win32print.StartDocPrinter(handle, 1, (doc_name, None, "RAW"))
+                    try:
+                        win32print.StartPagePrinter(handle)
+                        win32print.WritePrinter(handle, payload)
+                        win32print.EndPagePrinter(handle)
+                    finally:
+                        win32print.EndDocPrinter(handle)
+            finally:
+                win32print.ClosePrinter(handle)
+        else:
+            known_jobs = self._job_ids(target)
+            for _ in range(max(1, copies)):
+                # 반환값이 32 이하이면 실패 (ShellExecute 규약) - 예외로 전달됨
+                win32api.ShellExecute(0, "printto", path, f'"{target}"', ".", 0)
+            if not self._wait_for_jobs(target, known_jobs, max(1, copies)):
+                logger.error(f"Windows 스풀러에 작업이 나타나지 않았습니다: {path} -> {target} "
+                             f"({JOB_APPEAR_TIMEOUT}초 대기, PDF 처리기 확인 필요)")
+                return False
+
+        logger.info(f"Windows 스풀러로 전송: {path} -> {target} (copies={copies})")
+        return True
+
+    @staticmethod
+    def _job_ids(printer_name):
+        """프린터 대기열에 있는 작업 ID 집합"""
+        import win32print
+
+        handle = win32print.OpenPrinter(printer_name)
+        try:
+            return {job['JobId'] for job in win32print.EnumJobs(handle, 0, -1, 1)}
+        finally:
+            win32print.ClosePrinter(handle)
+
+    def _wait_for_jobs(self, printer_name, known_jobs, count):
+        """printto 뒤에 새 작업이 count개 보일 때까지 대기 - 시간 안에 보이면 True
+
+        작업이 금방 끝나 대기열에서 사라질 수 있으므로 한 번이라도 보인 새 작업을 모두 셉니다.
+        """
+        seen = set()
+        deadline = time.monotonic() + JOB_APPEAR_TIMEOUT
+        while True:
+            seen |= self._job_ids(printer_name) - known_jobs
+            if len(seen) >= count:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(JOB_POLL_INTERVAL)
+
+
+class FileSinkBackend(SpoolBackend):
+    """프린터 대신 디렉터리에 파일을 쌓는 백엔드 (테스트/점검용)"""
+
+    name = 'file'
+
+    def __init__(self, directory, printers=None):
+        self.directory = directory
+        self.printers = list(printers or [])
+        self.jobs = []
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def list_printers(self):
+        return list(self.printers)
+
+    def default_printer(self):
+        return self.printers[0] if self.printers else None
+
+    def spool_file(self, path, printer_name=None, copies=1, doc_name=None):
+        safe_printer = re.sub(r'[^\w.-]+', '_', printer_name or 'default')
+        extension = os.path.splitext(path)[1]
+        with self._lock:
+            job_no = len(self.jobs) + 1
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            sink_path = os.path.join(self.directory, f"{safe_printer}_{stamp}_{job_no:04d}{extension}")
+            shutil.copyfile(path, sink_path)
+            self.jobs.append({
+                'printer': printer_name,
+                'copies': copies,
+                'doc_name': doc_name,
+                'path': sink_path,
+            })
+        return True
+
+
+def create_spool_backend(kind=None, sink_dir=None):
+    """플랫폼 또는 설정값에 맞는 스풀 백엔드 생성
+
+    Args:
+        kind: 'cups', 'win32', 'win32-raw', 'file' 중 하나 (None이면 플랫폼 기준)
+        sink_dir: kind='file'일 때 파일을 저장할 디렉터리
+    """
+    if kind is None:
+        kind = 'cups' if os.name == 'posix' else 'win32'
+    if kind == 'cups':
+        return CupsSpoolBackend()
+    if kind == 'win32':
+        return Win32SpoolBackend()
+    if kind == 'win32-raw':
+        return Win32SpoolBackend(raw=True)
+    if kind == 'file':
+        return FileSinkBackend(sink_dir or os.path.join(os.getcwd(), 'spool_sink'))
+    raise ValueError(f"알 수 없는 스풀 백엔드: {kind}")
@@ -0,0 +1,69 @@
+"""
+WSGI 서버 실행
+
+production 모드는 멀티스레드 WSGI 서버(waitress)로, development 모드는 Flask 개발 서버로 실행합니다.
+app.py, label_server.py, GUI 내장 서버가 모두 이 함수로 서버를 시작합니다.
+"""
+
+import logging
+
+from label_settings import DEFAULT_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+SERVER_MODE_PRODUCTION = 'production'
+SERVER_MODE_DEVELOPMENT = 'development'
+
+# 서버 기본값 (label_size.txt의 server_* 설정)
+DEFAULT_SERVER_THREADS = DEFAULT_SETTINGS['server_threads']
+DEFAULT_KEEPALIVE_TIMEOUT = DEFAULT_SETTINGS['server_keepalive']
+DEFAULT_MAX_REQUEST_BYTES = DEFAULT_SETTINGS['max_request_bytes']
+
+
+def server_options(settings):
+    """설정 dict(label_settings)에서 서버 실행 옵션 추출"""
+    return {
+        'mode': settings.get('server_mode') or DEFAULT_SETTINGS['server_mode'],
+        'threads': settings.get('server_threads') or DEFAULT_SERVER_THREADS,
+        'keepalive_timeout': settings.get('server_keepalive') or DEFAULT_KEEPALIVE_TIMEOUT,
+        'max_request_bytes': settings.get('max_request_bytes') or DEFAULT_MAX_REQUEST_BYTES,
+    }
+
+
+def serve(app, host, port, mode=SERVER_MODE_PRODUCTION, threads=DEFAULT_SERVER_THREADS,
+          keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT, max_request_bytes=DEFAULT_MAX_REQUEST_BYTES,
+          debug=False):
+    """Flask 앱 실행 (블로킹)
+
+    Args:
+        mode: 'production'(waitress) 또는 'development'(Flask 개발 서버)
+        threads: 요청 처리 스레드 수
+        keepalive_timeout: 유휴 keep-alive 연결을 닫기까지의 시간 (초)
+        max_request_bytes: 요청 본문 최대 크기 - 초과하면 413 응답
+        debug: development 모드에서 Flask 디버그 모드 사용 여부
+    """
+    # Flask 자체 제한도 같이 설정 (development 모드에서도 413 응답)
+    app.config['MAX_CONTENT_LENGTH'] = max_request_bytes
+
+    if mode == SERVER_MODE_PRODUCTION:
+        try:
+            from waitress import serve as waitress_serve
+        except ImportError:
+            logger.warning("waitress 모듈이 없어 Flask 개발 서버로 실행합니다")
+            print("⚠️ waitress 모듈이 없습니다. pip install waitress로 설치해주세요. 개발 서버로 실행합니다.")
+        else:
+            print(f"WSGI 서버(waitress) 시작: {host}:{port} (스레드 {threads}, keep-alive {keepalive_timeout}초, "
+                  f"최대 요청 {max_request_bytes // 1024}KB)")
+            waitress_serve(
+                app,
+                host=host,
+                port=port,
+                threads=threads,
+                channel_timeout=keepalive_timeout,
+                max_request_body_size=max_request_bytes,
+                ident='label-printer',
+            )
+            return
+
+    print(f"Flask 개발 서버 시작: {host}:{port}")
+    app.run(host=host, port=port, debug=debug, use_reloader=False, threaded=True)